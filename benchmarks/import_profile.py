@@ -0,0 +1,116 @@
+"""
+페이지별 import 비용을 측정하는 프로파일러입니다.
+
+각 페이지를 새 파이썬 프로세스에서 `python -X importtime`으로 한 번씩 실행(Streamlit bare 모드)하고,
+Streamlit 자체를 불러온 뒤부터 페이지가 새로 불러온 모듈의 import 시간과 페이지 실행 시간을 보고합니다.
+서버에는 Streamlit이 이미 올라와 있으므로 Streamlit import 비용은 제외합니다.
+
+사용법 (저장소 루트에서):
+    python benchmarks/import_profile.py                 # 모든 페이지
+    python benchmarks/import_profile.py "pages/20_*"    # 일부 페이지
+    python benchmarks/import_profile.py --json import_profile.json
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MARKER = "--- page start ---"
+TOP_MODULES = 5
+
+
+def run_child(page):
+    """자식 프로세스: Streamlit을 먼저 불러온 뒤 페이지를 실행하고 실행 시간을 JSON으로 출력합니다."""
+    import logging
+    import runpy
+    import time
+    import warnings
+
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    logging.disable(logging.CRITICAL)
+    warnings.filterwarnings("ignore")
+    import streamlit  # noqa: F401  (서버에 이미 올라와 있는 비용이므로 측정에서 제외)
+
+    print(MARKER, file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    error = None
+    try:
+        runpy.run_path(page, run_name="__main__")
+    except BaseException as e:  # st.stop() 등도 페이지 종료로 취급
+        if type(e).__name__ not in ("StopException", "SystemExit"):
+            error = f"{type(e).__name__}: {e}"
+    print(json.dumps({"run_seconds": time.perf_counter() - start, "error": error}))
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력에서 페이지 실행 중 새로 불러온 최상위 모듈의 누적 import 시간(초)을 모읍니다."""
+    lines = stderr.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1:]
+    modules = {}
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative_us = int(cumulative)
+        except ValueError:
+            continue  # 머리글 줄
+        # 들여쓰기가 없는 줄이 페이지가 직접(또는 처음으로) 불러온 모듈
+        if not name.startswith("  "):
+            modules[name.strip()] = modules.get(name.strip(), 0) + cumulative_us / 1e6
+    return modules
+
+
+def profile_page(page):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child", page],
+        capture_output=True, text=True, cwd=ROOT,
+        env={**os.environ, "MPLBACKEND": "Agg"},
+    )
+    modules = parse_importtime(proc.stderr)
+    try:
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        result = {"run_seconds": float("nan"), "error": (proc.stderr.strip().splitlines() or ["실행 실패"])[-1]}
+    result.update({
+        "page": os.path.relpath(page, ROOT),
+        "import_seconds": sum(modules.values()),
+        "top_modules": sorted(modules.items(), key=lambda kv: kv[1], reverse=True)[:TOP_MODULES],
+    })
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="페이지별 import 비용 측정")
+    parser.add_argument("patterns", nargs="*", default=["pages/*.py"], help="페이지 경로 glob (저장소 루트 기준)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    pages = sorted({p for pattern in args.patterns for p in glob.glob(os.path.join(ROOT, pattern))})
+    results = []
+    for page in pages:
+        result = profile_page(page)
+        results.append(result)
+        top = ", ".join(f"{name} {sec * 1000:.0f}ms" for name, sec in result["top_modules"])
+        status = f"  [오류] {result['error']}" if result["error"] else ""
+        print(f"{result['import_seconds'] * 1000:8.0f}ms import {result['run_seconds'] * 1000:8.0f}ms run  "
+              f"{result['page']}{status}\n{'':22}{top}")
+
+    results.sort(key=lambda r: r["import_seconds"], reverse=True)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
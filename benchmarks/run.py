@@ -0,0 +1,272 @@
+"""
+시뮬레이션과 계산 핫스팟의 벤치마크 하네스입니다.
+
+각 페이지를 Streamlit 런타임 없이(bare 모드) 불러와 순수 계산 함수를 꺼내고,
+입력 크기별로 실행 시간(여러 번 중 최솟값), 처리량, 최대 메모리(tracemalloc)를 측정합니다.
+결과는 JSON 기록 파일에 한 번의 실행 단위로 덧붙이며, 직전 기록보다 크게 느려진 항목을 알려 줍니다.
+
+사용법 (저장소 루트에서):
+    python benchmarks/run.py                  # 전체 측정 후 benchmarks/history.json에 기록
+    python benchmarks/run.py --quick          # 작은 입력만 측정
+    python benchmarks/run.py -k buffon -k monty --no-save
+    python benchmarks/run.py --check          # 느려진 항목이 있으면 종료 코드 1
+"""
+import argparse
+import gc
+import glob
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HISTORY = os.path.join(ROOT, "benchmarks", "history.json")
+REPEAT = 3
+REGRESSION_TOLERANCE = 0.5   # 직전 기록보다 50% 넘게 느려지면 경고
+
+
+# --- 페이지 불러오기 ---
+_pages = {}
+
+
+def load_page(pattern):
+    """페이지를 bare 모드로 한 번 실행해 모듈 전역(함수들)을 반환합니다."""
+    if pattern not in _pages:
+        paths = glob.glob(os.path.join(ROOT, "pages", pattern))
+        if not paths:
+            raise FileNotFoundError(f"페이지를 찾을 수 없습니다: pages/{pattern}")
+        from streamlit.runtime.scriptrunner_utils.exceptions import StopException
+
+        # runpy.run_path와 달리 실행이 도중에 끝나도 그때까지 정의된 전역을 남기도록 직접 실행
+        with open(paths[0], encoding="utf-8") as f:
+            code = compile(f.read(), paths[0], "exec")
+        namespace = {"__name__": "__benchmark__", "__file__": paths[0]}
+        try:
+            exec(code, namespace)
+        except StopException:
+            pass   # st.stop()으로 끝난 페이지도 함수 정의는 이미 끝났으므로 그대로 사용
+        except Exception as e:
+            raise RuntimeError(f"페이지를 불러오지 못했습니다: {paths[0]} ({e})") from e
+        _pages[pattern] = namespace
+    return _pages[pattern]
+
+
+def clear_page_caches(namespace):
+    """페이지의 st.cache_data 함수 캐시를 비워 매 측정이 캐시 없이 계산되도록 합니다."""
+    for value in namespace.values():
+        if type(value).__name__ == "CachedFunc":
+            value.clear()
+
+
+# --- 벤치마크 항목 ---
+class Case:
+    """
+    name: 항목 이름, page: 페이지 glob (utils 함수만 재는 항목은 None), sizes/quick_sizes: 입력 크기,
+    call(ns, size): 측정할 호출
+    """
+
+    def __init__(self, name, page, sizes, quick_sizes, call, unit):
+        self.name = name
+        self.page = page
+        self.sizes = sizes
+        self.quick_sizes = quick_sizes
+        self.call = call
+        self.unit = unit  # 처리량 단위 (크기 1이 나타내는 작업)
+
+
+def _rng(ns):
+    return ns["make_rng"](0)
+
+
+def _kmeans_call(ns, size):
+    import pandas as pd
+    from sklearn.datasets import make_blobs
+    X, _ = make_blobs(n_samples=size, centers=4, random_state=42)
+    ns["plot_kmeans_steps"](pd.DataFrame(X, columns=["x", "y"]), 4, ns["MAX_STEPS"])
+
+
+def _epsilon_delta_call(ns, size):
+    import numpy as np
+    for eps in np.linspace(0.01, 2.0, size):
+        ns["find_delta"]("sin(x)/x + x**2", {}, 0.5, float(eps))
+
+
+def _grid_paths_call(ns, size):
+    from utils.lattice_paths import count_route
+    # size×size 모눈의 약 10% 점에 흩어진 장애물, 왼쪽 위 → 경유지 → 오른쪽 아래
+    obstacles = {(x, y) for x in range(1, size) for y in range(1, size) if (7 * x + 13 * y) % 10 == 0}
+    route = [(0, 0), (size // 2, size // 2 + 1), (size, size)]
+    count_route(size, [p for p in route if p not in obstacles], obstacles)
+
+
+def _edge_disjoint_call(ns, size):
+    from utils.lattice_paths import count_edge_disjoint
+    # 갔다가 아래로 되돌아오는 경로: 두 구간이 가운데 가로줄을 함께 쓸 수 있어 간선 상태를 추적해야 함
+    count_edge_disjoint(size, [(0, 0), (size, size // 2), (0, size)])
+
+
+def _path_page_call(ns, size):
+    from utils.lattice_paths import PathEnumerator
+    # 간선 재사용 불가 경로 나열기를 만들고 가운데 쪽의 경로 24개를 순위로 바로 만들어 냄
+    paths = PathEnumerator(size, [(0, 0), (size, size // 2), (0, size)], allow_reuse=False)
+    paths.page(paths.total // 48, 24)
+
+
+CASES = [
+    Case("buffon.run_simulation", "05_*", [10**5, 10**6, 10**7], [10**5, 10**6],
+         lambda ns, n: ns["run_simulation"](n, rng=_rng(ns)), "needles"),
+    Case("monty_hall.run_simulation", "09_*", [10**5, 10**6, 10**7], [10**5, 10**6],
+         lambda ns, n: ns["run_simulation"](n, rng=_rng(ns)), "games"),
+    Case("probability.simulate_bayes", "10_*", [10**5, 10**6], [10**5],
+         lambda ns, n: ns["simulate_bayes"]({'a_red': 3, 'a_blue': 2, 'b_red': 1, 'b_blue': 4}, n, rng=_rng(ns)),
+         "trials"),
+    Case("probability.simulate_extraction", "10_*", [10**5, 10**6], [10**5],
+         lambda ns, n: ns["simulate_extraction"]({'red': 5, 'blue': 3}, n, False, rng=_rng(ns)), "trials"),
+    Case("probability.simulate_permutation", "10_*", [10**4, 10**5, 10**6], [10**4, 10**5],
+         lambda ns, n: ns["simulate_permutation"](10, 3, n, rng=_rng(ns)), "trials"),
+    Case("epsilon_delta.find_delta", "08_*", [10, 30, 100], [10],
+         _epsilon_delta_call, "epsilons"),
+    Case("kmeans.plot_kmeans_steps", "01_*", [300, 3_000, 30_000], [300, 3_000],
+         _kmeans_call, "points"),
+    Case("unit_cubes.cube_mesh_for_unit_cubes", "40_*", [4, 16, 40], [4, 16],
+         lambda ns, n: ns["cube_mesh_for_unit_cubes"](n, n, n), "cubes"),
+    Case("grid_paths.count_route", None, [50, 200, 800], [50, 200],
+         _grid_paths_call, "grid points"),
+    Case("grid_paths.count_edge_disjoint", None, [20, 50, 100], [20, 50],
+         _edge_disjoint_call, "grid points"),
+    Case("grid_paths.PathEnumerator.page", None, [10, 20, 40], [10, 20],
+         _path_page_call, "grid points"),
+]
+# 크기 n이 나타내는 작업량 (기본은 n 그대로)
+WORK = {
+    "unit_cubes.cube_mesh_for_unit_cubes": lambda n: n ** 3,
+    "grid_paths.count_route": lambda n: (n + 1) ** 2,
+    "grid_paths.count_edge_disjoint": lambda n: (n + 1) ** 2,
+    "grid_paths.PathEnumerator.page": lambda n: (n + 1) ** 2,
+}
+
+
+# --- 측정 ---
+def measure(case, size, ns, repeat=REPEAT):
+    import matplotlib.pyplot as plt
+
+    def run_once():
+        clear_page_caches(ns)
+        start = time.perf_counter()
+        case.call(ns, size)
+        elapsed = time.perf_counter() - start
+        plt.close("all")
+        return elapsed
+
+    run_once()  # 워밍업 (지연 import, JIT 없는 첫 호출 비용 제외)
+    seconds = min(run_once() for _ in range(repeat))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        clear_page_caches(ns)
+        case.call(ns, size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        plt.close("all")
+
+    work = WORK.get(case.name, lambda n: n)(size)
+    return {
+        "case": case.name,
+        "size": size,
+        "seconds": seconds,
+        "throughput": work / seconds if seconds > 0 else float("inf"),
+        "unit": case.unit,
+        "peak_mb": peak / 2**20,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def previous_results(history, machine):
+    """같은 기계에서 측정한 가장 최근 기록의 (항목, 크기) → 결과"""
+    for run in reversed(history):
+        if run.get("machine") == machine:
+            return {(r["case"], r["size"]): r for r in run["results"]}
+    return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시뮬레이션/계산 벤치마크")
+    parser.add_argument("-k", "--filter", action="append", default=[], help="이름에 이 문자열이 들어간 항목만 측정")
+    parser.add_argument("--quick", action="store_true", help="작은 입력 크기만 측정")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON 기록 파일 경로")
+    parser.add_argument("--no-save", action="store_true", help="기록 파일에 저장하지 않음")
+    parser.add_argument("--check", action="store_true", help="직전 기록보다 느려진 항목이 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    logging.disable(logging.CRITICAL)
+    warnings.filterwarnings("ignore")
+
+    machine = f"{platform.node()} {platform.machine()} py{platform.python_version()}"
+    history = load_history(args.history)
+    previous = previous_results(history, machine)
+
+    results, regressions = [], []
+    for case in CASES:
+        if args.filter and not any(f in case.name for f in args.filter):
+            continue
+        ns = load_page(case.page) if case.page else {}
+        for size in (case.quick_sizes if args.quick else case.sizes):
+            result = measure(case, size, ns, repeat=args.repeat)
+            results.append(result)
+            note = ""
+            prev = previous.get((case.name, size))
+            if prev:
+                ratio = result["seconds"] / prev["seconds"]
+                note = f"  (직전 대비 x{ratio:.2f})"
+                if ratio > 1 + REGRESSION_TOLERANCE:
+                    note += "  ⚠ 느려짐"
+                    regressions.append(result)
+            print(f"{case.name:40s} {size:>10,} {result['seconds'] * 1000:10.1f}ms "
+                  f"{result['throughput']:14,.0f} {case.unit}/s {result['peak_mb']:9.1f}MB{note}")
+
+    if not args.no_save and results:
+        history.append({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "machine": machine,
+            "quick": args.quick,
+            "results": results,
+        })
+        with open(args.history, "w", encoding="utf-8") as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+
+    if regressions:
+        print(f"\n직전 기록보다 {REGRESSION_TOLERANCE:.0%} 넘게 느려진 항목: {len(regressions)}개")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,14 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib import font_manager, rc
 from sklearn.datasets import make_blobs
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 
-# 한글 폰트 설정 (NanumGothic)
-font_path = "./fonts/NanumGothic-Regular.ttf"
-font_manager.fontManager.addfont(font_path)
-rc('font', family='NanumGothic')
+from utils.datasets import load_table
+from utils.fonts import use_korean_font
+
+# 한글 폰트 설정 (NanumGothic, 프로세스당 한 번만 등록)
+use_korean_font()
 
 st.set_page_config(page_title="K-means Clustering Demo", layout="wide")
 st.title("🔎 K-means Clustering 비지도 학습 데모")
@@ -20,8 +20,9 @@ st.title("🔎 K-means Clustering 비지도 학습 데모")
 st.sidebar.header("데이터셋 선택")
 dataset_name = st.sidebar.selectbox(
     "데이터셋 예시",
-    ["make_blobs (샘플)", "Iris (Kaggle)", "Mall Customers (Kaggle)"]
+    ["make_blobs (샘플)", "Iris (Kaggle)", "Mall Customers (Kaggle)", "대용량 데이터 (미니배치)"]
 )
+LARGE_DATASET = "대용량 데이터 (미니배치)"
 
 # 데이터셋 로딩 함수
 def load_dataset(name):
@@ -29,37 +30,166 @@ def load_dataset(name):
         X, y = make_blobs(n_samples=300, centers=4, random_state=42)
         return pd.DataFrame(X, columns=["x1", "x2"])
     elif name == "Iris (Kaggle)":
-        url = "https://raw.githubusercontent.com/mwaskom/seaborn-data/master/iris.csv"
-        df = pd.read_csv(url)
-        return df[["sepal_length", "sepal_width"]]
+        # 프로젝트 내 data/iris.csv 파일에서 로드 (seaborn-data의 iris.csv와 같은 내용)
+        return load_table("iris", ["sepal_length", "sepal_width"])
     elif name == "Mall Customers (Kaggle)":
         # 프로젝트 내 data/Mall_Customers.csv 파일에서 로드
         try:
-            df = pd.read_csv("./data/Mall_Customers.csv")
-            return df[["Annual Income (k$)", "Spending Score (1-100)"]]
+            return load_table("mall_customers", ["Annual Income (k$)", "Spending Score (1-100)"])
         except Exception as e:
             st.error("Mall Customers 데이터셋을 찾을 수 없습니다. data/Mall_Customers.csv 파일을 프로젝트에 추가해 주세요.")
             return pd.DataFrame()
     else:
         return pd.DataFrame()
 
-data = load_dataset(dataset_name)
+data = load_dataset(dataset_name) if dataset_name != LARGE_DATASET else pd.DataFrame()
 
 # K 값 입력
 st.sidebar.header("K 값 설정")
 K = st.sidebar.slider("클러스터 수 (K)", min_value=2, max_value=10, value=3)
 
+# 대용량 데이터 모드: 미니배치 K-means
+PLOT_SAMPLE_SIZE = 5000
+
+def synthetic_batches(n_points, batch_size, n_centers=4, seed=42):
+    """n_points개의 합성 군집 데이터를 한꺼번에 만들지 않고 batch_size개씩 만들어 내보냅니다."""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-10, 10, size=(n_centers, 2))
+    done = 0
+    while done < n_points:
+        count = min(batch_size, n_points - done)
+        labels = rng.integers(0, n_centers, count)
+        yield centers[labels] + rng.normal(size=(count, 2))
+        done += count
+
+def array_batches(X, batch_size, seed=42):
+    """메모리에 있는 데이터를 섞은 순서로 batch_size개씩 나누어 내보냅니다."""
+    order = np.random.default_rng(seed).permutation(len(X))
+    for start in range(0, len(X), batch_size):
+        yield X[order[start:start + batch_size]]
+
+@st.cache_data(max_entries=4, show_spinner="업로드한 파일을 읽는 중입니다...")
+def read_uploaded_points(file_id, _uploaded_file):
+    """업로드한 CSV에서 앞의 두 숫자 열만 float 배열로 읽습니다. file_id가 같으면 다시 읽지 않습니다."""
+    df = pd.read_csv(_uploaded_file, engine="pyarrow").select_dtypes("number")
+    return df.iloc[:, :2].dropna().to_numpy(dtype=float), list(df.columns[:2])
+
+def minibatch_kmeans_stream(batches, K, seed=42):
+    """
+    배치마다 MiniBatchKMeans.partial_fit으로 centroid를 갱신하고
+    (배치 번호, 모델, 배치의 점당 inertia, 배치)를 차례로 내보냅니다.
+    """
+    km = MiniBatchKMeans(n_clusters=K, random_state=seed, n_init=1)
+    for i, batch in enumerate(batches):
+        if len(batch) < K:
+            continue
+        km.partial_fit(batch)
+        yield i, km, -km.score(batch) / len(batch), batch
+
+if dataset_name == LARGE_DATASET:
+    st.subheader("대용량 데이터 미니배치 K-means")
+    st.markdown("데이터를 작은 배치로 나누어 centroid를 조금씩 갱신합니다. "
+                "화면에는 일부 점만 표본으로 그리고, 배치마다 inertia와 centroid 이동을 보여줍니다.")
+    source = st.sidebar.radio("데이터 출처", ["합성 데이터", "CSV 업로드"])
+    batch_size = st.sidebar.select_slider("배치 크기", options=[10_000, 50_000, 100_000, 200_000], value=100_000)
+    if source == "합성 데이터":
+        n_points = st.sidebar.select_slider(
+            "점 개수", options=[1_000_000, 2_000_000, 5_000_000, 10_000_000], value=1_000_000,
+            format_func=lambda n: f"{n:,}"
+        )
+        columns = ["x1", "x2"]
+        make_batches = lambda: synthetic_batches(n_points, batch_size)
+    else:
+        uploaded = st.sidebar.file_uploader("숫자 열이 두 개 이상 있는 CSV 파일", type="csv")
+        if uploaded is None:
+            st.info("사이드바에서 CSV 파일을 업로드하세요. 앞의 두 숫자 열을 사용합니다.")
+            st.stop()
+        X_uploaded, columns = read_uploaded_points(uploaded.file_id, uploaded)
+        if X_uploaded.shape[1] < 2:
+            st.error("숫자 열이 두 개 이상 필요합니다.")
+            st.stop()
+        n_points = len(X_uploaded)
+        make_batches = lambda: array_batches(X_uploaded, batch_size)
+    st.caption(f"전체 {n_points:,}개의 점, 배치 {batch_size:,}개씩 약 {-(-n_points // batch_size)}번 갱신")
+
+    if st.button("미니배치 K-means 실행"):
+        n_batches = -(-n_points // batch_size)
+        inertias = []
+        centroid_history = []
+        sample = None
+        progress_bar = st.progress(0, text="미니배치 학습 중...")
+        chart_placeholder = st.empty()
+        for i, km, inertia, batch in minibatch_kmeans_stream(make_batches(), K):
+            # 배치는 무작위 순서이므로 첫 배치의 앞부분을 그대로 시각화용 표본으로 사용
+            if sample is None:
+                sample = batch[:PLOT_SAMPLE_SIZE]
+            inertias.append(inertia)
+            centroid_history.append(km.cluster_centers_.copy())
+            chart_placeholder.line_chart(pd.DataFrame({"배치당 평균 inertia": inertias}))
+            progress_bar.progress((i + 1) / n_batches, text=f"미니배치 학습 중... ({i + 1}/{n_batches})")
+        progress_bar.empty()
+
+        if not centroid_history:
+            st.error("학습할 점이 부족합니다.")
+            st.stop()
+        centroid_history = np.array(centroid_history)
+        fig, ax = plt.subplots(figsize=(6, 5))
+        ax.scatter(sample[:, 0], sample[:, 1], c=km.predict(sample), cmap="viridis", s=4, alpha=0.4)
+        for k in range(K):
+            ax.plot(centroid_history[:, k, 0], centroid_history[:, k, 1], color="red", linewidth=1, alpha=0.7)
+        ax.scatter(centroid_history[-1, :, 0], centroid_history[-1, :, 1], c="red", marker="X", s=200, label="Centroids")
+        ax.set_xlabel(columns[0])
+        ax.set_ylabel(columns[1])
+        ax.legend()
+        ax.set_title(f"표본 {len(sample):,}개 점과 centroid 이동 경로")
+        plt.tight_layout()
+        st.pyplot(fig, use_container_width=False)
+    st.stop()
+
 # 단계별 centroid 이동 시각화
+MAX_STEPS = 10
 st.subheader("Centroid 이동 과정 시각화")
-step = st.slider("K-means 단계 (Iteration)", min_value=1, max_value=10, value=1)
+step = st.slider("K-means 단계 (Iteration)", min_value=1, max_value=MAX_STEPS, value=1)
+
+def assign_labels(X, centers):
+    """각 점을 가장 가까운 centroid 번호로 배정합니다."""
+    dists = ((X[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+    return dists.argmin(axis=1)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def kmeans_trajectory(data, K, max_steps=MAX_STEPS, seed=42):
+    """
+    Lloyd 알고리즘을 한 번만 실행하면서 매 단계의 centroid와 군집 번호를 기록합니다.
+    centroids[s], labels[s]가 s번 반복한 뒤의 상태이며 (0은 무작위 초기 상태),
+    일찍 수렴하면 남은 단계는 마지막 상태로 채웁니다.
+    """
+    X = data.to_numpy(dtype=float)
+    rng = np.random.default_rng(seed)
+    centers = X[rng.choice(len(X), size=K, replace=False)]
+
+    centroids = np.empty((max_steps + 1, K, X.shape[1]))
+    labels = np.empty((max_steps + 1, len(X)), dtype=np.int16)
+    centroids[0] = centers
+    labels[0] = assign_labels(X, centers)
+    for s in range(1, max_steps + 1):
+        prev = labels[s - 1]
+        counts = np.bincount(prev, minlength=K)
+        sums = np.column_stack([np.bincount(prev, weights=X[:, j], minlength=K) for j in range(X.shape[1])])
+        # 점이 하나도 배정되지 않은 centroid는 제자리에 둠
+        centers = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centers)
+        centroids[s] = centers
+        labels[s] = assign_labels(X, centers)
+        if np.array_equal(labels[s], prev):
+            centroids[s + 1:] = centers
+            labels[s + 1:] = labels[s]
+            break
+    return centroids, labels
 
 def plot_kmeans_steps(data, K, step):
-    kmeans = KMeans(n_clusters=K, init="random", n_init=1, max_iter=step, random_state=42)
-    kmeans.fit(data)
-    centers = kmeans.cluster_centers_
-    labels = kmeans.labels_
+    centroids, labels = kmeans_trajectory(data, K)
+    centers = centroids[step]
     fig, ax = plt.subplots(figsize=(5, 4))
-    ax.scatter(data.iloc[:,0], data.iloc[:,1], c=labels, cmap="viridis", alpha=0.6)
+    ax.scatter(data.iloc[:,0], data.iloc[:,1], c=labels[step], cmap="viridis", alpha=0.6)
     ax.scatter(centers[:,0], centers[:,1], c="red", marker="X", s=200, label="Centroids")
 
     ax.set_xlabel(data.columns[0])
@@ -72,13 +202,19 @@ def plot_kmeans_steps(data, K, step):
 plot_kmeans_steps(data, K, step)
 
 # Elbow 그래프 버튼
-if st.button("Elbow 그래프 보기 (Inertia vs K)"):
+@st.cache_data(max_entries=16, show_spinner="Elbow 그래프를 계산하는 중입니다...")
+def elbow_inertias(data, K_range=range(1, 11)):
+    """데이터셋마다 한 번만 K별 inertia를 계산합니다."""
     inertias = []
-    K_range = range(1, 11)
     for k in K_range:
         km = KMeans(n_clusters=k, n_init=10, random_state=42)
         km.fit(data)
         inertias.append(km.inertia_)
+    return inertias
+
+if st.button("Elbow 그래프 보기 (Inertia vs K)"):
+    K_range = range(1, 11)
+    inertias = elbow_inertias(data, K_range)
     fig, ax = plt.subplots(figsize=(5, 4))
     ax.plot(K_range, inertias, marker="o")
     ax.set_xlabel("K (클러스터 수)")
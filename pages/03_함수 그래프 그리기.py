@@ -3,20 +3,15 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 
+from utils.adaptive_plot import adaptive_sample
+from utils.expressions import compile_expression
+from utils.fonts import font_properties, use_korean_font
 
-# NanumGothic 폰트 경로 지정 및 예외처리
-import os
-font_path = './fonts/NanumGothic-Regular.ttf'
-try:
-	if os.path.exists(font_path):
-		fontprop = fm.FontProperties(fname=font_path)
-		plt.rc('font', family=fontprop.get_name())
-	else:
-		fontprop = None
-except Exception:
-	fontprop = None
+
+# NanumGothic 폰트 설정 (폰트 파일이 없으면 fontprop은 None)
+use_korean_font()
+fontprop = font_properties()
 
 
 
@@ -56,19 +51,19 @@ except Exception:
 
 if func_str:
 	try:
-		x = np.linspace(x_min, x_max, 500)
-		# 안전하게 eval을 사용하기 위해 numpy 함수만 허용
-		allowed_names = {k: getattr(np, k) for k in dir(np) if not k.startswith('_')}
-		allowed_names['x'] = x
-		y = eval(func_str, {"__builtins__": {}}, allowed_names)
+		# 수식은 공통 캐시에서 한 번만 해석·컴파일되고,
+		# 곡률이 크거나 값이 뛰는 곳만 촘촘하게 계산함
+		curve = adaptive_sample(compile_expression(func_str), x_min, x_max)
+		y = curve.y
 
 		# 입력 정보 요약
 		st.info(f"입력한 함수: f(x) = {func_str}\n정의역: x ∈ [{x_min}, {x_max}]")
 
-		# 연속성 판정: np.isnan, np.isinf로 불연속점 탐색
-		discontinuity = np.any(np.isnan(y)) or np.any(np.isinf(y))
+		# 연속성 판정: 점근선·계단처럼 끊어진 곳이나 정의되지 않는 점이 있는지 확인
+		discontinuity = not curve.is_continuous
 		if discontinuity:
-			st.warning('이 함수는 입력 구간 내에서 불연속점이 있습니다.')
+			points = ', '.join(f'{p:.4g}' for p in curve.breaks[:10])
+			st.warning(f'이 함수는 입력 구간 내에서 불연속점이 있습니다. (x ≈ {points})')
 		else:
 			st.success('이 함수는 입력 구간 내에서 연속함수입니다.')
 
@@ -82,7 +77,11 @@ if func_str:
 			st.error('유효한 함수값이 없어 최댓값/최솟값을 계산할 수 없습니다.')
 
 		fig, ax = plt.subplots()
-		ax.plot(x, y)
+		# 끊어진 곳에서 선을 나누어 그림
+		ax.plot(*curve.polyline())
+		if discontinuity and y_valid.size > 0:
+			# 점근선 근처의 아주 큰 값 때문에 그래프가 눌리지 않도록 y 범위를 제한
+			ax.set_ylim(*curve.y_limits())
 		# x축, y축 선 추가
 		ax.axhline(0, color='gray', linewidth=1)
 		ax.axvline(0, color='gray', linewidth=1)
@@ -1,8 +1,11 @@
-import os
-from matplotlib import font_manager
 import streamlit as st
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from utils.fonts import font_properties
+from utils.simulation import cached_run, make_rng, seed_control
 
 # --- 페이지 설정 ---
 st.set_page_config(
@@ -13,72 +16,221 @@ st.set_page_config(
 
 
 # --- 함수 정의 ---
-def run_simulation(num_needles):
+# 시뮬레이션 상수 (바늘 길이 l, 선 간격 d)
+# 계산 편의를 위해 l=1, d=2로 설정 (l <= d 만족)
+NEEDLE_LENGTH = 1.0
+LINE_SPACING = 2.0
+
+# 한 번에 처리할 바늘 수 (메모리 사용량을 일정하게 유지하기 위한 묶음 크기)
+CHUNK_SIZE = 1_000_000
+# 시각화를 위해 좌표를 보관할 최대 바늘 수
+MAX_STORED_NEEDLES = 200_000
+# 이 개수를 넘으면 선분 대신 밀도 이미지로 그림
+LINE_RENDER_LIMIT = 20_000
+# 밀도 이미지에서 바늘 하나당 찍는 점의 수와 해상도 (가로 픽셀 수)
+DENSITY_SAMPLES_PER_NEEDLE = 8
+DENSITY_RESOLUTION = 600
+# 실시간 수렴 모드에서 기록할 추정값 개수 (차트의 점 개수)
+CONVERGENCE_POINTS = 200
+# 신뢰구간에 사용할 z 값 (95%)
+CONFIDENCE_Z = 1.96
+
+
+def throw_needles(rng, count, needle_length=NEEDLE_LENGTH, line_spacing=LINE_SPACING):
+    """
+    바늘 count개를 한 번에 던지고 (y 중심, 각도, 교차 여부) 배열을 반환합니다.
+    """
+    # 1. 바늘의 중심점 y좌표를 무작위로 생성 (0과 d/2 사이)
+    #    대칭성을 이용해 0 ~ d/2 범위에서만 계산하여 효율을 높임
+    y_center = rng.uniform(0, line_spacing / 2, count)
+
+    # 2. 바늘의 각도 θ를 무작위로 생성 (0과 π/2 사이)
+    #    역시 대칭성을 이용
+    theta = rng.uniform(0, np.pi / 2, count)
+
+    # 3. 교차 조건 확인
+    #    y_center가 (l/2) * sin(θ) 보다 작으면 선과 교차
+    is_crossed = y_center <= (needle_length / 2) * np.sin(theta)
+    return y_center, theta, is_crossed
+
+
+def run_simulation(num_needles, chunk_size=CHUNK_SIZE, max_stored=MAX_STORED_NEEDLES, rng=None,
+                   progress_callback=None):
     """
     뷔퐁의 바늘 시뮬레이션을 실행하고 결과를 반환합니다.
+
+    바늘을 chunk_size개씩 묶어 배열 연산으로 처리하므로 메모리 사용량은
+    바늘 수와 관계없이 일정합니다. 시각화용 좌표는 앞쪽 max_stored개만
+    (x 중심, y 중심, 각도, 교차 여부) 배열 묶음으로 보관합니다.
+    progress_callback이 있으면 묶음마다 (던진 개수, 전체 개수)로 호출합니다.
     """
-    # 시뮬레이션 상수 (바늘 길이 l, 선 간격 d)
-    # 계산 편의를 위해 l=1, d=2로 설정 (l <= d 만족)
-    needle_length = 1.0
-    line_spacing = 2.0
-    
+    needle_length = NEEDLE_LENGTH
+    line_spacing = LINE_SPACING
+    rng = make_rng() if rng is None else rng
+
     crosses = 0
-    needle_coords = [] # 시각화를 위한 바늘 좌표 저장
+    stored = [] # 시각화를 위한 바늘 좌표 저장
+
+    done = 0
+    while done < num_needles:
+        count = min(chunk_size, num_needles - done)
+        y_center, theta, is_crossed = throw_needles(rng, count, needle_length, line_spacing)
+        crosses += int(np.count_nonzero(is_crossed))
 
-    # 진행 상태 바
-    progress_bar = st.progress(0, text="시뮬레이션을 진행 중입니다...")
-    
-    for i in range(num_needles):
-        # 1. 바늘의 중심점 y좌표를 무작위로 생성 (0과 d/2 사이)
-        #    대칭성을 이용해 0 ~ d/2 범위에서만 계산하여 효율을 높임
-        y_center = np.random.uniform(0, line_spacing / 2)
-        
-        # 2. 바늘의 각도 θ를 무작위로 생성 (0과 π/2 사이)
-        #    역시 대칭성을 이용
-        theta = np.random.uniform(0, np.pi / 2)
-        
-        # 3. 교차 조건 확인
-        #    y_center가 (l/2) * sin(θ) 보다 작으면 선과 교차
-        if y_center <= (needle_length / 2) * np.sin(theta):
-            crosses += 1
-            is_crossed = True
-        else:
-            is_crossed = False
-            
         # 시각화를 위해 바늘 정보 저장 (화면에 골고루 보이도록 x좌표도 무작위로 설정)
-        x_center = np.random.uniform(0, line_spacing * 4)
-        needle_coords.append((x_center, y_center, theta, is_crossed))
+        keep = min(max_stored - done, count)
+        if keep > 0:
+            # 그림용 좌표는 float32로 보관해 캐시된 결과의 메모리를 절반으로 줄임
+            x_center = rng.uniform(0, line_spacing * 4, keep)
+            stored.append((x_center.astype(np.float32), y_center[:keep].astype(np.float32),
+                           theta[:keep].astype(np.float32), is_crossed[:keep]))
 
-        # 진행 상태 업데이트
-        progress_bar.progress((i + 1) / num_needles, text=f"시뮬레이션 진행 중... ({i+1}/{num_needles})")
-    
-    progress_bar.empty() # 시뮬레이션 완료 후 진행 바 제거
+        done += count
+        if progress_callback is not None:
+            progress_callback(done, num_needles)
+
+    if stored:
+        needle_coords = tuple(np.concatenate(cols) for cols in zip(*stored))
+    else:
+        needle_coords = (np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32),
+                         np.empty(0, dtype=np.float32), np.empty(0, dtype=bool))
     return crosses, needle_coords, needle_length, line_spacing
 
-def plot_needles(needle_coords, needle_length, line_spacing):
+
+def pi_estimate_band(thrown, crosses, needle_length=NEEDLE_LENGTH, line_spacing=LINE_SPACING,
+                     z=CONFIDENCE_Z):
+    """
+    던진 횟수와 교차 횟수로 π 추정값과 신뢰구간 (하한, 상한)을 계산합니다.
+    배열을 넣으면 원소별로 계산하며, 교차 횟수가 0인 곳은 NaN이 됩니다.
+    """
+    thrown = np.asarray(thrown, dtype=float)
+    crosses = np.asarray(crosses, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = crosses / thrown
+        estimate = np.where(crosses > 0, 2 * needle_length / (line_spacing * p), np.nan)
+        # 델타 방법: se(π̂) ≈ π̂ · sqrt((1 - p) / (n · p))
+        se = estimate * np.sqrt((1 - p) / (thrown * p))
+    return estimate, estimate - z * se, estimate + z * se
+
+
+def stream_simulation(num_needles, num_points=CONVERGENCE_POINTS, rng=None):
+    """
+    바늘을 num_points개의 묶음으로 나누어 던지며 누적 결과를 차례로 내보내는 제너레이터입니다.
+
+    매 묶음마다 (던진 횟수, 교차 횟수, 추정값, 하한, 상한) 열을 가진 기록 배열에서
+    지금까지 채워진 부분을 내보냅니다. 바늘 좌표는 보관하지 않으므로 메모리 사용량은
+    묶음 수에만 비례합니다.
+    """
+    rng = make_rng() if rng is None else rng
+    num_chunks = max(1, min(num_points, num_needles))
+    # 각 묶음의 끝 위치 (마지막 묶음은 정확히 num_needles에서 끝남)
+    bounds = np.linspace(0, num_needles, num_chunks + 1).astype(np.int64)
+
+    history = np.empty((num_chunks, 5))
+    crosses = 0
+    for i in range(num_chunks):
+        done, target = int(bounds[i]), int(bounds[i + 1])
+        while done < target:
+            count = min(CHUNK_SIZE, target - done)
+            _, _, is_crossed = throw_needles(rng, count)
+            crosses += int(np.count_nonzero(is_crossed))
+            done += count
+        history[i, 0] = target
+        history[i, 1] = crosses
+        history[i, 2:] = np.array(pi_estimate_band(target, crosses)).ravel()
+        yield history[:i + 1]
+
+
+def convergence_frame(history):
+    """수렴 기록 배열을 차트용 DataFrame으로 변환합니다."""
+    return pd.DataFrame(
+        {
+            "추정된 π": history[:, 2],
+            "95% 하한": history[:, 3],
+            "95% 상한": history[:, 4],
+            "실제 π": np.full(len(history), np.pi),
+        },
+        index=pd.Index(history[:, 0].astype(np.int64), name="던진 횟수"),
+    )
+
+
+def needle_segments(needle_coords, needle_length, line_spacing, rng=None):
+    """
+    바늘 좌표 배열을 (N, 2, 2) 모양의 선분 끝점 배열로 변환합니다.
+    화면에 골고루 보이도록 각 바늘을 0~4번째 칸 중 하나로 무작위 이동합니다.
+    """
+    rng = make_rng() if rng is None else rng
+    x_center, y_center, theta, _ = needle_coords
+    y_center_display = y_center + rng.integers(0, 5, len(y_center)) * line_spacing
+    half_l = needle_length / 2
+    dx = half_l * np.cos(theta)
+    dy = half_l * np.sin(theta)
+
+    segments = np.empty((len(x_center), 2, 2))
+    segments[:, 0, 0] = x_center - dx
+    segments[:, 0, 1] = y_center_display - dy
+    segments[:, 1, 0] = x_center + dx
+    segments[:, 1, 1] = y_center_display + dy
+    return segments
+
+
+def needle_density_image(segments, is_crossed, extent, resolution=DENSITY_RESOLUTION,
+                         samples=DENSITY_SAMPLES_PER_NEEDLE):
+    """
+    바늘 선분 위의 점들을 격자에 누적해 RGB 밀도 이미지를 만듭니다.
+    교차한 바늘은 빨간색, 교차하지 않은 바늘은 파란색 농도로 표현합니다.
+    """
+    x_min, x_max, y_min, y_max = extent
+    bins = (resolution, int(resolution * (y_max - y_min) / (x_max - x_min)))
+    t = np.linspace(0, 1, samples)[None, :]
+
+    def density(seg):
+        xs = seg[:, 0, 0, None] + (seg[:, 1, 0, None] - seg[:, 0, 0, None]) * t
+        ys = seg[:, 0, 1, None] + (seg[:, 1, 1, None] - seg[:, 0, 1, None]) * t
+        hist, _, _ = np.histogram2d(xs.ravel(), ys.ravel(), bins=bins,
+                                    range=((x_min, x_max), (y_min, y_max)))
+        return np.log1p(hist.T)
+
+    red = density(segments[is_crossed])
+    blue = density(segments[~is_crossed])
+    scale = max(red.max(), blue.max(), 1.0)
+    red /= scale
+    blue /= scale
+
+    # 흰 배경에서 빨강은 G, B 성분을, 파랑은 R, G 성분을 빼서 색을 입힘
+    image = np.ones(red.shape + (3,))
+    image[..., 0] -= blue
+    image[..., 1] -= red + blue
+    image[..., 2] -= red
+    return np.clip(image, 0, 1)
+
+
+def plot_needles(needle_coords, needle_length, line_spacing, rng=None):
     """
     시뮬레이션 결과를 Matplotlib으로 시각화합니다.
+
+    모든 바늘을 하나의 LineCollection으로 한 번에 그리고, 바늘이
+    LINE_RENDER_LIMIT개보다 많으면 밀도 이미지로 그립니다.
     """
     fig, ax = plt.subplots(figsize=(12, 12))
 
     # 한글 폰트 적용
-    font_path = os.path.join(os.path.dirname(__file__), '../fonts/NanumGothic-Regular.ttf')
-    font_prop = font_manager.FontProperties(fname=font_path)
+    font_prop = font_properties()
 
     # 평행선 그리기
     for i in range(5):
         ax.axhline(y=i * line_spacing, color='black', linestyle='-', linewidth=2)
 
     # 바늘 그리기
-    for x_center, y_center, theta, is_crossed in needle_coords:
-        y_center_display = y_center + np.random.randint(0, 5) * line_spacing
-        half_l = needle_length / 2
-        x_start = x_center - half_l * np.cos(theta)
-        x_end = x_center + half_l * np.cos(theta)
-        y_start = y_center_display - half_l * np.sin(theta)
-        y_end = y_center_display + half_l * np.sin(theta)
-        color = 'red' if is_crossed else 'blue'
-        ax.plot([x_start, x_end], [y_start, y_end], color=color, alpha=0.7)
+    is_crossed = np.asarray(needle_coords[3], dtype=bool)
+    segments = needle_segments(needle_coords, needle_length, line_spacing, rng)
+    if len(segments) <= LINE_RENDER_LIMIT:
+        colors = np.where(is_crossed[:, None], (1.0, 0.0, 0.0, 0.7), (0.0, 0.0, 1.0, 0.7))
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=1.5))
+    else:
+        extent = (0, line_spacing * 4, -1, line_spacing * 5)
+        image = needle_density_image(segments, is_crossed, extent)
+        ax.imshow(image, origin='lower', extent=extent, interpolation='nearest', zorder=0)
 
     ax.set_title('뷔퐁의 바늘 시뮬레이션 결과', fontsize=20, fontproperties=font_prop)
     ax.set_xlim(0, line_spacing * 4)
@@ -111,18 +263,46 @@ with st.sidebar:
     num_needles_input = st.slider(
         "던질 바늘의 개수 (시행 횟수)", 
         min_value=100, 
-        max_value=50000, 
+        max_value=10_000_000, 
         value=1000, 
         step=100,
         help="시행 횟수가 많을수록 $\pi$ 값에 더 근접하지만, 계산 시간이 오래 걸립니다."
     )
     
+    stream_mode = st.toggle(
+        "실시간 수렴 과정 보기",
+        value=False,
+        help="바늘을 나누어 던지면서 π 추정값과 95% 신뢰구간이 변하는 모습을 차트로 보여줍니다. 이 모드에서는 바늘 배치 그림을 그리지 않습니다."
+    )
+
+    seed = seed_control("buffon")
+
     run_button = st.button("시뮬레이션 시작", type="primary")
 
 # --- 메인 화면 ---
 if run_button:
-    with st.spinner('열심히 바늘을 던지고 있습니다... 잠시만 기다려주세요.'):
-        cross_count, needles, l, d = run_simulation(num_needles_input)
+    if stream_mode:
+        st.header("📈 수렴 과정")
+        st.markdown("바늘을 던지는 동안 누적 π 추정값과 95% 신뢰구간이 실제 π 값으로 다가가는 모습입니다.")
+        chart_placeholder = st.empty()
+        status_placeholder = st.empty()
+        for history in stream_simulation(num_needles_input, rng=make_rng(seed)):
+            chart_placeholder.line_chart(convergence_frame(history))
+            status_placeholder.caption(f"던진 바늘: {int(history[-1, 0])}/{num_needles_input}개")
+        cross_count = int(history[-1, 1])
+        needles, l, d = None, NEEDLE_LENGTH, LINE_SPACING
+    else:
+        # 진행 상태 바 (묶음 단위로만 갱신, 캐시된 결과를 쓰면 바로 사라짐)
+        progress_bar = st.progress(0, text="시뮬레이션을 진행 중입니다...")
+
+        def update_progress(done, total):
+            progress_bar.progress(done / total, text=f"시뮬레이션 진행 중... ({done}/{total})")
+
+        with st.spinner('열심히 바늘을 던지고 있습니다... 잠시만 기다려주세요.'):
+            cross_count, needles, l, d = cached_run(
+                "buffon", run_simulation, seed, progress_callback=update_progress, num_needles=num_needles_input
+            )
+        progress_bar.empty() # 시뮬레이션 완료 후 진행 바 제거
 
     st.header("📊 시뮬레이션 결과")
 
@@ -157,18 +337,21 @@ if run_button:
         delta_color="inverse"
     )
 
+    if needles is None:
+        st.stop()
+
     st.header("🎨 시각화")
     st.markdown("시뮬레이션이 끝난 후 바늘들의 최종 배치 모습입니다.")
     
     # 시각화 그래프 표시
-    # 많은 바늘을 모두 그리면 속도가 느려지므로, 최대 3000개까지만 시각화
-    if len(needles) > 3000:
-        st.warning(f"시각화 성능을 위해 {len(needles)}개의 바늘 중 3000개만 무작위로 표시합니다.")
-        vis_needles = np.random.permutation(needles)[:3000]
-    else:
-        vis_needles = needles
-        
-    fig = plot_needles(vis_needles, l, d)
+    # 좌표는 최대 MAX_STORED_NEEDLES개까지만 보관하므로 그보다 많으면 일부만 시각화
+    # (시뮬레이션은 무작위로 던진 앞쪽 바늘의 좌표만 보관하므로 그대로 무작위 표본입니다)
+    if num_needles_input > MAX_STORED_NEEDLES:
+        st.warning(f"시각화 성능을 위해 {num_needles_input}개의 바늘 중 {MAX_STORED_NEEDLES}개만 무작위로 표시합니다.")
+    if len(needles[0]) > LINE_RENDER_LIMIT:
+        st.caption("바늘이 많아 각 위치에 놓인 바늘의 밀도를 색의 농도로 표시합니다.")
+
+    fig = plot_needles(needles, l, d, rng=make_rng(seed))
     st.pyplot(fig)
 else:
     st.info("사이드바에서 바늘 개수를 설정하고 '시뮬레이션 시작' 버튼을 눌러주세요.")
\ No newline at end of file
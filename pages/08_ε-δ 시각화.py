@@ -3,6 +3,8 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 
+from utils.expressions import compile_expression
+
 # 전문적인 페이지 레이아웃 및 스타일
 st.set_page_config(
     page_title="수학 함수 그래프 & ε-δ 연속성 시각화",
@@ -203,6 +205,74 @@ func_types = {
     "직접 입력": {"expr": None, "domain": (-10, 10)}
 }
 
+# δ 탐색에 사용하는 표본 점 개수와 이분법 반복 횟수
+DELTA_SAMPLES = 2001
+BISECTION_STEPS = 40
+
+
+def make_function(func_str, coefs=None):
+    """
+    공통 수식 캐시에서 컴파일한 식으로 배열 전체를 한 번에 계산하는 f(x)를 만듭니다.
+    계산할 수 없는 점은 NaN이 되고, 스칼라를 넣으면 스칼라를 반환합니다.
+    """
+    coefs = coefs or {}
+    try:
+        compiled = compile_expression(func_str, tuple(coefs))
+    except Exception:
+        compiled = None
+    def func(x):
+        x_arr = np.asarray(x, dtype=float)
+        try:
+            y = compiled(x_arr, **coefs)
+        except Exception:
+            y = np.full(x_arr.shape, np.nan)
+        return float(y) if x_arr.ndim == 0 else y
+    return func
+
+
+def delta_works(f, a, fa, eps, delta, samples=DELTA_SAMPLES):
+    """[a-δ, a+δ]의 표본 점 전체에서 |f(x)-f(a)|<ε 인지 한 번의 배열 계산으로 확인합니다."""
+    fx_vals = f(a + delta * np.linspace(-1, 1, samples))
+    return bool(np.all(np.isfinite(fx_vals)) and np.all(np.abs(fx_vals - fa) < eps))
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def find_delta(func_str, coefs, a, eps):
+    """
+    |x-a|<δ 인 모든 x에서 |f(x)-f(a)|<ε 를 만족하는 가장 큰 δ를 (0, 2ε] 범위에서 이분법으로 찾습니다.
+    아주 작은 δ로도 만족하지 않으면 None을 반환합니다.
+    """
+    f = make_function(func_str, coefs)
+    fa = f(a)
+    if not np.isfinite(fa):
+        return None
+    lo, hi = eps * 1e-6, 2 * eps
+    if delta_works(f, a, fa, eps, hi):
+        return float(hi)
+    if not delta_works(f, a, fa, eps, lo):
+        return None
+    for _ in range(BISECTION_STEPS):
+        mid = (lo + hi) / 2
+        if delta_works(f, a, fa, eps, mid):
+            lo = mid
+        else:
+            hi = mid
+    return float(lo)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def delta_table(func_str, coefs, a):
+    """여러 ε 값에 대한 δ(최대) 값을 계산해 (ε 배열, δ 목록)으로 반환합니다."""
+    epsilons = np.linspace(0.01, 2.0, 30)
+    deltas = []
+    for eps in epsilons:
+        found_delta = find_delta(func_str, coefs, a, float(eps))
+        deltas.append(found_delta if found_delta else np.nan)
+    return epsilons, deltas
+
+
+coef_inputs = {}
+
 # 사이드바: 함수 선택 및 입력
 with st.sidebar:
     st.image("https://img.icons8.com/color/96/graph.png", width=64)
@@ -248,13 +318,7 @@ with st.sidebar:
         if 'c' in func_str and 'c' not in coef_names:
             coef_inputs['c'] = st.number_input("c (상수항)", value=0.0)
         # 함수식에 계수값 반영
-        def user_func(x):
-            local_dict = {**coef_inputs, 'x': x, 'np': np}
-            try:
-                return eval(func_str, local_dict)
-            except Exception:
-                return np.nan
-        f = user_func
+        f = make_function(func_str, coef_inputs)
         st.markdown("""
         **계수의 역할:**
         - 최고차항: 그래프의 양 끝 방향과 폭 결정
@@ -264,11 +328,6 @@ with st.sidebar:
     else:
         func_str = func_types[func_name]["expr"]
         domain = func_types[func_name]["domain"]
-        def f(x):
-            try:
-                return eval(func_str, {"x": x, "np": np, "__builtins__": {}})
-            except Exception:
-                return np.nan
     st.markdown("""
     <div class='sidebar-examples'>
     <b>함수 예시</b><br>
@@ -297,11 +356,7 @@ with col2:
     epsilon = st.slider("ε 값 (양수)", min_value=0.001, max_value=2.0, value=0.1, step=0.001)
 
 if func_types[func_name]["expr"] is not None and func_name not in ["직접 입력"]:
-    def f(x):
-        try:
-            return eval(func_str, {"x": x, "np": np, "__builtins__": {}})
-        except Exception:
-            return np.nan
+    f = make_function(func_str)
 
 with col1:
     st.markdown("""
@@ -319,46 +374,16 @@ with col1:
     found_delta = None
     if st.button("그래프 그리기 및 δ-ε 시각화", key="draw_graph_delta_epsilon_1"):
         # 모든 ε에 대해 δ(최대 δ) 값 계산
-        epsilons = np.linspace(0.01, 2.0, 30)
-        deltas = []
         fa = f(a)
-        for eps in epsilons:
-            delta_candidates = np.linspace(eps/2, 2*eps, 500)
-            found_delta = None
-            for delta in delta_candidates:
-                x_left = np.linspace(a-delta, a, 50)
-                x_right = np.linspace(a, a+delta, 50)
-                x_vals = np.concatenate([x_left, x_right])
-                fx_vals = np.array([f(xi) for xi in x_vals])
-                valid = np.isfinite(fx_vals)
-                if np.all(valid) and np.all(np.abs(fx_vals[valid] - fa) < eps):
-                    found_delta = delta
-                    break
-            deltas.append(found_delta if found_delta else np.nan)
+        epsilons, deltas = delta_table(func_str, coef_inputs, a)
         # 표로 δ-ε 관계 출력
         st.markdown("<div class='result-card'><b>ε-δ 관계표</b></div>", unsafe_allow_html=True)
         st.dataframe({"ε": epsilons, "δ(최대)": deltas})
 
         # 선택한 ε에 대한 δ 및 그래프 시각화
-        delta_candidates = np.linspace(epsilon/2, 2*epsilon, 500)
-        found_delta = None
-        for delta in delta_candidates:
-            x_left = np.linspace(a-delta, a, 50)
-            x_right = np.linspace(a, a+delta, 50)
-            x_vals = np.concatenate([x_left, x_right])
-            fx_vals = np.array([f(xi) for xi in x_vals])
-            valid = np.isfinite(fx_vals)
-            if np.all(valid) and np.all(np.abs(fx_vals[valid] - fa) < epsilon):
-                found_delta = delta
-                break
+        found_delta = find_delta(func_str, coef_inputs, a, epsilon)
         x_plot = np.linspace(domain[0], domain[1], 1200)
-        def safe_f(xx):
-            try:
-                vals = np.array([f(xi) for xi in xx])
-            except Exception:
-                vals = np.full_like(xx, np.nan)
-            return vals
-        y_plot = safe_f(x_plot)
+        y_plot = f(x_plot)
         mask = np.isfinite(y_plot)
         # 테마 기반 색상 설정
         try:
@@ -392,75 +417,19 @@ with col1:
             st.markdown(f"<div class='result-card'><b>적당한 δ 값:</b> {found_delta:.6f}<br>모든 x∈({a-found_delta:.3f}, {a+found_delta:.3f})에서 |f(x)-f(a)|&lt;{epsilon} 입니다.</div>", unsafe_allow_html=True)
         else:
             st.markdown("<div class='result-card' style='background:#ffebee;border-color:#ffcdd2;color:#c62828;'><b>해당 ε에 대해 δ를 찾을 수 없습니다.<br>함수 또는 입력값을 확인하세요.</b></div>", unsafe_allow_html=True)
-        found_delta = None
-    if st.button("그래프 그리기 및 δ-ε 시각화", key="draw_graph_delta_epsilon_2"):
-            # 모든 ε에 대해 δ(최대 δ) 값 계산
-            epsilons = np.linspace(0.01, 2.0, 30)
-            deltas = []
-            fa = f(a)
-            for eps in epsilons:
-                delta_candidates = np.linspace(eps/2, 2*eps, 500)
-                found_delta = None
-                for delta in delta_candidates:
-                    x_left = np.linspace(a-delta, a, 50)
-                    x_right = np.linspace(a, a+delta, 50)
-                    x_vals = np.concatenate([x_left, x_right])
-                    fx_vals = np.array([f(xi) for xi in x_vals])
-                    valid = np.isfinite(fx_vals)
-                    if np.all(valid) and np.all(np.abs(fx_vals[valid] - fa) < eps):
-                        found_delta = delta
-                        break
-                deltas.append(found_delta if found_delta else np.nan)
-            # 표로 δ-ε 관계 출력
-            st.markdown("<div class='result-card'><b>ε-δ 관계표</b></div>", unsafe_allow_html=True)
-            st.dataframe({"ε": epsilons, "δ(최대)": deltas})
-
-            # 선택한 ε에 대한 δ 및 그래프 시각화
-            delta_candidates = np.linspace(epsilon/2, 2*epsilon, 500)
-            found_delta = None
-            for delta in delta_candidates:
-                x_left = np.linspace(a-delta, a, 50)
-                x_right = np.linspace(a, a+delta, 50)
-                x_vals = np.concatenate([x_left, x_right])
-                fx_vals = np.array([f(xi) for xi in x_vals])
-                valid = np.isfinite(fx_vals)
-                if np.all(valid) and np.all(np.abs(fx_vals[valid] - fa) < epsilon):
-                    found_delta = delta
-                    break
-            x_plot = np.linspace(domain[0], domain[1], 1200)
-            def safe_f(xx):
-                try:
-                    vals = np.array([f(xi) for xi in xx])
-                except Exception:
-                    vals = np.full_like(xx, np.nan)
-                return vals
-            y_plot = safe_f(x_plot)
-            mask = np.isfinite(y_plot)
-            fig, ax = plt.subplots(figsize=(9,5))
-            ax.plot(x_plot[mask], y_plot[mask], label="$f(x)$", color='#1976d2', linewidth=2)
-            if not np.all(mask):
-                ax.scatter(x_plot[~mask], np.full(np.sum(~mask), 0), color='#d32f2f', marker='x', label='불연속/정의불가')
-            ax.axvline(a, color='#c62828', linestyle='--', label='$a$', linewidth=2)
-            ax.axhline(fa, color='#388e3c', linestyle='--', label='$f(a)$', linewidth=2)
-            ax.fill_between(x_plot, fa-epsilon, fa+epsilon, color='#fffde7', alpha=0.5, label='$|f(x)-f(a)|<\epsilon$')
-            if found_delta:
-                ax.axvspan(a-found_delta, a+found_delta, color='#b3e5fc', alpha=0.4, label='$|x-a|<\delta$')
-                st.markdown(f"<div class='result-card'><b>적당한 δ 값:</b> {found_delta:.6f}<br>모든 x∈({a-found_delta:.3f}, {a+found_delta:.3f})에서 |f(x)-f(a)|&lt;{epsilon} 입니다.</div>", unsafe_allow_html=True)
+        ax.set_xlabel('x', fontsize=13)
+        ax.set_ylabel('f(x)', fontsize=13)
+        if np.any(mask):
+            y_min, y_max = np.nanmin(y_plot[mask]), np.nanmax(y_plot[mask])
+            if y_max-y_min < 1e-6:
+                ax.set_ylim(fa-1, fa+1)
             else:
-                st.markdown("<div class='result-card' style='background:#ffebee;border-color:#ffcdd2;color:#c62828;'><b>해당 ε에 대해 δ를 찾을 수 없습니다.<br>함수 또는 입력값을 확인하세요.</b></div>", unsafe_allow_html=True)
-            ax.set_xlabel('x', fontsize=13)
-            ax.set_ylabel('f(x)', fontsize=13)
-            if np.any(mask):
-                y_min, y_max = np.nanmin(y_plot[mask]), np.nanmax(y_plot[mask])
-                if y_max-y_min < 1e-6:
-                    ax.set_ylim(fa-1, fa+1)
-                else:
-                    ax.set_ylim(y_min-(y_max-y_min)*0.2, y_max+(y_max-y_min)*0.2)
-            ax.legend(fontsize=12, loc='best')
-            ax.grid(True, alpha=0.3)
-            st.pyplot(fig)
+                ax.set_ylim(y_min-(y_max-y_min)*0.2, y_max+(y_max-y_min)*0.2)
+        ax.legend(fontsize=12, loc='best')
+        ax.grid(True, alpha=0.3)
+        st.pyplot(fig)
 
-            if found_delta:
-                st.markdown(f"<div class='result-card'><b>함수는 x={a}에서 ε={epsilon}에 대해 연속입니다.</b></div>", unsafe_allow_html=True)
-            else:
-                st.markdown(f"<div class='result-card' style='background:#ffebee;border-color:#ffcdd2;color:#c62828;'><b>함수는 x={a}에서 ε={epsilon}에 대해 연속이 아닐 수 있습니다.</b></div>", unsafe_allow_html=True)
\ No newline at end of file
+        if found_delta:
+            st.markdown(f"<div class='result-card'><b>함수는 x={a}에서 ε={epsilon}에 대해 연속입니다.</b></div>", unsafe_allow_html=True)
+        else:
+            st.markdown(f"<div class='result-card' style='background:#ffebee;border-color:#ffcdd2;color:#c62828;'><b>함수는 x={a}에서 ε={epsilon}에 대해 연속이 아닐 수 있습니다.</b></div>", unsafe_allow_html=True)
\ No newline at end of file
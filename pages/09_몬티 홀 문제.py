@@ -1,7 +1,9 @@
 import streamlit as st
-import random
+import numpy as np
 import pandas as pd
 
+from utils.simulation import cached_run, make_rng, seed_control
+
 # --- 페이지 기본 설정 ---
 st.set_page_config(
     page_title="몬티 홀 문제 시뮬레이터",
@@ -24,32 +26,54 @@ st.sidebar.header("🕹️ 게임 설정")
 num_simulations = st.sidebar.number_input(
     label="시뮬레이션 횟수를 입력하세요",
     min_value=100,
-    max_value=100000,
+    max_value=10_000_000,
     value=1000, # 기본값
     step=100
 )
+num_doors = st.sidebar.number_input(
+    label="문의 개수를 입력하세요",
+    min_value=3,
+    max_value=100,
+    value=3,
+    step=1,
+    help="진행자는 참가자가 고르지 않은 문 중에서 염소가 있는 문을 하나만 남기고 모두 엽니다."
+)
+seed = seed_control("monty_hall")
+
+# 한 번에 처리할 게임 수 (메모리 사용량을 일정하게 유지하기 위한 묶음 크기)
+CHUNK_SIZE = 1_000_000
 
 # --- 시뮬레이션 함수 ---
-def run_simulation(strategy_to_switch):
-    wins = 0
-    for _ in range(num_simulations):
-        doors = [1, 2, 3]
-        car_door = 1 # 자동차는 항상 1번에 있다고 가정
-        player_choice = random.choice(doors)
-        doors_to_open = [door for door in doors if door != car_door and door != player_choice]
-        opened_door = random.choice(doors_to_open)
-        if strategy_to_switch:
-            final_choice = [door for door in doors if door != player_choice and door != opened_door][0]
-        else:
-            final_choice = player_choice
-        if final_choice == car_door:
-            wins += 1
-    return wins
+def run_simulation(num_games, num_doors=3, chunk_size=CHUNK_SIZE, rng=None):
+    """
+    num_games번의 게임을 배열 연산으로 한 번에 진행하고 (유지 승리 횟수, 변경 승리 횟수)를 반환합니다.
+
+    두 전략은 같은 무작위 추첨(자동차 위치, 첫 선택, 진행자가 남기는 문)을 공유합니다.
+    문이 num_doors개일 때 진행자는 염소가 있는 문 num_doors - 2개를 열어 문 하나만 남깁니다.
+    """
+    rng = make_rng() if rng is None else rng
+    stay_wins = 0
+    switch_wins = 0
+    done = 0
+    while done < num_games:
+        count = min(chunk_size, num_games - done)
+        car_door = rng.integers(0, num_doors, count, dtype=np.int16)
+        player_choice = rng.integers(0, num_doors, count, dtype=np.int16)
+        # 첫 선택이 정답이면 진행자는 나머지 문 중 하나를 무작위로 남기고,
+        # 아니면 자동차가 있는 문을 남길 수밖에 없음
+        other_door = (player_choice + rng.integers(1, num_doors, count, dtype=np.int16)) % num_doors
+        remaining_door = np.where(player_choice == car_door, other_door, car_door)
+
+        stay_wins += int(np.count_nonzero(player_choice == car_door))
+        switch_wins += int(np.count_nonzero(remaining_door == car_door))
+        done += count
+    return stay_wins, switch_wins
 
 # --- 실행 버튼 ---
 if st.button("🚀 시뮬레이션 시작!"):
-    stay_wins = run_simulation(strategy_to_switch=False)
-    switch_wins = run_simulation(strategy_to_switch=True)
+    stay_wins, switch_wins = cached_run(
+        "monty_hall", run_simulation, seed, num_games=int(num_simulations), num_doors=int(num_doors)
+    )
     st.header("📊 시뮬레이션 결과")
     results_df = pd.DataFrame({
         '전략': ['선택을 유지하기', '선택을 바꾸기'],
@@ -68,7 +92,10 @@ if st.button("🚀 시뮬레이션 시작!"):
         st.write(f"({num_simulations}번 중 {switch_wins}번 승리)")
     st.subheader("📈 전체 결과 비교")
     st.bar_chart(results_df)
-    st.info("결과가 놀랍지 않나요? 선택을 바꾸는 것이 승리할 확률이 약 **두 배**나 높습니다!")
+    if num_doors == 3:
+        st.info("결과가 놀랍지 않나요? 선택을 바꾸는 것이 승리할 확률이 약 **두 배**나 높습니다!")
+    else:
+        st.info(f"문이 {num_doors}개일 때 이론적인 승률은 유지하면 **1/{num_doors}**, 바꾸면 **{num_doors - 1}/{num_doors}** 입니다. 결과와 비교해 보세요!")
 else:
     st.info("게임 횟수를 설정하고 '시뮬레이션 시작' 버튼을 눌러 결과를 확인해보세요.")
 
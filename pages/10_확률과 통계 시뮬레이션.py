@@ -1,9 +1,11 @@
 import streamlit as st
-import random
+import numpy as np
 import itertools
 from collections import Counter
 import math
 
+from utils.simulation import cached_run, make_rng, seed_control
+
 # --- 페이지 설정 ---
 st.set_page_config(
     page_title="확률 마스터: 시뮬레이션 학습 앱",
@@ -16,11 +18,53 @@ st.markdown("학생들이 어려워하는 **조건부 확률, 독립/종속 사
 # --- 탭 구성 ---
 tab1, tab2, tab3 = st.tabs(["1. 조건부 확률 (베이즈)", "2. 독립 vs 종속 사건", "3. 순열 (순서가 있는 경우)"])
 
+# 세 시뮬레이션이 함께 쓰는 난수 시드
+seed = seed_control("probability_lab")
+
+# 슬라이더로 고를 수 있는 최대 시뮬레이션 반복 횟수
+MAX_TRIALS = 2_000_000
+
+
+# =================================================================
+# 공통 표본 추출 엔진 (세 시뮬레이션이 함께 사용)
+# =================================================================
+# 한 번에 만들 배열 원소 수 (메모리 사용량을 일정하게 유지하기 위한 묶음 크기)
+CHUNK_ELEMENTS = 2_000_000
+
+
+def iter_chunks(num_trials, row_size=1):
+    """시행을 한 묶음의 원소 수가 CHUNK_ELEMENTS를 넘지 않도록 나누어 각 묶음의 시행 수를 내보냅니다."""
+    rows = max(1, CHUNK_ELEMENTS // max(1, row_size))
+    done = 0
+    while done < num_trials:
+        count = min(rows, num_trials - done)
+        yield count
+        done += count
+
+
+def sample_color_counts(rng, counts, draws, num_trials, replace=True):
+    """
+    색깔별 공 개수가 counts인 주머니에서 시행마다 공 draws개를 뽑고,
+    뽑힌 공의 색깔별 개수를 (num_trials, 색깔 수) 배열로 반환합니다.
+    복원 추출은 다항분포, 비복원 추출은 다변량 초기하분포에서 한 번에 뽑습니다.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    if replace:
+        return rng.multinomial(draws, counts / counts.sum(), size=num_trials)
+    return rng.multivariate_hypergeometric(counts, draws, size=num_trials)
+
+
+def sample_partial_permutations(rng, n, r, num_trials):
+    """1부터 n까지의 카드에서 r장을 뽑아 나열한 순열을 (num_trials, r) 배열로 반환합니다."""
+    cards = np.broadcast_to(np.arange(1, n + 1), (num_trials, n))
+    return rng.permuted(cards, axis=1)[:, :r]
+
+
 
 # =================================================================
 # 1. 조건부 확률 (베이즈 정리) 시뮬레이션
 # =================================================================
-def simulate_bayes(config, num_trials):
+def simulate_bayes(config, num_trials, rng=None):
     """조건부 확률 시뮬레이션 실행"""
     
     # 설정값 추출
@@ -33,32 +77,26 @@ def simulate_bayes(config, num_trials):
     total_a = a_red + a_blue
     total_b = b_red + b_blue
     
+    rng = make_rng() if rng is None else rng
+
     # 결과 카운터
     red_count = 0        # 전체 빨간 공 나온 횟수 (사건 B)
     red_from_a_count = 0 # A 주머니에서 빨간 공 나온 횟수 (사건 A ∩ B)
 
-    for _ in range(num_trials):
+    for count in iter_chunks(num_trials, row_size=2):
         # 1단계: 주머니 선택 (동전 던지기, A 또는 B 선택 확률 1/2)
-        selected_pouch = random.choice(['A', 'B'])
-        
-        # 2단계: 공 뽑기
-        pouch_config = []
-        if selected_pouch == 'A':
-            pouch_config = ['Red'] * a_red + ['Blue'] * a_blue
-        else: # 'B'
-            pouch_config = ['Red'] * b_red + ['Blue'] * b_blue
-            
-        if not pouch_config: # 빈 주머니 방지
-            continue
-            
-        drawn_ball = random.choice(pouch_config)
-        
+        chose_a = int(np.count_nonzero(rng.random(count) < 0.5))
+        chose_b = count - chose_a
+
+        # 2단계: 공 뽑기 (빈 주머니를 고른 시행은 공을 뽑지 못함)
         # 3단계: 결과 기록
-        if drawn_ball == 'Red':
-            red_count += 1
-            if selected_pouch == 'A':
-                red_from_a_count += 1
-                
+        if total_a > 0:
+            red_from_a = int(sample_color_counts(rng, [a_red, a_blue], 1, chose_a)[:, 0].sum())
+            red_from_a_count += red_from_a
+            red_count += red_from_a
+        if total_b > 0:
+            red_count += int(sample_color_counts(rng, [b_red, b_blue], 1, chose_b)[:, 0].sum())
+
     # 실험적 조건부 확률 계산
     experimental_prob = red_from_a_count / red_count if red_count > 0 else 0
     
@@ -108,7 +146,7 @@ with tab1:
         b_blue = st.number_input("B 주머니 파란 공 개수", min_value=0, value=2, key='bb')
 
     with col2:
-        num_trials = st.slider("시뮬레이션 반복 횟수", min_value=100, max_value=10000, value=5000, step=100)
+        num_trials = st.slider("시뮬레이션 반복 횟수", min_value=100, max_value=MAX_TRIALS, value=5000, step=100)
         
         config = {'a_red': a_red, 'a_blue': a_blue, 'b_red': b_red, 'b_blue': b_blue}
         
@@ -120,7 +158,9 @@ with tab1:
         st.caption(f"$P(R|A)P(A)$ (분자) = {p_a_and_red:.4f} / $P(R)$ (분모) = {p_b:.4f}")
 
         if st.button("시뮬레이션 시작 (조건부 확률)"):
-            red_count, red_from_a_count, experimental_prob = simulate_bayes(config, num_trials)
+            red_count, red_from_a_count, experimental_prob = cached_run(
+                "probability_lab", simulate_bayes, seed, config=config, num_trials=num_trials
+            )
             
             st.subheader("🧪 시뮬레이션 결과")
             st.metric("총 반복 횟수", num_trials)
@@ -136,35 +176,22 @@ with tab1:
 # =================================================================
 # 2. 독립 vs 종속 사건 시뮬레이션
 # =================================================================
-def simulate_extraction(config, num_trials, is_replacement):
+def simulate_extraction(config, num_trials, is_replacement, rng=None):
     """복원/비복원 추출 시뮬레이션 실행"""
     initial_red = config['red']
     initial_blue = config['blue']
     
+    rng = make_rng() if rng is None else rng
+
     # 2번 뽑을 때 모두 빨간 공일 확률을 계산
     red_red_count = 0
-    
-    for _ in range(num_trials):
-        pouch = ['Red'] * initial_red + ['Blue'] * initial_blue
-        
-        if len(pouch) < 2: # 최소 2개 필요
-            continue
-            
-        # 1차 추출
-        ball1 = random.choice(pouch)
-        
-        # 공 재구성 (복원 또는 비복원)
-        if not is_replacement: # 비복원 추출 (종속 사건)
-            pouch.remove(ball1) # 뽑은 공 제거
-            if not pouch: # 두 번째 뽑을 공이 없으면
-                 continue
-        
-        # 2차 추출
-        ball2 = random.choice(pouch)
-        
-        if ball1 == 'Red' and ball2 == 'Red':
-            red_red_count += 1
-            
+
+    if initial_red + initial_blue >= 2: # 최소 2개 필요
+        for count in iter_chunks(num_trials, row_size=2):
+            # 복원 추출 (독립 사건) 또는 비복원 추출 (종속 사건)으로 두 번 뽑기
+            drawn = sample_color_counts(rng, [initial_red, initial_blue], 2, count, replace=is_replacement)
+            red_red_count += int(np.count_nonzero(drawn[:, 0] == 2))
+
     experimental_prob = red_red_count / num_trials if num_trials > 0 else 0
     return red_red_count, experimental_prob
 
@@ -202,7 +229,7 @@ with tab2:
         is_replacement = st.checkbox("✅ 뽑은 공을 다시 넣기 (복원 추출 / 독립 사건)", value=True, key='is_rep')
 
     with col2:
-        num_trials_ext = st.slider("시뮬레이션 반복 횟수", min_value=100, max_value=10000, value=5000, step=100, key='trials_ext')
+        num_trials_ext = st.slider("시뮬레이션 반복 횟수", min_value=100, max_value=MAX_TRIALS, value=5000, step=100, key='trials_ext')
         
         config_ext = {'red': r, 'blue': b}
         
@@ -214,7 +241,10 @@ with tab2:
         st.markdown(f"**이론값 $P(R_1 \cap R_2)$:** `{theoretical_prob_ext:.4f}`")
 
         if st.button("시뮬레이션 시작 (독립/종속)"):
-            red_red_count, experimental_prob_ext = simulate_extraction(config_ext, num_trials_ext, is_replacement)
+            red_red_count, experimental_prob_ext = cached_run(
+                "probability_lab", simulate_extraction, seed,
+                config=config_ext, num_trials=num_trials_ext, is_replacement=is_replacement
+            )
             
             st.subheader("🧪 시뮬레이션 결과")
             st.metric("총 반복 횟수", num_trials_ext)
@@ -228,25 +258,22 @@ with tab2:
 # =================================================================
 # 3. 순열 시뮬레이션
 # =================================================================
-def simulate_permutation(n, r, num_trials):
+def simulate_permutation(n, r, num_trials, rng=None):
     """순열 시뮬레이션 실행"""
     
-    cards = list(range(1, n + 1))
-    
+    rng = make_rng() if rng is None else rng
+
     # 짝수 순열 개수 카운터
     even_perm_count = 0
-    
-    for _ in range(num_trials):
-        # r개의 카드를 무작위로 뽑아 순서대로 나열
-        permutation = random.sample(cards, r)
-        
-        if not permutation:
-            continue
-            
-        # '세 자리 자연수' 문제처럼, 마지막 숫자가 짝수인지 확인 (짝수 조건)
-        if permutation[-1] % 2 == 0:
-            even_perm_count += 1
-            
+
+    if r > 0:
+        for count in iter_chunks(num_trials, row_size=n):
+            # r개의 카드를 무작위로 뽑아 순서대로 나열
+            permutations = sample_partial_permutations(rng, n, r, count)
+
+            # '세 자리 자연수' 문제처럼, 마지막 숫자가 짝수인지 확인 (짝수 조건)
+            even_perm_count += int(np.count_nonzero(permutations[:, -1] % 2 == 0))
+
     experimental_prob = even_perm_count / num_trials if num_trials > 0 else 0
     return even_perm_count, experimental_prob
 
@@ -293,7 +320,7 @@ with tab3:
         st.caption(f"문제 상황: {n_cards}장의 카드 중 {r_draw}장을 뽑아 {r_draw}자리 숫자를 만듭니다.")
 
     with col2:
-        num_trials_perm = st.slider("시뮬레이션 반복 횟수", min_value=100, max_value=10000, value=5000, step=100, key='trials_perm')
+        num_trials_perm = st.slider("시뮬레이션 반복 횟수", min_value=100, max_value=MAX_TRIALS, value=5000, step=100, key='trials_perm')
         
         # 이론값 계산
         nPr_total, nPr_even, theoretical_prob_perm = calculate_theoretical_permutation(n_cards, r_draw)
@@ -305,7 +332,9 @@ with tab3:
         st.markdown(f"**이론값 $P(짝수)$:** `{theoretical_prob_perm:.4f}`")
 
         if st.button("시뮬레이션 시작 (순열)"):
-            even_perm_count, experimental_prob_perm = simulate_permutation(n_cards, r_draw, num_trials_perm)
+            even_perm_count, experimental_prob_perm = cached_run(
+                "probability_lab", simulate_permutation, seed, n=n_cards, r=r_draw, num_trials=num_trials_perm
+            )
             
             st.subheader("🧪 시뮬레이션 결과")
             st.metric("총 반복 횟수", num_trials_perm)
@@ -1,8 +1,11 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-from sympy import sympify, Symbol, lambdify, integrate
+
+from utils.adaptive_plot import adaptive_sample
+from utils.expressions import compile_expression
+from utils.fonts import font_properties, use_korean_font
+from utils.symbolic import definite_integral
 st.title("적분 그래프 시각화 앱")
 
 
@@ -41,7 +44,6 @@ a = st.number_input("적분 시작값 a", value=0.0)
 b = st.number_input("적분 끝값 b", value=1.0)
 
 if st.button("적분 그래프 그리기"):
-    x = Symbol('x')
     try:
         func_expr = func_str.replace('^', '**')
         # 분수표현: a/b, a/(x+1), (x+1)/2 등 다양한 케이스를 괄호로 감싸서 sympy가 안전하게 해석하도록 변환
@@ -51,34 +53,24 @@ if st.button("적분 그래프 그리기"):
         # log(x)일 때 밑이 입력되면 log(x, base)로 변환
         if log_base and log_base.strip():
             func_expr = re.sub(r"log\s*\(([^)]+)\)", f"log(\\1, {log_base})", func_expr)
-        func = sympify(func_expr)
-        f_lamb = lambdify(x, func, 'numpy')
-        X = np.linspace(a, b, 400)
-        Y = f_lamb(X)
-        # Y가 스칼라(상수)일 경우 X와 같은 shape으로 변환
-        import numpy as np
-        if np.isscalar(Y):
-            Y = np.full_like(X, Y)
+        # 수식은 공통 캐시에서 한 번만 해석·컴파일됨 (상수 식도 X와 같은 모양으로 계산)
+        compiled = compile_expression(func_expr)
+        func = compiled.expr
+        # 곡률이 크거나 값이 뛰는 곳만 촘촘하게 계산하고, 점근선에서는 선을 끊음
+        X, Y = adaptive_sample(compiled, a, b).polyline()
 
-        # 적분값 계산
-        integral_val = integrate(func, (x, a, b)).evalf()
+        # 적분값 계산 (기호 적분이 제한 시간을 넘기면 수치 적분으로 대신 계산)
+        integral_val, method = definite_integral(func, a, b)
+        if method == "numeric":
+            st.info("기호 적분이 오래 걸려 수치 적분(scipy.integrate.quad)으로 계산한 값입니다.")
 
         # 폰트 설정
-        try:
-            font_path = 'fonts/NanumGothic-Regular.ttf'
-            font_name = fm.FontProperties(fname=font_path).get_name()
-            plt.rc('font', family=font_name)
-            plt.rcParams['axes.unicode_minus'] = False
-        except FileNotFoundError:
-            st.error(f"폰트 파일을 찾을 수 없습니다: {font_path}. 'fonts' 디렉토리에 폰트 파일이 있는지 확인하세요.")
-            # 대체 폰트 사용
-            plt.rc('font', family='sans-serif')
-            plt.rcParams['axes.unicode_minus'] = False
-
-        fontprop = fm.FontProperties(fname=font_path)
+        if use_korean_font() is None:
+            st.error("폰트 파일을 찾을 수 없습니다: static/fonts/NanumGothic-Regular.ttf. 'static/fonts' 디렉토리에 폰트 파일이 있는지 확인하세요.")
+        fontprop = font_properties()
         fig, ax = plt.subplots()
         ax.plot(X, Y, label=f"f(x) = {func_str}", color='blue')
-        ax.fill_between(X, Y, where=[True]*len(X), alpha=0.3, color='orange', label="적분 영역")
+        ax.fill_between(X, Y, where=np.isfinite(Y), alpha=0.3, color='orange', label="적분 영역")
         ax.set_xlabel("x", fontproperties=fontprop)
         ax.set_ylabel("f(x)", fontproperties=fontprop)
         ax.legend(prop=fontprop)
@@ -3,8 +3,11 @@ import numpy as np
 import sympy
 from sympy.parsing.sympy_parser import parse_expr
 import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import os
+
+from utils.adaptive_plot import adaptive_sample
+from utils.expressions import compile_expression
+from utils.fonts import use_korean_font
+from utils.symbolic import one_sided_limit, singularities
 
 # --- 페이지 기본 설정 ---
 st.set_page_config(
@@ -13,34 +16,25 @@ st.set_page_config(
     layout="centered"
 )
 
-# --- 한글 폰트 설정 (루트 fonts/NanumGothic-Regular.ttf 고정) ---
-@st.cache_data
-def load_korean_font():
-    font_path = os.path.join(os.getcwd(), "fonts", "NanumGothic-Regular.ttf")
-    if not os.path.exists(font_path):
-        st.warning(f"⚠️ 폰트 파일을 찾을 수 없습니다: {font_path}")
-        return
-
-    fm.fontManager.addfont(font_path)
-    font_name = fm.FontProperties(fname=font_path).get_name()
-    plt.rc('font', family=font_name)
-    plt.rcParams['axes.unicode_minus'] = False
-    return font_name
-
-load_korean_font()
+# --- 한글 폰트 설정 (루트 static/fonts/NanumGothic-Regular.ttf 고정, 프로세스당 한 번만 등록) ---
+if use_korean_font() is None:
+    st.warning("⚠️ 폰트 파일을 찾을 수 없습니다: static/fonts/NanumGothic-Regular.ttf")
 
 # --- 수학적 판별 로직 ---
 def check_uniform_continuity(func_str, interval_type, a_sym, b_sym):
-    x = sympy.symbols('x')
     try:
-        f = parse_expr(func_str, local_dict={'x': x}, transformations='all')
+        f = compile_expression(func_str).expr
     except Exception as e:
         return "오류", f"함수식을 파싱할 수 없습니다: {e}", None
 
+    # 기호 계산은 제한 시간이 있는 작업자 프로세스에서 실행
+    # (특이점을 모르면 연속이라고 판단할 수 없으므로 시간 초과·실패는 판별 불가로 처리)
     try:
-        discontinuities = sympy.singularities(f, x)
-    except Exception:
-        discontinuities = []
+        discontinuities = singularities(f)
+    except TimeoutError:
+        return "판별 불가", "기호 계산 시간 초과: 함수의 불연속점을 제한 시간 안에 구하지 못했습니다.", f
+    except RuntimeError as e:
+        return "판별 불가", f"기호 계산 실패: 함수의 불연속점을 구하지 못했습니다. ({e})", f
 
     if interval_type == '[a, b]':
         if a_sym.is_infinite or b_sym.is_infinite:
@@ -62,20 +56,24 @@ def check_uniform_continuity(func_str, interval_type, a_sym, b_sym):
         # 왼쪽 끝점
         if interval_type in ['(a, b)', '(a, b]']:
             try:
-                limit_a = sympy.limit(f, x, a_sym, dir='+')
+                limit_a = one_sided_limit(f, a_sym, '+')
                 if limit_a.is_infinite:
                     is_uc = False
                     reason = f"구간의 왼쪽 끝점 $x \\to {sympy.latex(a_sym)}^+$ 에서 함수의 극한이 무한대로 발산하므로 평등연속이 아닙니다."
+            except TimeoutError:
+                return "판별 불가", f"기호 계산 시간 초과: $x \\to {sympy.latex(a_sym)}$ 에서의 극한을 제한 시간 안에 구하지 못했습니다.", f
             except Exception:
                 pass
         
         # 오른쪽 끝점
         if is_uc and interval_type in ['(a, b)', '[a, b)']:
             try:
-                limit_b = sympy.limit(f, x, b_sym, dir='-')
+                limit_b = one_sided_limit(f, b_sym, '-')
                 if limit_b.is_infinite:
                     is_uc = False
                     reason = f"구간의 오른쪽 끝점 $x \\to {sympy.latex(b_sym)}^-$ 에서 함수의 극한이 무한대로 발산하므로 평등연속이 아닙니다."
+            except TimeoutError:
+                return "판별 불가", f"기호 계산 시간 초과: $x \\to {sympy.latex(b_sym)}$ 에서의 극한을 제한 시간 안에 구하지 못했습니다.", f
             except Exception:
                 pass
         
@@ -165,10 +163,9 @@ if submitted:
                     plot_a_num = float(a_sym.evalf())
                     plot_b_num = float(b_sym.evalf())
 
-                f_lambda = sympy.lambdify(sympy.symbols('x'), func_sympy, 'numpy')
-                x_vals = np.linspace(plot_a_num, plot_b_num, 500)
-                y_vals = f_lambda(x_vals)
-                y_vals[np.isinf(y_vals) | np.isneginf(y_vals)] = np.nan
+                # 곡률이 크거나 값이 뛰는 곳만 촘촘하게 계산하고, 점근선에서는 선을 끊음
+                f_lambda = compile_expression(func_input)
+                x_vals, y_vals = adaptive_sample(f_lambda, plot_a_num, plot_b_num).polyline()
 
                 # --- 그래프 그리기 ---
                 plt.style.use('dark_background')
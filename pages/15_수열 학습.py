@@ -1,28 +1,18 @@
 # streamlit-math-input 라이브러리에서 수식 입력 위젯을 가져옵니다.
 import streamlit as st
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
-from sympy import sympify, symbols, SympifyError
+import math
+from fractions import Fraction
+from sympy import sympify, symbols, SympifyError, lambdify, fraction, together, Poly
 import re  # 문자열 처리를 위한 정규식 라이브러리
-import os
-import matplotlib.font_manager as fm
-
-# --- 한글 폰트 설정 (루트 fonts/NanumGothic-Regular.ttf 고정) ---
-@st.cache_data
-def load_korean_font():
-    font_path = os.path.join(os.getcwd(), "fonts", "NanumGothic-Regular.ttf")
-    if not os.path.exists(font_path):
-        st.warning(f"⚠️ 폰트 파일을 찾을 수 없습니다: {font_path}")
-        return
 
-    fm.fontManager.addfont(font_path)
-    font_name = fm.FontProperties(fname=font_path).get_name()
-    plt.rc('font', family=font_name)
-    plt.rcParams['axes.unicode_minus'] = False
-    return font_name
+from utils.fonts import use_korean_font
 
-# 폰트 로드
-load_korean_font()
+# --- 한글 폰트 설정 (루트 static/fonts/NanumGothic-Regular.ttf 고정, 프로세스당 한 번만 등록) ---
+if use_korean_font() is None:
+    st.warning("⚠️ 폰트 파일을 찾을 수 없습니다: static/fonts/NanumGothic-Regular.ttf")
 
 def parse_latex_to_sympy(latex_str: str) -> str:
     """
@@ -42,38 +32,183 @@ def parse_latex_to_sympy(latex_str: str) -> str:
     
     return parsed_str
 
-def display_results(terms_list):
-    """계산된 수열의 항들과 그래프를 화면에 출력하는 함수"""
-    if not terms_list:
+# --- 수열 계산 엔진 ---
+MAX_TERMS = 100_000        # 일반항/점화식으로 구할 수 있는 최대 항 수
+EXACT_MAX_TERMS = 2_000    # 정확한 유리수 모드는 분모가 빠르게 커지므로 따로 제한
+EXACT_MAX_BITS = 200_000   # 정확한 유리수 모드에서 한 항의 분자·분모 비트 수 합의 상한 (약 6만 자리)
+EXACT_DISPLAY_DIGITS = 60  # 이보다 자릿수가 많은 분수는 자릿수와 근삿값으로 줄여 보여줌
+DISPLAY_TERMS = 40         # 수식으로 보여줄 앞쪽 항 수
+MARKER_LIMIT = 100         # 이 항 수 이하에서만 점과 정수 눈금을 그림
+
+
+def general_term_values(expr, n, num_terms):
+    """일반항을 lambdify해 n = 1, ..., num_terms 를 한 번의 벡터 연산으로 계산합니다."""
+    f = lambdify(n, expr, modules=["numpy", "scipy"])
+    n_values = np.arange(1, num_terms + 1, dtype=float)
+    with np.errstate(all='ignore'):
+        values = np.asarray(f(n_values), dtype=float)
+    return np.broadcast_to(values, n_values.shape).copy()
+
+
+def recurrence_values(expr, a_prev, first_term, num_terms):
+    """점화식을 파이썬 숫자 함수로 컴파일해 반복 계산합니다. 값이 넘치거나 정의되지 않으면 이후 항은 nan입니다."""
+    step = lambdify(a_prev, expr, modules="math")
+    values = np.full(num_terms, np.nan)
+    current = float(first_term)
+    values[0] = current
+    for i in range(1, num_terms):
+        try:
+            current = float(step(current))
+        except (OverflowError, ValueError, ZeroDivisionError, TypeError):
+            break
+        values[i] = current
+    return values
+
+
+def exact_recurrence_values(expr, a_prev, first_term, num_terms, max_bits=EXACT_MAX_BITS):
+    """
+    사칙연산과 정수 거듭제곱으로 된 점화식을 Fraction으로 정확하게 계산합니다.
+    분자·분모 다항식의 유리수 계수를 Horner 방법으로 계산하므로 SymPy 객체가 커지지 않습니다.
+    다음 항의 분자·분모 비트 수가 max_bits를 넘을 것으로 보이면 계산하기 전에 멈춥니다.
+    (항 목록, 멈춘 이유) 를 반환하며 멈춘 이유는 None, "zero"(분모 0), "bits"(크기 제한) 중 하나입니다.
+    """
+    numerator, denominator = fraction(together(expr))
+    try:
+        num_coeffs = [Fraction(int(c.p), int(c.q)) for c in Poly(numerator, a_prev, domain='QQ').all_coeffs()]
+        den_coeffs = [Fraction(int(c.p), int(c.q)) for c in Poly(denominator, a_prev, domain='QQ').all_coeffs()]
+    except Exception:
+        raise ValueError("정확한 유리수 모드는 유리수 계수의 사칙연산과 정수 거듭제곱으로 된 점화식에서만 사용할 수 있습니다.")
+
+    def horner(coeffs, v):
+        result = Fraction(0)
+        for c in coeffs:
+            result = result * v + c
+        return result
+
+    # 다항식 차수만큼 항의 비트 수가 곱절로 늘어남 (예: p**2 는 매 항 두 배)
+    growth = max(len(num_coeffs), len(den_coeffs), 2) - 1
+    current = Fraction(str(first_term))
+    terms = [current]
+    for _ in range(1, num_terms):
+        if growth * (current.numerator.bit_length() + current.denominator.bit_length()) > max_bits:
+            return terms, "bits"
+        den = horner(den_coeffs, current)
+        if den == 0:
+            return terms, "zero"
+        current = horner(num_coeffs, current) / den
+        terms.append(current)
+    return terms, None
+
+
+def fraction_to_float(value):
+    """Fraction을 float로 바꿉니다. float 범위를 넘으면 inf입니다."""
+    try:
+        return float(value)
+    except OverflowError:
+        return float('inf') if value > 0 else float('-inf')
+
+
+def fraction_latex(value):
+    """
+    Fraction을 LaTeX로 바꿉니다. 분자나 분모가 EXACT_DISPLAY_DIGITS자리를 넘으면 str() 대신
+    (int → str 자릿수 제한에 걸리지 않도록) 로그로 구한 근삿값과 자릿수만 보여 줍니다.
+    """
+    sign = "-" if value < 0 else ""
+    num, den = abs(value.numerator), value.denominator
+    num_digits = int(num.bit_length() * math.log10(2)) + 1
+    den_digits = int(den.bit_length() * math.log10(2)) + 1
+    if max(num_digits, den_digits) <= EXACT_DISPLAY_DIGITS:
+        return f"{sign}{num}" if den == 1 else f"{sign}\\frac{{{num}}}{{{den}}}"
+    if num == 0:
+        return "0"
+    exponent = math.log10(num) - math.log10(den)
+    mantissa = 10 ** (exponent - math.floor(exponent))
+    size = f"분자 약 {num_digits}자리" + ("" if den == 1 else f", 분모 약 {den_digits}자리")
+    return f"{sign}{mantissa:.6f} \\times 10^{{{math.floor(exponent)}}} \\quad (\\text{{{size}}})"
+
+
+def sequence_frame(values):
+    """같은 배열에서 부분합과 이웃한 항의 비를 함께 계산한 표를 만듭니다."""
+    with np.errstate(all='ignore'):
+        ratios = np.full(values.shape, np.nan)
+        ratios[1:] = values[1:] / values[:-1]
+    return pd.DataFrame({
+        '항 (n)': np.arange(1, len(values) + 1),
+        '값 (a_n)': values,
+        '부분합 (S_n)': np.cumsum(values),
+        '비 (a_n / a_(n-1))': ratios,
+    })
+
+
+def display_results(values, exact_terms=None):
+    """계산된 수열의 항, 그래프, 부분합과 수렴 진단을 화면에 출력하는 함수"""
+    if len(values) == 0:
         st.warning("계산된 수열이 없습니다.")
         return
 
+    finite = np.isfinite(values)
+    if not finite.all():
+        first = int(finite.argmin())
+        if exact_terms is not None and first < len(exact_terms):
+            st.warning(f"{first + 1}번째 항부터는 값이 소수(float) 범위를 넘어 그래프와 표에는 inf로 표시됩니다.")
+        else:
+            st.warning(f"{first + 1}번째 항부터 값이 너무 크거나 정의되지 않아 계산을 멈췄습니다.")
+
     st.subheader("🔢 수열의 항")
+    if len(values) > DISPLAY_TERMS:
+        st.caption(f"앞의 {DISPLAY_TERMS}개 항만 수식으로 보여 줍니다. 전체 항은 아래 표에서 확인하세요.")
     # 한 줄에 4개씩 항을 보여주기 위해 컬럼 사용
     cols = st.columns(4)
-    for i, term in enumerate(terms_list):
+    # 정확한 항 뒤에 소수로 이어서 계산한 항이 있으면 함께 보여 줌
+    shown = list(exact_terms) + list(values[len(exact_terms):]) if exact_terms is not None else values
+    for i, term in enumerate(shown[:DISPLAY_TERMS]):
         with cols[i % 4]:
-            st.latex(f"a_{{{i+1}}} = {term}")
+            if isinstance(term, Fraction):
+                text = fraction_latex(term)
+            else:
+                text = f"{term:.10g}"
+            st.latex(f"a_{{{i+1}}} = {text}")
 
-    st.subheader("📈 수열 그래프")
-    
-    # 데이터프레임 생성
-    n_values = list(range(1, len(terms_list) + 1))
-    df = pd.DataFrame({
-        '항 (n)': n_values,
-        '값 (a_n)': terms_list
-    })
+    df = sequence_frame(values)
 
+    st.subheader("📈 수열 그래프")
     # Matplotlib을 사용한 그래프 생성
     fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(df['항 (n)'], df['값 (a_n)'], marker='o', linestyle='-', color='b')
+    if len(values) <= MARKER_LIMIT:
+        ax.plot(df['항 (n)'], df['값 (a_n)'], marker='o', linestyle='-', color='b')
+        ax.set_xticks(df['항 (n)'])  # x축 눈금을 정수로 표시
+    else:
+        ax.plot(df['항 (n)'], df['값 (a_n)'], linestyle='-', color='b', linewidth=1)
     ax.set_title('수열의 시각화', fontsize=16)
     ax.set_xlabel('항 (n)', fontsize=12)
     ax.set_ylabel('값 (a_n)', fontsize=12)
     ax.grid(True)
-    ax.set_xticks(n_values)  # x축 눈금을 정수로 표시
 
     st.pyplot(fig)
+    plt.close(fig)
+
+    # --- 부분합과 수렴 진단 ---
+    st.subheader("🧮 부분합과 수렴 진단")
+    last = df.iloc[int(np.flatnonzero(finite)[-1])] if finite.any() else df.iloc[-1]
+    col1, col2, col3 = st.columns(3)
+    col1.metric(f"마지막 항 a_{int(last['항 (n)'])}", f"{last['값 (a_n)']:.6g}")
+    col2.metric(f"부분합 S_{int(last['항 (n)'])}", f"{last['부분합 (S_n)']:.6g}")
+    col3.metric("마지막 항의 비", f"{last['비 (a_n / a_(n-1))']:.6g}")
+
+    finite_values = values[finite]
+    if len(finite_values) >= 2:
+        tail = finite_values[-max(2, len(finite_values) // 10):]
+        spread = float(np.ptp(tail))
+        scale = max(1.0, float(np.abs(tail[-1])))
+        if spread <= 1e-6 * scale:
+            st.success(f"뒤쪽 항들이 거의 변하지 않습니다. 수열이 약 {tail[-1]:.6g}(으)로 수렴하는 것으로 보입니다.")
+        elif np.all(np.diff(np.abs(tail)) > 0) and abs(tail[-1]) > 1e6:
+            st.info("뒤쪽 항들의 절댓값이 계속 커지고 있습니다. 수열이 발산하는 것으로 보입니다.")
+        else:
+            st.info(f"뒤쪽 10% 항들의 변동 폭: {spread:.6g}")
+
+    with st.expander("전체 항, 부분합, 비 보기"):
+        st.dataframe(df, hide_index=True, use_container_width=True)
 
 
 # --- Streamlit 앱 UI ---
@@ -95,7 +230,7 @@ with tab1:
     num_terms_general = st.number_input(
         "몇 번째 항까지 구할까요?",
         min_value=1,
-        max_value=100,
+        max_value=MAX_TERMS,
         value=10,
         key="num_general"
     )
@@ -113,8 +248,7 @@ with tab1:
                 if not expr.has(n):
                     st.error("입력하신 일반항에 변수 'n'이 포함되어 있는지 확인해 주세요.")
                 else:
-                    sequence = [float(expr.subs(n, i)) for i in range(1, num_terms_general + 1)]
-                    display_results(sequence)
+                    display_results(general_term_values(expr, n, int(num_terms_general)))
 
             except Exception as e:
                 st.error(f"수식 오류: 올바른 형식인지 확인해 주세요. (오류: {e})")
@@ -138,10 +272,15 @@ with tab2:
         num_terms_recurrence = st.number_input(
             "몇 번째 항까지 구할까요?",
             min_value=2,
-            max_value=100,
+            max_value=MAX_TERMS,
             value=10,
             key="num_recurrence"
         )
+        exact_mode = st.checkbox(
+            f"정확한 유리수로 계산 (최대 {EXACT_MAX_TERMS}항)",
+            key="exact_recurrence",
+            help="사칙연산과 정수 거듭제곱으로 된 점화식을 분수 그대로 계산합니다. 첫째항은 입력한 소수를 분수로 바꿔 사용합니다."
+        )
     
         recurrence_relation_latex = st.text_input(
             "점화식을 LaTeX 수식으로 입력하세요.",
@@ -162,14 +301,26 @@ with tab2:
                 if not expr.has(a_prev):
                     st.error("입력하신 점화식에 이전 항 변수 'p'가 포함되어 있는지 확인해 주세요.")
                 else:
-                    sequence = [first_term_input]
-                    current_val = first_term_input
-                    
-                    for i in range(2, num_terms_recurrence + 1):
-                        current_val = expr.subs(a_prev, current_val)
-                        sequence.append(float(current_val))
-                    
-                    display_results(sequence)
+                    if exact_mode:
+                        num_terms = int(num_terms_recurrence)
+                        terms, stop = exact_recurrence_values(expr, a_prev, first_term_input,
+                                                              min(num_terms, EXACT_MAX_TERMS))
+                        values = np.array([fraction_to_float(t) for t in terms])
+                        if stop == "zero":
+                            st.warning(f"{len(terms) + 1}번째 항에서 분모가 0이 되어 계산을 멈췄습니다.")
+                        elif len(terms) < num_terms:
+                            # 크기·항 수 제한에 걸리면 마지막 정확한 항에서 소수 계산으로 이어서 구함
+                            if stop == "bits":
+                                st.warning(f"{len(terms) + 1}번째 항부터는 분자·분모가 너무 커져"
+                                           f"(약 {EXACT_MAX_BITS:,}비트 초과) 소수로 이어서 계산했습니다.")
+                            else:
+                                st.warning(f"정확한 유리수 모드는 {EXACT_MAX_TERMS:,}항까지만 계산하므로 "
+                                           f"{EXACT_MAX_TERMS + 1:,}번째 항부터는 소수로 이어서 계산했습니다.")
+                            rest = recurrence_values(expr, a_prev, values[-1], num_terms - len(terms) + 1)
+                            values = np.concatenate([values, rest[1:]])
+                        display_results(values, exact_terms=terms)
+                    else:
+                        display_results(recurrence_values(expr, a_prev, first_term_input, int(num_terms_recurrence)))
 
             except Exception as e:
                 st.error(f"수식 오류: 올바른 형식인지 확인해 주세요. (오류: {e})")
@@ -1,41 +1,18 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from io import BytesIO
-from fpdf import FPDF
 import base64
 import os
-import urllib.request
-
-# 도움: 작업공간에 한글 TTF가 없으면 공용 raw GitHub에서 NanumGothic.ttf를 자동으로 내려받습니다.
-def ensure_nanum_font():
-    font_path = os.path.join(os.getcwd(), 'NanumGothic.ttf')
-    if os.path.exists(font_path):
-        return font_path
-    # 후보 URL 목록: 실패할 수 있으므로 여러 URL을 시도
-    candidate_urls = [
-        'https://github.com/naver/nanumfont/raw/master/TTF/NanumGothic.ttf',
-        'https://github.com/naver/nanumfont/raw/main/TTF/NanumGothic.ttf',
-        'https://github.com/naver/nanumfont/raw/master/Fonts/NanumGothic.ttf',
-        'https://raw.githubusercontent.com/kimhyuntae99/nanumfont/main/NanumGothic.ttf'
-    ]
-    for url in candidate_urls:
-        try:
-            urllib.request.urlretrieve(url, font_path)
-            # quick check
-            if os.path.exists(font_path) and os.path.getsize(font_path) > 1000:
-                return font_path
-        except Exception:
-            continue
-    return None
 
-# 시도: 초기 로드 시 폰트가 없으면 받아보자 (실패해도 앱은 계속 동작)
-try:
-    ensure_nanum_font()
-except Exception:
-    pass
+# 한글 PDF 출력에는 저장소에 포함된 static/fonts/NanumGothic-Regular.ttf를 사용합니다 (네트워크 사용 안 함).
+from utils.fonts import font_path as bundled_font_path
+from utils.lazy import lazy_import
+
+# 무거운 모듈은 해당 기능(차트, 회귀분석, PDF 만들기)이 실제로 실행될 때 불러옴
+px = lazy_import("plotly.express")
+sm = lazy_import("statsmodels.api")
+fpdf = lazy_import("fpdf")
 
 
 # Callback helper: compute correlation and regression and store results in session_state
@@ -90,21 +67,22 @@ def compute_corrreg_callback():
 
 # PDF 생성 헬퍼 함수
 def create_pdf_bytes(student_name: str, plan_text: str, summary: dict, mix_summary: dict, include_chart_bytes: bytes=None) -> bytes:
-    pdf = FPDF()
+    pdf = fpdf.FPDF()
     pdf.add_page()
 
-    # 한글 폰트 시도: 작업공간에 NanumGothic.ttf가 있으면 등록
+    # 한글 폰트 시도: 저장소의 NanumGothic을 우선 등록하고, 없으면 작업공간의 TTF를 찾음
     have_unicode_font = False
     try:
         import os
         # 우선순위로 찾을 파일명들
         cand_names = ['NanumGothic.ttf', 'NotoKR.ttf', 'NotoSansKR-Regular.ttf']
-        font_path = None
-        for fn in cand_names:
-            p = os.path.join(os.getcwd(), fn)
-            if os.path.exists(p):
-                font_path = p
-                break
+        font_path = bundled_font_path()
+        if font_path is None:
+            for fn in cand_names:
+                p = os.path.join(os.getcwd(), fn)
+                if os.path.exists(p):
+                    font_path = p
+                    break
         # 찾지 못하면 작업공간의 .ttf 파일을 하나 시도(업로드한 폰트가 있을 수 있음)
         if font_path is None:
             for f in os.listdir(os.getcwd()):
@@ -198,17 +176,6 @@ def create_pdf_bytes(student_name: str, plan_text: str, summary: dict, mix_summa
 # 샘플 건강 데이터 생성
 
 
-import streamlit as st
-import pandas as pd
-import numpy as np
-
-import plotly.express as px
-import statsmodels.api as sm
-import matplotlib.pyplot as plt
-from io import BytesIO
-from fpdf import FPDF
-import base64
-
 st.set_page_config(page_title="BioData View", layout="centered")
 st.title("🏃‍♂️ BioData View - 건강데이터 분석")
 st.write("운동량(운동거리, 칼로리), 키, 체중, BMI를 입력하거나 템플릿으로 업로드하여 기술통계, 상관분석, 회귀분석, 시각화를 할 수 있는 앱입니다.")
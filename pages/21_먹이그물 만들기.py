@@ -1,20 +1,12 @@
 import streamlit as st
 import networkx as nx
 import matplotlib.pyplot as plt
-import os
-from matplotlib import font_manager
+
+from utils.fonts import font_properties, use_korean_font
 
 # --- matplotlib 한글 폰트 설정 ---
-# 시스템에 맑은 고딕(Malgun Gothic)이 있는 경우 사용하거나, 
-# 없다면 기본 sans-serif 폰트 중 한글을 지원하는 폰트를 사용하도록 설정
-try:
-    # 윈도우 사용자에게 가장 흔한 폰트
-    plt.rcParams['font.family'] = 'Malgun Gothic'
-except:
-    # 맑은 고딕이 없는 경우 (예: 리눅스/맥 환경) 대비
-    plt.rcParams['font.family'] = 'sans-serif'
-    
-plt.rcParams['axes.unicode_minus'] = False # 마이너스 폰트 깨짐 방지
+# 저장소의 static/fonts/NanumGothic-*.ttf를 프로세스당 한 번만 등록해 사용
+use_korean_font()
 # ---------------------------------
 
 # --- 1. 공통 데이터 및 초기화 ---
@@ -82,14 +74,10 @@ def draw_current_ecosystem(nodes, edges, title):
     nx.draw_networkx_nodes(G, pos, node_color=colors, node_size=4000, alpha=0.9)
     nx.draw_networkx_edges(G, pos, edge_color="gray", arrowsize=30, width=2)
     
-    # 서버측 이미지 렌더링에서 한글을 보이게 하기 위해 로컬 TTF를 FontProperties로 직접 사용
-    font_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "fonts", "NanumGothic-Regular.ttf"))
-    
-    # *** (수정 1) fp를 None으로 초기화 ***
-    fp = None 
+    # 서버측 이미지 렌더링에서 한글을 보이게 하기 위해 로컬 TTF를 FontProperties로 직접 사용 (없으면 None)
+    fp = font_properties()
     
-    if os.path.exists(font_path):
-        fp = font_manager.FontProperties(fname=font_path)
+    if fp is not None:
         for n, label in labels.items():
             x, y = pos[n]
             ax.text(x, y, label, fontproperties=fp, fontsize=12, ha='center', va='center')
@@ -6,6 +6,8 @@ import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from pandas.io.formats.style import Styler  # pandas Styler 명시 import
 
+from utils.figures import cached_pyplot
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Page config + Global style
 # ─────────────────────────────────────────────────────────────────────────────
@@ -203,6 +205,7 @@ EPS = 1e-6             # st.columns 가 0을 허용하지 않으므로 아주 
 PAD_LEFT  = EPS        # 버튼쪽 좌우 패딩
 PAD_RIGHT = EPS
 
+# 트랙 그림은 utils.figures.cached_pyplot으로 그려, 같은 파형이면 렌더링된 PNG를 다시 사용합니다.
 def plot_track(values, n, color="#3B82F6"):
     fig = plt.figure(figsize=(7.2, 1.15))
     t = np.arange(n)
@@ -303,7 +306,7 @@ else:
     with col_lab:
         st.markdown("### A")
     with col_body:
-        st.pyplot(plot_track(np.array(st.session_state.A_seq), n, color="#3B82F6"), use_container_width=True)
+        cached_pyplot(plot_track, np.array(st.session_state.A_seq), n, color="#3B82F6")
         st.session_state.A_seq = render_toggle_row(st.session_state.A_seq, n, "tl_A", emoji_on="🔵", emoji_off="⚪")
 
     # B 행
@@ -311,7 +314,7 @@ else:
     with col_lab:
         st.markdown("### B")
     with col_body:
-        st.pyplot(plot_track(np.array(st.session_state.B_seq), n, color="#F59E0B"), use_container_width=True)
+        cached_pyplot(plot_track, np.array(st.session_state.B_seq), n, color="#F59E0B")
         st.session_state.B_seq = render_toggle_row(st.session_state.B_seq, n, "tl_B", emoji_on="🟠", emoji_off="⚪")
 
     # Y 행 (계산 결과)
@@ -323,6 +326,6 @@ else:
     with col_lab:
         st.markdown("### Y")
     with col_body:
-        st.pyplot(plot_track(Y_w, n, color="#22C55E"), use_container_width=True)
+        cached_pyplot(plot_track, Y_w, n, color="#22C55E")
 
     st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
@@ -1,24 +1,18 @@
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import matplotlib
-import os
-import io
 from datetime import datetime
 
+from utils.figures import cached_figure, cached_pyplot
+from utils.fonts import font_properties, use_korean_font
+
 # -------------------------------
-# ✅ 한글 폰트 설정 (NanumGothic 사용)
+# ✅ 한글 폰트 설정 (NanumGothic 사용, 프로세스당 한 번만 등록)
 # -------------------------------
-font_path = os.path.join("fonts", "NanumGothic-Regular.ttf")
-if os.path.exists(font_path):
-    fm.fontManager.addfont(font_path)
-    fontprop = fm.FontProperties(fname=font_path)
-    plt.rcParams['font.family'] = 'NanumGothic'
-    matplotlib.rc('font', family='NanumGothic-Regular')
-else:
-    fontprop = None
-    st.warning("⚠️ 폰트 파일이 없습니다. 'fonts/NanumGothic-Regular.ttf' 경로에 폰트를 추가하세요.")
+use_korean_font()
+fontprop = font_properties()
+if fontprop is None:
+    st.warning("⚠️ 폰트 파일이 없습니다. 'static/fonts/NanumGothic-Regular.ttf' 경로에 폰트를 추가하세요.")
 
 # -------------------------------
 # ✅ 페이지 설정
@@ -72,15 +66,23 @@ df["이름"] = student_name
 # -------------------------------
 st.subheader("에너지 발전량 추이 그래프")
 
-fig, ax = plt.subplots(figsize=(8, 5))
-for e in energy_types:
-    ax.plot(df[df["에너지"] == e]["연도"], df[df["에너지"] == e]["발전량"], marker='o', label=e)
+def plot_energy(ax, df, energy_types):
+    for e in energy_types:
+        ax.plot(df[df["에너지"] == e]["연도"], df[df["에너지"] == e]["발전량"], marker='o', label=e)
+    ax.set_xlabel("연도", fontproperties=fontprop)
+    ax.set_ylabel("발전량(천kW)", fontproperties=fontprop)
+    ax.set_title("에너지 발전량 추이", fontproperties=fontprop)
+    ax.legend(prop=fontprop)
+
 
-ax.set_xlabel("연도", fontproperties=fontprop)
-ax.set_ylabel("발전량(천kW)", fontproperties=fontprop)
-ax.set_title("에너지 발전량 추이", fontproperties=fontprop)
-ax.legend(prop=fontprop)
-st.pyplot(fig)
+def draw_energy_chart(df, energy_types):
+    fig, ax = plt.subplots(figsize=(8, 5))
+    plot_energy(ax, df, energy_types)
+    return fig
+
+
+# 입력 표가 바뀌지 않았으면 렌더링된 이미지를 다시 사용
+cached_pyplot(draw_energy_chart, df, energy_types)
 
 # -------------------------------
 # ✅ 개인 생각 작성 섹션
@@ -126,48 +128,44 @@ else:
 st.markdown("---")
 st.subheader("전체 결과 저장 (입력 + 그래프 + 생각 요약)")
 
-fig_all, axs = plt.subplots(2, 2, figsize=(16, 10))
-
-# 1️⃣ 학생 정보
-axs[0, 0].axis('off')
-student_info = f"학번: {student_id}\n이름: {student_name}\n날짜: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-axs[0, 0].text(0, 1, student_info, fontsize=16, va='top', fontproperties=fontprop)
-
-# 2️⃣ 입력 데이터 표
-axs[0, 1].axis('off')
-table_data = [edited_df.columns.tolist()] + edited_df.values.tolist()
-table = axs[0, 1].table(cellText=table_data, loc='center', cellLoc='center', colWidths=[0.15]*len(edited_df.columns))
-table.auto_set_font_size(False)
-table.set_fontsize(12)
-table.scale(1, 2)
-axs[0, 1].set_title('입력 데이터', fontsize=14, fontproperties=fontprop)
-for key, cell in table.get_celld().items():
-    cell.get_text().set_fontproperties(fontprop)
-
-# 3️⃣ 발전량 그래프
-for e in energy_types:
-    axs[1, 0].plot(df[df["에너지"] == e]["연도"], df[df["에너지"] == e]["발전량"], marker='o', label=e)
-axs[1, 0].set_xlabel("연도", fontproperties=fontprop)
-axs[1, 0].set_ylabel("발전량(천kW)", fontproperties=fontprop)
-axs[1, 0].set_title("에너지 발전량 추이", fontproperties=fontprop)
-axs[1, 0].legend(prop=fontprop)
-
-# 4️⃣ 학생 생각 요약
-axs[1, 1].axis('off')
-thoughts = f"① {q1}\n\n② {q2}\n\n③ {q3}"
-axs[1, 1].text(0, 1, thoughts, fontsize=12, va='top', fontproperties=fontprop)
-axs[1, 1].set_title('생각 정리', fontsize=14, fontproperties=fontprop)
-
-# JPG 다운로드
-img_buf = io.BytesIO()
-fig_all.savefig(img_buf, format='jpeg', bbox_inches='tight')
-img_buf.seek(0)
-st.download_button("📸 전체 결과 JPG 다운로드", data=img_buf, file_name="energy_result.jpg", mime="image/jpeg")
-
-# PDF 다운로드
-pdf_buf = io.BytesIO()
-fig_all.savefig(pdf_buf, format='pdf', bbox_inches='tight')
-pdf_buf.seek(0)
-st.download_button("📄 전체 결과 PDF 다운로드", data=pdf_buf, file_name="energy_result.pdf", mime="application/pdf")
-
-st.caption("※ NanumGothic 폰트를 /fonts 폴더에 넣으면 한글 깨짐 없이 출력됩니다.")
\ No newline at end of file
+def draw_summary(student_id, student_name, created, edited_df, df, energy_types, q1, q2, q3):
+    fig_all, axs = plt.subplots(2, 2, figsize=(16, 10))
+
+    # 1️⃣ 학생 정보
+    axs[0, 0].axis('off')
+    student_info = f"학번: {student_id}\n이름: {student_name}\n날짜: {created}"
+    axs[0, 0].text(0, 1, student_info, fontsize=16, va='top', fontproperties=fontprop)
+
+    # 2️⃣ 입력 데이터 표
+    axs[0, 1].axis('off')
+    table_data = [edited_df.columns.tolist()] + edited_df.values.tolist()
+    table = axs[0, 1].table(cellText=table_data, loc='center', cellLoc='center', colWidths=[0.15]*len(edited_df.columns))
+    table.auto_set_font_size(False)
+    table.set_fontsize(12)
+    table.scale(1, 2)
+    axs[0, 1].set_title('입력 데이터', fontsize=14, fontproperties=fontprop)
+    for key, cell in table.get_celld().items():
+        cell.get_text().set_fontproperties(fontprop)
+
+    # 3️⃣ 발전량 그래프
+    plot_energy(axs[1, 0], df, energy_types)
+
+    # 4️⃣ 학생 생각 요약
+    axs[1, 1].axis('off')
+    thoughts = f"① {q1}\n\n② {q2}\n\n③ {q3}"
+    axs[1, 1].text(0, 1, thoughts, fontsize=12, va='top', fontproperties=fontprop)
+    axs[1, 1].set_title('생각 정리', fontsize=14, fontproperties=fontprop)
+    return fig_all
+
+
+# JPG와 PDF를 한 번에 렌더링하고, 입력이 같으면 캐시된 바이트를 그대로 사용
+img_bytes, pdf_bytes = cached_figure(
+    draw_summary, student_id, student_name, datetime.now().strftime('%Y-%m-%d %H:%M'),
+    edited_df, df, energy_types, q1, q2, q3,
+    formats=("jpeg", "pdf"), savefig_kwargs={"dpi": "figure"},
+)
+
+st.download_button("📸 전체 결과 JPG 다운로드", data=img_bytes, file_name="energy_result.jpg", mime="image/jpeg")
+st.download_button("📄 전체 결과 PDF 다운로드", data=pdf_bytes, file_name="energy_result.pdf", mime="application/pdf")
+
+st.caption("※ NanumGothic 폰트를 static/fonts 폴더에 넣으면 한글 깨짐 없이 출력됩니다.")
\ No newline at end of file
@@ -1,8 +1,9 @@
 import streamlit as st
-import base64
 from pathlib import Path
 import re
 
+from utils.fonts import FONT_FAMILY, font_face_css
+
 # --- Page settings and custom CSS ---
 st.set_page_config(
     page_title="자동차 전기전자 학습",
@@ -12,85 +13,26 @@ st.set_page_config(
 
 # CSS code to change the app's color theme and font
 def load_css():
-    # Load local fonts from the fonts/ directory and embed them as base64 so Streamlit uses them.
-    fonts_dir = Path(__file__).parent / "fonts"
-
-    font_face_css = ""
-    discovered_families = []
-    primary_family = None
-
-    # 폰트 Base64 인코딩 함수 (로컬 파일 접근 실패 시 무시됨)
-    def font_data_uri(font_path: Path):
-        try:
-            font_bytes = font_path.read_bytes()
-            b64 = base64.b64encode(font_bytes).decode()
-            suffix = font_path.suffix.lower().lstrip('.')
-            fmt = 'truetype' if suffix == 'ttf' else ('opentype' if suffix == 'otf' else suffix)
-            return f"data:font/{suffix};base64,{b64}", fmt
-        except Exception:
-            return None, None
-
-    # 로컬 폰트 검색 및 Base64 인코딩 시도
-    if fonts_dir.exists() and fonts_dir.is_dir():
-        font_files = list(fonts_dir.glob('*.ttf')) + list(fonts_dir.glob('*.otf'))
-        font_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        for font_path in font_files:
-            uri, fmt = font_data_uri(font_path)
-            if not uri:
-                continue
-            
-            stem = font_path.stem
-            name_with_spaces = re.sub(r'[_\-]+', ' ', stem).strip()
-            family = re.sub(r'(?i)\b(?:regular|bold|extrabold|heavy|black|semibold|demi|light|italic|oblique)\b', '', name_with_spaces).strip()
-            family = re.sub(r'\s{2,}', ' ', family)
-            
-            weight = 400
-            lower = stem.lower()
-            if 'extrabold' in lower or 'heavy' in lower or 'black' in lower:
-                weight = 800
-            elif 'bold' in lower:
-                weight = 700
-            elif 'semibold' in lower or 'demi' in lower:
-                weight = 600
-            elif 'light' in lower:
-                weight = 300
-
-            font_face_css += (
-                f"@font-face {{font-family: '{family}'; src: url('{uri}') format('{fmt}'); "
-                f"font-weight: {weight}; font-style: normal; font-display: swap;}}\n"
-            )
-
-            if family not in discovered_families:
-                discovered_families.append(family)
-                if primary_family is None:
-                    primary_family = family
+    # Point @font-face rules at the bundled NanumGothic fonts served from static/fonts
+    # (server.enableStaticServing), so each rerun sends only a few hundred bytes of CSS.
+    font_face = font_face_css()
 
     # Google font를 Fallback 또는 주력으로 사용
     google_import = "@import url('https://fonts.googleapis.com/css2?family=Gothic+A1:wght@400;700&display=swap');"
 
-    # 폰트 패밀리 리스트 구성
-    if discovered_families:
-        ordered = []
-        if primary_family:
-            ordered.append(primary_family)
-        for f in discovered_families:
-            if f not in ordered:
-                ordered.append(f)
+    if font_face:
         # 💡 안정화: 로컬 폰트 -> Gothic A1 -> sans-serif 순서
-        css_font_family = ', '.join([f"'{f}'" for f in ordered]) + ", 'Gothic A1', sans-serif"
+        css_font_family = f"'{FONT_FAMILY}', 'Gothic A1', sans-serif"
+        primary_css_family = f"'{FONT_FAMILY}'"
     else:
         # 💡 웹 환경에서 로컬 폰트 로드 실패 시: Gothic A1이 주력
         css_font_family = "'Gothic A1', sans-serif"
-        
-    if primary_family:
-        primary_css_family = f"'{primary_family}'"
-    else:
         primary_css_family = "'Gothic A1'" # Gothic A1을 타이틀 기본 폰트로 설정
 
     st.markdown(f"""
     <style>
         {google_import}
-        {font_face_css}
+        {font_face}
 
         /* Apply the font to the entire app (broad selectors to cover all elements) */
         html, body, [class*="st-"], [data-testid], div, span, p, li, a, button, input, textarea, label {{
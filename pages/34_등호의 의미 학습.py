@@ -3,7 +3,9 @@ import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 import random
 import time
-import os
+
+from utils.figures import cached_pyplot
+from utils.fonts import font_properties
 
 st.set_page_config(page_title="등호의 의미 배우기", layout="centered")
 
@@ -112,11 +114,7 @@ elif st.session_state.step == 2:
     # 시소 그리기 함수
     def draw_seesaw(left_total, right_total, left_nums, right_nums):
         # 폰트 설정
-        font_path = os.path.join(os.path.dirname(__file__), '..', 'fonts', 'NanumGothic-Bold.ttf')
-        if os.path.exists(font_path):
-            font_prop = fm.FontProperties(fname=font_path)
-        else:
-            font_prop = fm.FontProperties()
+        font_prop = font_properties("Bold") or fm.FontProperties()
         
         fig, ax = plt.subplots(figsize=(8, 5))
         
@@ -153,9 +151,8 @@ elif st.session_state.step == 2:
         
         return fig
 
-    # 시소 그리기
-    fig = draw_seesaw(left_total, right_total, [left1, left2], [right1, right2])
-    st.pyplot(fig)
+    # 시소 그리기 (같은 숫자 조합이면 렌더링된 이미지를 다시 사용)
+    cached_pyplot(draw_seesaw, left_total, right_total, [left1, left2], [right1, right2])
 
     # --- 확장 설명 ---
     st.write("---")
@@ -3,11 +3,12 @@ import streamlit as st
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import Wedge
-from matplotlib.font_manager import FontProperties
 import numpy as np
 import os
 import base64
 
+from utils.fonts import font_properties
+
 st.set_page_config(page_title="나는야 야구 스카우터!: 강한 팀을 만들어라", page_icon="⚾", layout="centered")
 
 # 페이지 전반 색감 및 버튼/컨테이너 스타일을 야구 느낌으로 개선
@@ -148,23 +149,8 @@ def generate_candidates(n=18):
 
 def draw_baseball_field(team_players):
     """야구 경기장에 선수 이름을 배치한 그림 생성"""
-    # 사용자 폰트 로드: 우선적으로 프로젝트의 fonts/NanumGothic-Regular.ttf 사용
-    font_prop = None
-    try:
-        fonts_dir = os.path.join(os.getcwd(), "fonts")
-        # 우선 지정된 NanumGothic 파일을 찾는다
-        preferred = os.path.join(fonts_dir, "NanumGothic-Regular.ttf")
-        if os.path.isfile(preferred):
-            font_prop = FontProperties(fname=preferred)
-        else:
-            # 지정된 파일이 없으면 폴더의 첫번째 ttf/otf를 시도
-            if os.path.isdir(fonts_dir):
-                ttf_files = [f for f in os.listdir(fonts_dir) if f.lower().endswith((".ttf", ".otf"))]
-                if ttf_files:
-                    font_path = os.path.join(fonts_dir, ttf_files[0])
-                    font_prop = FontProperties(fname=font_path)
-    except Exception:
-        font_prop = None
+    # 사용자 폰트 로드: 프로젝트의 static/fonts/NanumGothic-Regular.ttf 사용 (없으면 None)
+    font_prop = font_properties()
 
     fig, ax = plt.subplots(figsize=(10, 10))
     
@@ -70,51 +70,67 @@ def face_rect_fig(a, b, color, title=None):
     return fig
 
 
+def voxel_surface(filled):
+    """
+    채워진 단위 블록들(3차원 bool 배열, filled[x, y, z])의 겉에 드러난 면만 골라
+    (꼭짓점 좌표 배열 (m, 3), 삼각형 꼭짓점 번호 배열 (t, 3))을 반환합니다.
+
+    블록끼리 맞닿아 안쪽에 숨은 면은 만들지 않으므로 면의 수는 블록 수가 아니라 겉넓이에 비례하고,
+    같은 자리의 꼭짓점은 하나로 합칩니다. 모든 계산은 NumPy 배열 연산으로 한 번에 합니다.
+    """
+    filled = np.asarray(filled, dtype=bool)
+    size = np.array(filled.shape)
+    padded = np.pad(filled, 1)
+    inner = (slice(1, -1),) * 3
+    quads = []
+    for axis in range(3):
+        # 면의 네 꼭짓점은 axis에 수직인 두 축 u, v 방향으로 (0,0) (1,0) (1,1) (0,1) — u×v = axis 방향
+        u, v = np.eye(3, dtype=np.int64)[[(axis + 1) % 3, (axis + 2) % 3]]
+        corners = np.stack([0 * u, u, u + v, v])
+        for sign in (1, -1):
+            neighbour = np.roll(padded, -sign, axis=axis)[inner]
+            cells = np.argwhere(filled & ~neighbour)
+            if sign > 0:
+                cells[:, axis] += 1   # + 쪽 면은 블록의 반대편 경계에 있음
+                quads.append(cells[:, None, :] + corners[None, :, :])
+            else:
+                # - 쪽 면은 바깥을 보도록 꼭짓점 순서를 뒤집음
+                quads.append(cells[:, None, :] + corners[None, ::-1, :])
+    quads = np.concatenate(quads)   # (면 수, 4, 3)
+    if len(quads) == 0:
+        return np.empty((0, 3), dtype=np.int64), np.empty((0, 3), dtype=np.int64)
+
+    # 꼭짓점 좌표를 번호 하나로 바꿔 중복을 합침
+    lattice = size + 1
+    ids = np.ravel_multi_index(quads.reshape(-1, 3).T, lattice)
+    unique_ids, index = np.unique(ids, return_inverse=True)
+    vertices = np.column_stack(np.unravel_index(unique_ids, lattice))
+    index = index.reshape(-1, 4)
+    triangles = np.concatenate([index[:, [0, 1, 2]], index[:, [0, 2, 3]]])
+    return vertices, triangles
+
+
+def voxel_mesh(filled):
+    """voxel_surface로 만든 겉면을 Plotly Mesh3d 하나로 만듭니다."""
+    vertices, triangles = voxel_surface(filled)
+    if len(triangles) == 0:
+        # empty mesh: return a very small invisible mesh to avoid plotly errors
+        return go.Mesh3d(x=[0], y=[0], z=[0], i=[0], j=[0], k=[0], opacity=0)
+    x, y, z = vertices.astype(np.int16).T
+    i, j, k = triangles.astype(np.int32).T
+    return go.Mesh3d(x=x, y=y, z=z, i=i, j=j, k=k, color='#a0a0ff', opacity=0.95)
+
+
 def cube_mesh_for_unit_cubes(w, d, h):
-    faces = faces_from_vertices()
-    all_x, all_y, all_z = [], [], []
-    i_list, j_list, k_list = [], [], []
-    tri_offset = 0
-    for xi in range(int(w)):
-        for yi in range(int(d)):
-            for zi in range(int(h)):
-                v = cube_vertices(1, 1, 1, offset=(xi, yi, zi))
-                x, y, z = v.T
-                all_x.extend(x.tolist())
-                all_y.extend(y.tolist())
-                all_z.extend(z.tolist())
-                for t in faces:
-                    i_list.append(int(t[0] + tri_offset))
-                    j_list.append(int(t[1] + tri_offset))
-                    k_list.append(int(t[2] + tri_offset))
-                tri_offset += 8
-    return go.Mesh3d(x=all_x, y=all_y, z=all_z, i=i_list, j=j_list, k=k_list, color='#a0a0ff', opacity=0.95)
+    return voxel_mesh(np.ones((int(w), int(d), int(h)), dtype=bool))
 
 
 def cube_mesh_for_unit_cubes_layers(w, d, h, upto_layer):
     """Build a mesh containing unit-cubes only up to the given layer (1..h)."""
-    faces = faces_from_vertices()
-    all_x, all_y, all_z = [], [], []
-    i_list, j_list, k_list = [], [], []
-    tri_offset = 0
     upto = max(0, min(int(upto_layer), int(h)))
-    for xi in range(int(w)):
-        for yi in range(int(d)):
-            for zi in range(upto):
-                v = cube_vertices(1, 1, 1, offset=(xi, yi, zi))
-                x, y, z = v.T
-                all_x.extend(x.tolist())
-                all_y.extend(y.tolist())
-                all_z.extend(z.tolist())
-                for t in faces:
-                    i_list.append(int(t[0] + tri_offset))
-                    j_list.append(int(t[1] + tri_offset))
-                    k_list.append(int(t[2] + tri_offset))
-                tri_offset += 8
-    if not all_x:
-        # empty mesh: return a very small invisible mesh to avoid plotly errors
-        return go.Mesh3d(x=[0], y=[0], z=[0], i=[0], j=[0], k=[0], opacity=0)
-    return go.Mesh3d(x=all_x, y=all_y, z=all_z, i=i_list, j=j_list, k=k_list, color='#a0a0ff', opacity=0.95)
+    filled = np.zeros((int(w), int(d), int(h)), dtype=bool)
+    filled[:, :, :upto] = True
+    return voxel_mesh(filled)
 
 
 # NOTE: removed cube_mesh_for_unit_cubes_colored to revert surface-color grouping changes
@@ -130,9 +146,8 @@ with st.sidebar:
     w = st.number_input('가로 (width, 정수)', min_value=1, max_value=40, value=4, step=1)
     d = st.number_input('세로 (depth, 정수)', min_value=1, max_value=40, value=3, step=1)
     h = st.number_input('높이 (height, 정수)', min_value=1, max_value=40, value=2, step=1)
-    st.markdown('옵션: 단위 블록으로 쌓아 보여주기 (성능 제한 적용)')
+    st.markdown('옵션: 단위 블록으로 쌓아 보여주기')
     show_blocks = st.checkbox('단위 블록으로 쌓기 (1×1×1)', value=True)
-    max_render = st.slider('블록 렌더 최대 개수', min_value=64, max_value=8192, value=512, step=64)
 
 volume = int(w) * int(d) * int(h)
 base_area = int(w) * int(d)
@@ -191,21 +206,19 @@ st.subheader('3D 시각화')
 fig = go.Figure()
 add_cuboid_mesh(fig, w, d, h, origin=(0, 0, 0), face_colors=colors, opacity=0.5)
 
+# 블록 메시는 겉에 드러난 면만 만들므로 최대 크기(40×40×40)에서도 바로 그릴 수 있음
 if show_blocks:
-    if volume <= max_render:
-        # show a layer slider so learners can build the cuboid layer by layer
-        layers_to_show = st.slider('쌓을 레이어 수 (0 = 외피만)', min_value=0, max_value=int(h), value=int(h))
-        # produce colored surface-blocks for the shown range
-        if layers_to_show >= int(h):
-            mesh = cube_mesh_for_unit_cubes(w, d, h)
-            fig.add_trace(mesh)
-        else:
-            # for partial layers, color only blocks up to layer
-            partial = cube_mesh_for_unit_cubes_layers(w, d, h, upto_layer=layers_to_show)
-            fig.add_trace(partial)
-        st.caption('레이어 슬라이더로 블록이 위로 쌓이는 과정을 확인하세요.')
+    # show a layer slider so learners can build the cuboid layer by layer
+    layers_to_show = st.slider('쌓을 레이어 수 (0 = 외피만)', min_value=0, max_value=int(h), value=int(h))
+    # produce colored surface-blocks for the shown range
+    if layers_to_show >= int(h):
+        mesh = cube_mesh_for_unit_cubes(w, d, h)
+        fig.add_trace(mesh)
     else:
-        st.info(f'총 {volume}개의 블록은 렌더링하기에 너무 많습니다. 렌더 임계값: {max_render}개로 설정되어 있습니다.')
+        # for partial layers, color only blocks up to layer
+        partial = cube_mesh_for_unit_cubes_layers(w, d, h, upto_layer=layers_to_show)
+        fig.add_trace(partial)
+    st.caption('레이어 슬라이더로 블록이 위로 쌓이는 과정을 확인하세요.')
 
 fig.update_layout(scene=dict(
     xaxis=dict(title='width', visible=True),
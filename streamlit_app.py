@@ -4,44 +4,69 @@ from pathlib import Path
 
 BASE = Path(__file__).parent
 
-st.set_page_config(page_title="Streamlit Lecture Samples", page_icon="🎈", layout="wide")
 
-st.title("🎈 수업용 Streamlit 애플리케이션 예시 모음")
+def page_description(path: Path) -> str:
+    """페이지 파일에서 첫 번째 주석/문자열 설명 줄을 찾습니다. 설명 줄을 찾으면 나머지는 읽지 않습니다."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                s = line.strip()
+                if s.startswith('#'):
+                    return s.lstrip('# ').strip()
+                if s.startswith('"') or s.startswith("'"):
+                    # 간단한 문자열 리터럴로 된 설명
+                    return s.strip('"').strip("'")[:200]
+    except Exception:
+        pass
+    return "(설명 없음)"
+
+
+def display_name_of(filename: str) -> str:
+    """숫자_제목.py -> 제목 (언더스코어와 확장자 사이의 텍스트)"""
+    name = filename.split('_', 1)[1] if '_' in filename else filename
+    return name.rsplit('.', 1)[0] if '.' in name else name
 
-st.markdown("""
-    이 페이지는 수업·실습에서 사용할 수 있는 Streamlit 예제 페이지들을 모아둔 페이지입니다.            
-    Streamlit 애플리케이션을 개발할 때, **아이디어 탐색용**으로 활용하시길 바랍니다.            
-    왼쪽 사이드바에서 페이지를 선택하거나 아래 링크를 통해 웹 애플리케이션 원본으로 이동할 수 있습니다.
-    
-    본 페이지에 저장된 각 콘텐츠의 저작권은 **원작자**(콘텐츠마다 기재)에게 있으며, 예시용 페이지로 옮겨오는 과정에서 원본과 조금 다르게 표시될 수 있습니다.
-"""
-    
-)
 
-def discover_pages(pages_dir: Path):
-    """pages 디렉터리에서 .py 파일을 찾아 제목(파일명)과 첫 줄 설명을 추출합니다."""
-    pages = []
-    p_dir = pages_dir
-    if not p_dir.exists():
-        return pages
-    for p in sorted(p_dir.glob("*.py")):
-        try:
-            text = p.read_text(encoding="utf-8")
-        except Exception:
-            text = ""
-        # 파일에서 첫 번째 주석/문자열 설명 줄을 찾음
-        desc = "(설명 없음)"
-        for line in text.splitlines():
-            s = line.strip()
-            if s.startswith('#'):
-                desc = s.lstrip('# ').strip()
-                break
-            if s.startswith('"') or s.startswith("'"):
-                # 간단한 문자열 리터럴로 된 설명
-                desc = s.strip('"').strip("'")[:200]
-                break
-        pages.append({"filename": p.name, "path": str(p.relative_to(BASE)), "description": desc})
-    return pages
+def catalog_signature(pages_dir: Path, meta_path: Path):
+    """페이지 파일과 메타파일의 (이름, 수정 시각)만 모읍니다. 파일 내용은 읽지 않으므로 페이지가 많아도 빠릅니다."""
+    if not pages_dir.exists():
+        return ()
+    files = sorted((p.name, p.stat().st_mtime_ns) for p in pages_dir.glob("*.py"))
+    meta_mtime = meta_path.stat().st_mtime_ns if meta_path.exists() else 0
+    return tuple(files) + (("_meta.json", meta_mtime),)
+
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def cached_page_description(path: str, mtime_ns: int) -> str:
+    # 수정 시각이 바뀐 파일만 다시 읽음
+    return page_description(Path(path))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_catalog(pages_dir: str, signature: tuple):
+    """
+    페이지 목록 인덱스(제목, 설명, 제작자, 원본 URL)를 만듭니다.
+    signature(파일 수정 시각)가 바뀔 때만 다시 만들어지고, 그때도 바뀐 파일만 다시 읽습니다.
+    """
+    pages_dir = Path(pages_dir)
+    meta = load_meta(pages_dir / "_meta.json")
+    catalog = []
+    for filename, mtime_ns in signature[:-1]:
+        info = meta.get(filename, {})
+        entry = {
+            "filename": filename,
+            "path": str((pages_dir / filename).relative_to(BASE)),
+            "display_name": display_name_of(filename),
+            "title": info.get('title', filename),
+            "description": info.get('description') or cached_page_description(str(pages_dir / filename), mtime_ns),
+            "creator": info.get('creator', ""),
+            "original_url": info.get('original_url', ""),
+        }
+        entry["search_text"] = " ".join(
+            [entry["display_name"], entry["title"], entry["description"], entry["creator"]]
+        ).lower()
+        catalog.append(entry)
+    return catalog
 
 
 def load_meta(meta_path: Path):
@@ -65,41 +90,78 @@ def save_meta(meta_path: Path, meta: dict):
         return False
 
 
-pages = discover_pages(BASE / "pages")
-meta_path = BASE / "pages" / "_meta.json"
-meta = load_meta(meta_path)
-
-if pages:
-    st.subheader("콘텐츠 목록")
-    st.markdown("아래 목록을 확인하신 후, 좌측 사이드 바에서 해당 콘텐츠로 이동하세요.")
-    for pg in pages:
-        # 메타에서 제목/설명/제작자 가져오기(없으면 기본값)
-        title = meta.get(pg['filename'], {}).get('title', pg['filename'])
-        desc = meta.get(pg['filename'], {}).get('description', pg['description'])
-        creator = meta.get(pg['filename'], {}).get('creator', "")
-
-        # display_name: 숫자_제목.py -> 제목 (언더스코어와 확장자 사이의 텍스트)
-        display_name = pg['filename']
-        if '_' in display_name:
-            try:
-                display_name = display_name.split('_', 1)[1]
-            except Exception:
-                pass
-        if '.' in display_name:
-            display_name = display_name.rsplit('.', 1)[0]
-
-        with st.expander(title, expanded=False):
-            st.write(desc)
-            if creator:
-                st.markdown(f"**제작자:** {creator}")
-            st.markdown(f"좌측 사이드 바에서 **{display_name}** 선택")
-            # meta에 원본 URL(original_url)이 있으면 링크로 표시
-            original = meta.get(pg['filename'], {}).get('original_url', '')
-            if original:
-                # 일반 마크다운 링크로 표시
-                st.markdown(f"- 원본 출처: [{original}]({original})")
-            st.write("---")
-else:
-    st.info("`pages/` 디렉터리에 예제 페이지가 없습니다. `pages/` 폴더에 `.py` 파일을 추가하세요.")
+def home():
+    """런처(홈) 페이지: 콘텐츠 목록과 검색"""
+    st.set_page_config(page_title="Streamlit Lecture Samples", page_icon="🎈", layout="wide")
+
+    st.title("🎈 수업용 Streamlit 애플리케이션 예시 모음")
 
-st.caption("프로젝트: streamlit-lecture-project — 교육용 Streamlit 예제 모음")
+    st.markdown("""
+        이 페이지는 수업·실습에서 사용할 수 있는 Streamlit 예제 페이지들을 모아둔 페이지입니다.            
+        Streamlit 애플리케이션을 개발할 때, **아이디어 탐색용**으로 활용하시길 바랍니다.            
+        왼쪽 사이드바에서 페이지를 선택하거나 아래 링크를 통해 웹 애플리케이션 원본으로 이동할 수 있습니다.
+    
+        본 페이지에 저장된 각 콘텐츠의 저작권은 **원작자**(콘텐츠마다 기재)에게 있으며, 예시용 페이지로 옮겨오는 과정에서 원본과 조금 다르게 표시될 수 있습니다.
+    """
+    
+    )
+
+    if catalog:
+        st.subheader("콘텐츠 목록")
+        st.markdown("아래 목록을 확인하신 후, 좌측 사이드 바에서 해당 콘텐츠로 이동하세요.")
+
+        # 검색/필터: 제목, 설명, 제작자에서 검색어를 찾고 제작자로 거를 수 있음
+        col_search, col_creator = st.columns([2, 1])
+        with col_search:
+            query = st.text_input("🔍 콘텐츠 검색", placeholder="제목, 설명, 제작자로 검색")
+        with col_creator:
+            creators = sorted({pg['creator'] for pg in catalog if pg['creator']})
+            selected_creators = st.multiselect("제작자", creators)
+
+        terms = query.lower().split()
+        shown = [
+            pg for pg in catalog
+            if all(t in pg['search_text'] for t in terms)
+            and (not selected_creators or pg['creator'] in selected_creators)
+        ]
+        if len(shown) < len(catalog):
+            st.caption(f"{len(catalog)}개 중 {len(shown)}개 콘텐츠")
+
+        for pg in shown:
+            with st.expander(pg['title'], expanded=False):
+                st.write(pg['description'])
+                if pg['creator']:
+                    st.markdown(f"**제작자:** {pg['creator']}")
+                st.markdown(f"좌측 사이드 바에서 **{pg['display_name']}** 선택")
+                # meta에 원본 URL(original_url)이 있으면 링크로 표시
+                if pg['original_url']:
+                    # 일반 마크다운 링크로 표시
+                    st.markdown(f"- 원본 출처: [{pg['original_url']}]({pg['original_url']})")
+                st.write("---")
+        if not shown:
+            st.info("검색 조건에 맞는 콘텐츠가 없습니다.")
+    else:
+        st.info("`pages/` 디렉터리에 예제 페이지가 없습니다. `pages/` 폴더에 `.py` 파일을 추가하세요.")
+
+    st.caption("프로젝트: streamlit-lecture-project — 교육용 Streamlit 예제 모음")
+
+
+# --- 페이지 구성 ---
+# 런처가 모든 페이지 실행을 감싸도록 pages/ 자동 탐색 대신 st.navigation을 사용합니다.
+# (제목과 URL은 자동 탐색과 같게 파일 이름에서 정해짐)
+pages_dir = BASE / "pages"
+meta_path = pages_dir / "_meta.json"
+catalog = build_catalog(str(pages_dir), catalog_signature(pages_dir, meta_path))
+
+page = st.navigation(
+    [st.Page(home, title="streamlit app", icon="🎈", default=True)]
+    + [st.Page(pg['path']) for pg in catalog]
+)
+
+# 교사·운영자용 선택 기능: 켜면 이 세션의 페이지 실행마다 시간/전송량을 측정해 사이드바와 logs/profile.jsonl에 기록
+if st.sidebar.toggle("⏱ 페이지 프로파일링", key="profiling_enabled",
+                     help="스크립트 실행 시간, 차트 렌더링 시간, 전송 바이트, 세션 상태 크기를 측정합니다."):
+    from utils.profiling import run_profiled
+    run_profiled(page)
+else:
+    page.run()
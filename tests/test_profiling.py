@@ -0,0 +1,27 @@
+"""런처의 페이지 프로파일링 패널 테스트 (저장소 루트에서 python -m pytest)"""
+from streamlit.testing.v1 import AppTest
+
+STOPPING_PAGE = "pages/36_옷가게와 함께하는 다섯 자리 수 연습.py"   # 처음 열면 st.stop()으로 끝나는 페이지
+
+
+def _profiled_run(page):
+    at = AppTest.from_file("streamlit_app.py", default_timeout=60).run()
+    at.toggle(key="profiling_enabled").set_value(True).run()
+    at.switch_page(page).run()
+    return at
+
+
+def _panel_shown(at):
+    return any(e.label == "⏱ 실행 프로파일" for e in at.sidebar.expander)
+
+
+def test_panel_shown_when_page_calls_st_stop():
+    at = _profiled_run(STOPPING_PAGE)
+    assert not at.exception
+    assert _panel_shown(at)
+
+
+def test_panel_shown_on_normal_page():
+    at = _profiled_run("pages/09_몬티 홀 문제.py")
+    assert not at.exception
+    assert _panel_shown(at)
@@ -0,0 +1,19 @@
+"""utils.symbolic 작업자 풀의 시간 초과 처리 테스트 (저장소 루트에서 python -m pytest)"""
+import pytest
+import sympy
+
+from utils.symbolic import SymbolicWorkerPool
+
+
+def test_repeated_timeouts_discard_each_worker_once():
+    pool = SymbolicWorkerPool(max_workers=1)
+    # spawn된 작업자가 sympy를 불러오기도 전에 제한 시간이 지나므로 매번 시간 초과
+    for _ in range(3):
+        with pytest.raises(TimeoutError):
+            pool.run("singularities", sympy.srepr(1 / sympy.Symbol('x')), timeout=0.001)
+        assert pool._started == 0
+
+    # 시간 초과 뒤에도 작업자 수 제한 안에서 새 작업자를 만들어 계속 동작함
+    result = pool.run("singularities", sympy.srepr(1 / sympy.Symbol('x')), timeout=60)
+    assert [sympy.sympify(p) for p in result] == [0]
+    assert pool._started == 1
@@ -0,0 +1 @@
+"""여러 페이지가 함께 사용하는 공통 도구 모음입니다."""
@@ -0,0 +1,192 @@
+"""
+함수 그래프를 위한 적응형 표본 추출기입니다.
+
+균일한 격자에서 시작해 곡률이 크거나 값이 크게 뛰는 구간만 반씩 나누어 다시 계산합니다.
+좁혀도 값의 차이가 줄지 않는 구간(점근선, 계단)과 함숫값이 정의되지 않는 점은
+끊어진 곳으로 기록하므로, 그래프를 그 자리에서 끊어 그리고 연속성도 판정할 수 있습니다.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+INITIAL_POINTS = 65
+MAX_EVALUATIONS = 4000
+# 곡선이 직선에서 벗어난 정도의 허용치 (y 범위 대비)
+CURVATURE_TOL = 2e-3
+# 한 구간의 값 차이가 이보다 크면 더 나눔 (y 범위 대비)
+JUMP_TOL = 0.05
+# 구간 폭이 이보다 좁아져도 값이 크게 뛰면 끊어진 곳으로 판단 (x 범위 대비)
+BREAK_WIDTH = 1e-4
+# 이보다 좁은 구간은 더 나누지 않음 (x 범위 대비)
+MIN_WIDTH = 1e-7
+# 이 거리 안에 모인 끊어진 구간 후보는 값 차이가 가장 큰 하나로 합침 (x 범위 대비)
+CLUSTER_WIDTH = 1e-3
+
+
+class SampledCurve(NamedTuple):
+    """적응형 표본 추출 결과입니다."""
+    x: np.ndarray          # 정렬된 표본 x (정의되지 않는 점 포함)
+    y: np.ndarray          # 표본 함숫값 (정의되지 않으면 NaN)
+    breaks: np.ndarray     # 그래프가 끊어지는 x 위치 (점근선, 계단, 정의역 경계)
+    evaluations: int       # 함수를 계산한 점의 개수
+
+    @property
+    def is_continuous(self):
+        """구간 안에 끊어진 곳이 없으면 True입니다."""
+        return len(self.breaks) == 0
+
+    def segments(self):
+        """끊어진 곳마다 나눈 (x, y) 곡선 조각 목록을 반환합니다."""
+        finite = np.isfinite(self.y)
+        cut = np.zeros(len(self.x), dtype=bool)
+        cut[1:] = _break_intervals(self)
+        pieces = []
+        for idx in np.split(np.arange(len(self.x)), np.flatnonzero(cut)):
+            idx = idx[finite[idx]]
+            if len(idx) > 0:
+                pieces.append((self.x[idx], self.y[idx]))
+        return pieces
+
+    def y_limits(self, lower=2, upper=98, pad=0.2):
+        """
+        x 길이로 가중한 분위수로 y축 범위를 잡습니다. 점근선 근처에 몰린 표본의
+        아주 큰 값 때문에 그래프가 눌리지 않게 할 때 씁니다. 유효한 값이 없으면 None입니다.
+        """
+        finite = np.isfinite(self.y)
+        if not finite.any():
+            return None
+        # 각 점이 대표하는 x 길이 (양옆 구간의 절반씩)
+        gaps = np.diff(self.x)
+        weight = np.concatenate([[0], gaps]) / 2 + np.concatenate([gaps, [0]]) / 2
+        y, weight = self.y[finite], weight[finite]
+        order = np.argsort(y)
+        cumulative = np.cumsum(weight[order])
+        if cumulative[-1] <= 0:
+            return float(y.min()) - 1, float(y.max()) + 1
+        lo, hi = np.interp([lower / 100, upper / 100], cumulative / cumulative[-1], y[order])
+        margin = max(hi - lo, 1e-9) * pad
+        return float(lo - margin), float(hi + margin)
+
+    def polyline(self):
+        """조각 사이에 NaN을 넣어 ax.plot 한 번으로 끊어 그릴 수 있는 (x, y)를 반환합니다."""
+        xs, ys = [], []
+        for px, py in self.segments():
+            xs.extend([px, [np.nan]])
+            ys.extend([py, [np.nan]])
+        if not xs:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(xs[:-1]), np.concatenate(ys[:-1])
+
+
+def _evaluate(f, x):
+    """f를 배열 전체에 한 번 계산하고, 실패하거나 복소수인 값은 NaN으로 바꿉니다."""
+    try:
+        with np.errstate(all='ignore'):
+            y = np.asarray(f(x))
+        if np.iscomplexobj(y):
+            y = np.where(np.abs(y.imag) < 1e-12, y.real, np.nan)
+        return np.broadcast_to(y.astype(float), x.shape).copy()
+    except Exception:
+        return np.full(x.shape, np.nan)
+
+
+def _y_scale(y):
+    """극단값에 휘둘리지 않도록 5~95% 분위수로 y 범위를 잡습니다."""
+    finite = y[np.isfinite(y)]
+    if finite.size == 0:
+        return 1.0
+    lo, hi = np.percentile(finite, [5, 95])
+    return max(hi - lo, 1e-12 * max(1.0, np.abs(finite).max()), 1e-12)
+
+
+def _break_intervals(curve):
+    """
+    각 구간 [x_i, x_i+1]이 끊어진 곳인지 나타내는 불리언 배열을 반환합니다.
+    점근선 근처처럼 가파른 구간이 여러 개 모여 있으면 값 차이가 가장 큰 구간 하나만 고릅니다.
+    """
+    x, y = curve.x, curve.y
+    span = x[-1] - x[0] if len(x) > 1 else 1.0
+    finite = np.isfinite(y)
+    scale = _y_scale(y)
+    width = np.diff(x)
+    with np.errstate(invalid='ignore'):
+        jump = np.abs(np.diff(y))
+    mismatch = finite[:-1] != finite[1:]
+    steep = finite[:-1] & finite[1:] & (width <= BREAK_WIDTH * span) & (jump > JUMP_TOL * scale)
+    # 정의 여부가 바뀌는 구간을 가장 먼저 고름
+    score = np.where(mismatch, np.inf, jump)
+
+    cut = np.zeros(len(width), dtype=bool)
+    candidates = np.flatnonzero(mismatch | steep)
+    if candidates.size:
+        # 후보 사이 간격이 CLUSTER_WIDTH보다 넓으면 새 무리로 나눔
+        gaps = x[candidates[1:]] - x[candidates[:-1] + 1]
+        for group in np.split(candidates, np.flatnonzero(gaps > CLUSTER_WIDTH * span) + 1):
+            cut[group[np.argmax(score[group])]] = True
+    return cut
+
+
+def adaptive_sample(f, x_min, x_max, max_evaluations=MAX_EVALUATIONS, initial_points=INITIAL_POINTS):
+    """
+    f(배열 → 배열)를 [x_min, x_max]에서 적응형으로 계산해 SampledCurve를 반환합니다.
+    계산 횟수는 max_evaluations를 넘지 않습니다.
+    """
+    if x_max < x_min:
+        x_min, x_max = x_max, x_min
+    if x_max == x_min:
+        x = np.array([float(x_min)])
+        return SampledCurve(x, _evaluate(f, x), np.empty(0), 1)
+
+    x = np.linspace(x_min, x_max, initial_points)
+    y = _evaluate(f, x)
+    evaluations = len(x)
+    span = x_max - x_min
+    scale = _y_scale(y)
+
+    while evaluations < max_evaluations:
+        finite = np.isfinite(y)
+        width = np.diff(x)
+        both = finite[:-1] & finite[1:]
+
+        # 1) 값의 차이가 큰 구간, 정의 여부가 바뀌는 구간
+        with np.errstate(invalid='ignore'):
+            jump = np.where(both, np.abs(np.diff(y)), 0.0)
+        score = np.where(both, jump / (JUMP_TOL * scale), 0.0)
+        score = np.where(finite[:-1] != finite[1:], np.inf, score)
+
+        # 2) 가운데 점이 양옆 점을 이은 직선에서 많이 벗어나는 곳 (양쪽 구간 모두)
+        if len(x) > 2:
+            t = (x[1:-1] - x[:-2]) / (x[2:] - x[:-2])
+            with np.errstate(invalid='ignore'):
+                deviation = np.abs(y[1:-1] - (y[:-2] + t * (y[2:] - y[:-2])))
+            bend = np.where(finite[1:-1] & finite[:-2] & finite[2:], deviation / (CURVATURE_TOL * scale), 0.0)
+            score[:-1] = np.maximum(score[:-1], bend)
+            score[1:] = np.maximum(score[1:], bend)
+
+        refine = (score > 1) & (width > MIN_WIDTH * span)
+        candidates = np.flatnonzero(refine)
+        if candidates.size == 0:
+            break
+        budget = max_evaluations - evaluations
+        if candidates.size > budget:
+            candidates = candidates[np.argsort(-score[candidates], kind='stable')[:budget]]
+            candidates.sort()
+
+        x_mid = (x[candidates] + x[candidates + 1]) / 2
+        y_mid = _evaluate(f, x_mid)
+        evaluations += len(x_mid)
+        x = np.insert(x, candidates + 1, x_mid)
+        y = np.insert(y, candidates + 1, y_mid)
+
+    curve = SampledCurve(x, y, np.empty(0), evaluations)
+    cut = _break_intervals(curve)
+    breaks = (x[:-1][cut] + x[1:][cut]) / 2
+    # 양 끝이 아닌 곳에서 정의되지 않는 외딴 점도 끊어진 곳으로 기록
+    finite = np.isfinite(y)
+    isolated = np.flatnonzero(~finite[1:-1] & finite[:-2] & finite[2:]) + 1
+    breaks = np.union1d(breaks, x[isolated]) if isolated.size else breaks
+    if breaks.size > 1:
+        breaks = breaks[np.concatenate([[True], np.diff(breaks) > CLUSTER_WIDTH * span])]
+    if not finite.any():
+        breaks = np.array([x_min])
+    return curve._replace(breaks=breaks)
@@ -0,0 +1,61 @@
+"""
+data/ 폴더에 내장된 데이터셋을 불러오는 등록부입니다.
+
+네트워크를 쓰지 않고, 처음 불러올 때 CSV를 열 기반 Feather 파일로 변환해 두었다가
+이후에는 Feather 파일을 읽습니다. 읽은 결과는 프로세스 전체에서 공유하는 캐시에
+보관하므로 위젯이 바뀌어 페이지가 다시 실행되어도 파일을 다시 읽지 않습니다.
+"""
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# 데이터셋 이름: (CSV 파일 이름, read_csv 옵션)
+DATASETS = {
+    "iris": ("iris.csv", {}),
+    "mall_customers": ("Mall_Customers.csv", {"dtype": {"CustomerID": str}}),
+}
+
+
+def dataset_path(name):
+    """데이터셋의 원본 CSV 경로를 반환합니다."""
+    if name not in DATASETS:
+        raise KeyError(f"등록되지 않은 데이터셋입니다: {name}")
+    return DATA_DIR / DATASETS[name][0]
+
+
+def _feather_path(name):
+    """데이터셋의 Feather 파일이 있는지 확인하고, 없거나 CSV보다 오래되었으면 새로 만듭니다."""
+    csv_path = dataset_path(name)
+    feather_path = csv_path.with_suffix(".feather")
+    if feather_path.exists() and feather_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return feather_path
+    try:
+        pd.read_csv(csv_path, **DATASETS[name][1]).to_feather(feather_path)
+    except OSError:
+        # 쓰기 권한이 없는 환경에서는 CSV를 그대로 사용
+        return None
+    return feather_path
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _load(name, columns, mtime):
+    """(이름, 열, 파일 수정 시각)을 키로 데이터셋을 읽습니다. 파일이 바뀌면 키도 바뀝니다."""
+    feather_path = _feather_path(name)
+    if feather_path is None:
+        df = pd.read_csv(dataset_path(name), **DATASETS[name][1])
+        return df[list(columns)] if columns else df
+    return pd.read_feather(feather_path, columns=list(columns) if columns else None)
+
+
+def load_table(name, columns=None):
+    """
+    등록된 데이터셋을 DataFrame으로 불러옵니다. columns를 주면 해당 열만 읽습니다.
+    파일이 없으면 FileNotFoundError를 발생시킵니다.
+    """
+    csv_path = dataset_path(name)
+    if not csv_path.exists():
+        raise FileNotFoundError(csv_path)
+    return _load(name, tuple(columns) if columns else None, csv_path.stat().st_mtime)
@@ -0,0 +1,112 @@
+"""
+사용자가 입력한 수식을 해석하고 컴파일하는 공통 서비스입니다.
+
+수식 문자열을 정규화한 뒤 SymPy 식으로 해석하고, 허용되지 않은 변수가 없는지
+확인한 다음 NumPy 함수로 lambdify합니다. 결과는 정규화된 문자열을 키로 하는
+LRU 캐시에 보관하므로, 여러 학생이 같은 sin(x)를 입력해도 해석과 컴파일은
+프로세스당 한 번만 이루어집니다.
+"""
+import re
+from functools import lru_cache
+
+import numpy as np
+import sympy
+from sympy.parsing.sympy_parser import parse_expr
+
+X = sympy.Symbol('x')
+
+# NumPy 방식으로 입력한 함수 이름을 SymPy 함수로 연결
+NUMPY_ALIASES = {
+    "abs": sympy.Abs,
+    "absolute": sympy.Abs,
+    "arcsin": sympy.asin,
+    "arccos": sympy.acos,
+    "arctan": sympy.atan,
+    "arcsinh": sympy.asinh,
+    "arccosh": sympy.acosh,
+    "arctanh": sympy.atanh,
+    "ln": sympy.log,
+    "log10": lambda arg: sympy.log(arg, 10),
+    "log2": lambda arg: sympy.log(arg, 2),
+    "ceil": sympy.ceiling,
+    "maximum": sympy.Max,
+    "minimum": sympy.Min,
+    "fmax": sympy.Max,
+    "fmin": sympy.Min,
+    "clip": lambda arg, low, high: sympy.Min(sympy.Max(arg, low), high),
+    "where": lambda cond, a, b: sympy.Piecewise((a, cond), (b, True)),
+    "heaviside": sympy.Heaviside,
+    "square": lambda arg: arg ** 2,
+    "power": sympy.Pow,
+    "mod": sympy.Mod,
+    "hypot": lambda a, b: sympy.sqrt(a ** 2 + b ** 2),
+    "log1p": lambda arg: sympy.log(1 + arg),
+    "expm1": lambda arg: sympy.exp(arg) - 1,
+    # 이름은 같지만 NumPy와 정의가 다른 함수 (np.sinc는 정규화된 sinc, np.cbrt는 실수 세제곱근)
+    "sinc": lambda arg: sympy.sinc(sympy.pi * arg),
+    "cbrt": lambda arg: sympy.real_root(arg, 3),
+    "e": sympy.E,
+    "pi": sympy.pi,
+}
+
+
+class CompiledExpression:
+    """해석된 SymPy 식과 배열을 받는 NumPy 함수를 함께 보관합니다."""
+
+    def __init__(self, source, expr, params):
+        self.source = source
+        self.expr = expr
+        self.params = params
+        self.func = sympy.lambdify([X, *sympy.symbols(params)], expr, 'numpy')
+
+    def __call__(self, x, **param_values):
+        """x(스칼라 또는 배열)에서 함숫값을 계산합니다. 상수 식도 x와 같은 모양의 배열로 반환합니다."""
+        x_arr = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            y = self.func(x_arr, *(param_values[name] for name in self.params))
+        y = np.broadcast_to(np.asarray(y, dtype=float), x_arr.shape)
+        return float(y) if x_arr.ndim == 0 else y
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+
+def normalize_source(source):
+    """공백을 정리하고 '^'를 '**'로, 'np.sin' 같은 NumPy 접두어를 떼어 수식 문자열을 정규화합니다."""
+    source = re.sub(r'\s+', ' ', source.strip())
+    source = source.replace('^', '**')
+    return re.sub(r'\b(?:np|numpy)\.', '', source)
+
+
+def _check_functions(source, local_dict):
+    """SymPy에도 NUMPY_ALIASES에도 없는 함수 이름을 쓰면 알아보기 쉬운 오류를 발생시킵니다."""
+    for name in re.findall(r'\b([A-Za-z_]\w*)\s*\(', source):
+        if name not in local_dict and not callable(getattr(sympy, name, None)):
+            raise ValueError(f"지원하지 않는 함수입니다: {name}")
+
+
+@lru_cache(maxsize=256)
+def _compile(source, params):
+    local_dict = {name: value for name, value in NUMPY_ALIASES.items() if name not in params}
+    local_dict['x'] = X
+    local_dict.update({name: sympy.Symbol(name) for name in params})
+    _check_functions(source, local_dict)
+    expr = parse_expr(source, local_dict=local_dict, transformations='all')
+    if not isinstance(expr, sympy.Expr):
+        raise ValueError(f"수식으로 해석할 수 없습니다: {source}")
+
+    unknown = sorted(str(s) for s in expr.free_symbols if s != X and str(s) not in params)
+    if unknown:
+        raise ValueError(f"알 수 없는 변수가 있습니다: {', '.join(unknown)}")
+    return CompiledExpression(source, expr, params)
+
+
+def compile_expression(source, params=()):
+    """
+    수식 문자열을 CompiledExpression으로 컴파일합니다.
+    params에는 x 외에 계수로 쓰는 변수 이름을 주며, 호출할 때 값을 넘깁니다.
+    np.where, np.heaviside, np.maximum 등 자주 쓰는 NumPy 함수는 SymPy의 Piecewise, Heaviside, Max 등으로 바꿔 해석합니다.
+    해석할 수 없으면 SyntaxError, TypeError, ValueError 등의 예외를 발생시키며,
+    지원하지 않는 함수 이름은 "지원하지 않는 함수입니다" ValueError로 알립니다.
+    """
+    return _compile(normalize_source(source), tuple(sorted(params)))
@@ -0,0 +1,129 @@
+"""
+Matplotlib 그림을 이미지 바이트로 한 번만 렌더링해 캐시하는 도구입니다.
+
+그림을 그리는 함수와 그 입력값을 키로 삼아 PNG/SVG/JPEG/PDF 바이트를 저장하고,
+같은 입력으로 다시 실행(rerun)하면 Matplotlib을 거치지 않고 바이트만 꺼내 씁니다.
+캐시는 프로세스 전체에서 함께 쓰며, 메모리 예산을 넘으면 가장 오래 쓰지 않은 그림부터 지웁니다.
+그림은 렌더링 직후 항상 닫으므로 오래 켜 둔 서버에서도 Figure 객체가 쌓이지 않습니다.
+"""
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import streamlit as st
+
+MEMORY_BUDGET_BYTES = 64 * 1024 * 1024
+MAX_ENTRIES = 256
+# st.pyplot과 같은 저장 옵션 (고해상도 화면용 dpi 200)
+SAVEFIG_OPTIONS = {"bbox_inches": "tight", "dpi": 200}
+
+
+class FigureCache:
+    """렌더링된 그림 바이트를 메모리 예산 안에서 LRU 방식으로 보관합니다. 여러 스레드에서 함께 사용할 수 있습니다."""
+
+    def __init__(self, max_bytes=MEMORY_BUDGET_BYTES, max_entries=MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            images = self._entries.get(key)
+            if images is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return images
+
+    def put(self, key, images):
+        size = sum(len(b) for b in images)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= sum(len(b) for b in self._entries.pop(key))
+            self._entries[key] = images
+            self._size += size
+            while self._size > self.max_bytes or len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= sum(len(b) for b in evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size(self):
+        """현재 보관 중인 바이트 수"""
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+
+figure_cache = FigureCache()
+
+
+def _freeze(value):
+    """그림 입력값을 해시 가능한 캐시 키로 바꿉니다. 배열과 표는 내용(바이트) 기준으로 비교합니다."""
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return ("pandas", value.to_csv().encode())
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted(_freeze(v) for v in value)))
+    hash(value)  # 해시할 수 없는 입력은 여기서 TypeError
+    return value
+
+
+def _savefig_bytes(fig, fmt, savefig_kwargs):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, **{**SAVEFIG_OPTIONS, **savefig_kwargs})
+    return buffer.getvalue()
+
+
+def render_figure(fig, fmt="png", **savefig_kwargs):
+    """캐시하지 않는 그림을 fmt 형식의 바이트로 저장하고, 성공 여부와 관계없이 그림을 닫습니다."""
+    try:
+        return _savefig_bytes(fig, fmt, savefig_kwargs)
+    finally:
+        plt.close(fig)
+
+
+def cached_figure(draw, *args, formats=("png",), savefig_kwargs=None, **kwargs):
+    """
+    draw(*args, **kwargs)가 만드는 Figure를 formats의 각 형식으로 렌더링한 바이트 튜플을 반환합니다.
+    같은 함수와 같은 입력이면 draw를 호출하지 않고 캐시된 바이트를 돌려줍니다.
+    """
+    savefig_kwargs = savefig_kwargs or {}
+    code = draw.__code__
+    key = (code.co_filename, draw.__qualname__, _freeze(args), _freeze(kwargs),
+           tuple(formats), _freeze(savefig_kwargs))
+    images = figure_cache.get(key)
+    if images is None:
+        fig = draw(*args, **kwargs)
+        try:
+            images = tuple(_savefig_bytes(fig, fmt, savefig_kwargs) for fmt in formats)
+        finally:
+            plt.close(fig)
+        figure_cache.put(key, images)
+    return images
+
+
+def cached_pyplot(draw, *args, use_container_width=True, **kwargs):
+    """st.pyplot 대신 사용합니다. 캐시된 PNG를 st.image로 보여 줍니다."""
+    (png,) = cached_figure(draw, *args, **kwargs)
+    return st.image(png, width="stretch" if use_container_width else "content", output_format="PNG")
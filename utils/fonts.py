@@ -0,0 +1,75 @@
+"""
+저장소에 포함된 NanumGothic 폰트(static/fonts/NanumGothic-*.ttf)를 프로세스당 한 번만 등록하는 도구입니다.
+
+Matplotlib 폰트 등록과 FontProperties 객체를 캐시하므로 다시 실행(rerun)할 때마다 폰트 파일을 읽지 않으며,
+네트워크도 사용하지 않습니다. 웹 페이지용 @font-face CSS는 폰트 파일을 글에 넣지 않고
+Streamlit 정적 파일 제공(.streamlit/config.toml의 server.enableStaticServing) 주소만 가리키므로,
+브라우저가 폰트를 한 번 내려받아 캐시합니다.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+from utils.lazy import lazy_import
+
+# font_path만 필요한 페이지(예: PDF 출력)는 Matplotlib을 불러오지 않도록 지연 import
+matplotlib = lazy_import("matplotlib")
+font_manager = lazy_import("matplotlib.font_manager")
+
+FONTS_DIR = Path(__file__).resolve().parent.parent / "static" / "fonts"
+FONTS_URL = "app/static/fonts"   # Streamlit이 static/ 폴더를 제공하는 주소
+FONT_FAMILY = "NanumGothic"
+FONT_WEIGHTS = {"Regular": 400, "Bold": 700, "ExtraBold": 800}
+
+
+def font_path(weight="Regular"):
+    """해당 굵기의 NanumGothic 파일 경로를 반환합니다. 파일이 없으면 None입니다."""
+    path = FONTS_DIR / f"{FONT_FAMILY}-{weight}.ttf"
+    return str(path) if path.exists() else None
+
+
+@lru_cache(maxsize=None)
+def register_fonts():
+    """모든 굵기의 NanumGothic을 Matplotlib에 한 번만 등록하고 폰트 이름을 반환합니다. 폰트가 없으면 None입니다."""
+    registered = None
+    for weight in FONT_WEIGHTS:
+        path = font_path(weight)
+        if path is None:
+            continue
+        font_manager.fontManager.addfont(path)
+        if registered is None or weight == "Regular":
+            registered = font_manager.FontProperties(fname=path).get_name()
+    return registered
+
+
+def use_korean_font():
+    """
+    Matplotlib 기본 폰트를 NanumGothic으로 바꾸고 마이너스 기호가 깨지지 않게 설정합니다.
+    폰트 이름을 반환하며, 폰트 파일이 없으면 아무것도 바꾸지 않고 None을 반환합니다.
+    """
+    family = register_fonts()
+    if family is not None:
+        matplotlib.rcParams['font.family'] = family
+        matplotlib.rcParams['axes.unicode_minus'] = False
+    return family
+
+
+@lru_cache(maxsize=None)
+def font_properties(weight="Regular"):
+    """해당 굵기의 FontProperties를 반환합니다(캐시됨). 폰트 파일이 없으면 None입니다."""
+    path = font_path(weight)
+    return font_manager.FontProperties(fname=path) if path else None
+
+
+@lru_cache(maxsize=None)
+def font_face_css(weights=("Regular", "Bold")):
+    """정적 파일 주소의 폰트를 쓰는 @font-face CSS를 반환합니다. 폰트 파일이 없는 굵기는 건너뜁니다."""
+    rules = []
+    for weight in weights:
+        path = font_path(weight)
+        if path is None:
+            continue
+        rules.append(
+            f"@font-face {{font-family: '{FONT_FAMILY}'; src: url('{FONTS_URL}/{Path(path).name}') format('truetype'); "
+            f"font-weight: {FONT_WEIGHTS[weight]}; font-style: normal; font-display: swap;}}"
+        )
+    return "\n".join(rules)
@@ -0,0 +1,469 @@
+"""
+모눈종이(격자) 위 최단 경로의 개수를 세는 도구입니다.
+
+격자점은 (x, y) (0 ≤ x, y ≤ n)이고 y는 아래로 갈수록 커집니다(화면 좌표).
+두 점 사이의 최단 경로는 목표 쪽으로만 가로·세로 한 칸씩 움직이는 경로이며, 장애물 점은 지날 수 없습니다.
+
+경로 수는 "각 점까지의 경로 수 = 그 점으로 들어오는 이웃 점들의 경로 수의 합"이라는
+동적 계획법으로 격자 전체를 한 번 훑어(O(격자 점 수)) 모든 점에 대해 한꺼번에 구합니다.
+장애물 수와 상관없이 시간이 일정하고, 파이썬 정수를 쓰므로 경로 수가 아무리 커도 정확합니다.
+
+지나간 길(간선)을 다시 지날 수 없는 경우는 count_edge_disjoint가 (현재 점, 앞으로 다시 만날 수 있는
+이미 지난 간선들)을 상태로 하는 동적 계획법으로 정확히 세며, 상태 수가 한도를 넘으면 StateSpaceTooLarge를 냅니다.
+
+PathEnumerator는 경로를 이동 문자열(R, L, D, U)로 순위 순서대로 다루며, 경로 수 표를 이용해
+k번째 경로를 바로 만들어 내므로(unrank) 모든 경로를 만들어 두지 않고도 원하는 부분만 볼 수 있습니다.
+
+페이지에서는 맨 아래의 캐시된 함수(grid_counts, route_count, path_enumerator)를 씁니다.
+(모눈 크기, 지나는 점들, 장애물, 간선 재사용 여부)가 같으면 프로세스 안에서 한 번만 계산하므로
+여러 학생이 같은 배치를 만들어도 다시 계산하지 않습니다.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+MAX_STATES = 50_000   # count_edge_disjoint가 한 단계에서 추적할 수 있는 최대 상태 수
+MAX_ENUM_STATES = 200_000   # PathEnumerator(간선 재사용 불가)가 기억할 수 있는 최대 상태 수
+MOVES = {(1, 0): "R", (-1, 0): "L", (0, 1): "D", (0, -1): "U"}
+CACHE_SIZE = 256   # 캐시된 함수마다 기억할 배치 수
+ENUM_CACHE_STATES = 400_000   # 캐시된 PathEnumerator들이 함께 기억할 최대 상태 수 (상태 하나에 수백 바이트)
+ENUM_CACHE_ENTRIES = 32       # 캐시된 PathEnumerator의 최대 개수
+
+
+class StateSpaceTooLarge(RuntimeError):
+    """간선 중복 없는 경로 수를 세는 데 필요한 상태 수가 한도를 넘었을 때 발생합니다."""
+
+
+def _check_point(n, point):
+    x, y = point
+    if not (0 <= x <= n and 0 <= y <= n):
+        raise ValueError(f"격자 밖의 점입니다: {point} (0 ≤ x, y ≤ {n})")
+
+
+def count_grid(n, start, obstacles=()):
+    """
+    start에서 격자의 모든 점까지의 최단 경로 수를 표로 반환합니다.
+    counts[y][x]가 start → (x, y) 경로 수이며, 장애물 점과 장애물에 막힌 점은 0입니다.
+    """
+    _check_point(n, start)
+    blocked = set(obstacles)
+    counts = [[0] * (n + 1) for _ in range(n + 1)]
+    if start in blocked:
+        return counts
+    x0, y0 = start
+    # start를 꼭짓점으로 하는 네 사분면을 각각 start에서 멀어지는 방향으로 훑음 (축 위의 점은 같은 값으로 다시 계산됨)
+    for dx in (1, -1):
+        xs = range(x0, n + 1) if dx > 0 else range(x0, -1, -1)
+        for dy in (1, -1):
+            ys = range(y0, n + 1) if dy > 0 else range(y0, -1, -1)
+            for y in ys:
+                row = counts[y]
+                prev_row = counts[y - dy] if y != y0 else None
+                for x in xs:
+                    if (x, y) in blocked:
+                        row[x] = 0
+                    elif x == x0 and y == y0:
+                        row[x] = 1
+                    else:
+                        total = row[x - dx] if x != x0 else 0
+                        if prev_row is not None:
+                            total += prev_row[x]
+                        row[x] = total
+    return counts
+
+
+def count_paths(n, start, end, obstacles=()):
+    """start → end 최단 경로 수"""
+    _check_point(n, end)
+    return count_grid(n, start, obstacles)[end[1]][end[0]]
+
+
+def count_route(n, route, obstacles=()):
+    """
+    route의 점들을 차례로 지나는 경로 수입니다(지나간 길을 다시 지나도 됨).
+    구간마다 독립이므로 구간별 경로 수의 곱입니다. 점이 2개 미만이면 0입니다.
+    """
+    if len(route) < 2:
+        return 0
+    total = 1
+    for start, end in zip(route, route[1:]):
+        total *= count_paths(n, start, end, obstacles)
+        if total == 0:
+            break
+    return total
+
+
+def _sign(v):
+    return (v > 0) - (v < 0)
+
+
+def _box_edges(p, q):
+    """p, q를 꼭짓점으로 하는 직사각형 안의 모든 간선 ((x1, y1), (x2, y2)), (x1, y1) < (x2, y2)"""
+    x_lo, x_hi = sorted((p[0], q[0]))
+    y_lo, y_hi = sorted((p[1], q[1]))
+    for y in range(y_lo, y_hi + 1):
+        for x in range(x_lo, x_hi):
+            yield (x, y), (x + 1, y)
+    for x in range(x_lo, x_hi + 1):
+        for y in range(y_lo, y_hi):
+            yield (x, y), (x, y + 1)
+
+
+def _reach_masks(start, end, edge_bit, keep):
+    """
+    구간 start → end 안의 점 p마다, p 이후에 다시 지날 수 있는 간선의 비트마스크
+    (p → end 직사각형의 간선과 뒤 구간의 간선 keep)를 end에서부터 거꾸로 쌓아 구합니다.
+    """
+    sx, sy = _sign(end[0] - start[0]), _sign(end[1] - start[1])
+    reach = {}
+    for y in range(end[1], start[1] - sy, -sy) if sy else (end[1],):
+        for x in range(end[0], start[0] - sx, -sx) if sx else (end[0],):
+            mask = keep
+            for nxt in ((x + sx, y) if x != end[0] else None, (x, y + sy) if y != end[1] else None):
+                if nxt is not None:
+                    mask |= reach[nxt] | edge_bit.get(((x, y), nxt) if (x, y) < nxt else (nxt, (x, y)), 0)
+            reach[(x, y)] = mask
+    return reach
+
+
+def count_edge_disjoint(n, route, obstacles=(), max_states=MAX_STATES):
+    """
+    route의 점들을 차례로 지나면서 같은 간선을 두 번 지나지 않는 경로 수입니다(각 구간은 최단 경로).
+
+    구간의 경로는 그 구간의 직사각형 안 간선만 지나므로, 이미 지난 간선 중 지금 위치에서 남은 직사각형이나
+    뒤 구간의 직사각형에 들어 있는 것만 기억하면 됩니다. 이 간선 집합을 비트마스크로 나타내
+    (현재 점, 비트마스크)별 경로 수를 한 걸음씩 앞으로 옮깁니다.
+    같은 방향으로 이어지는 구간들은 겹치는 간선이 없어 상태가 점마다 하나뿐이고,
+    되돌아가는 구간이 많을수록 상태가 늘어납니다. 한 걸음에서 상태가 max_states개를 넘으면
+    StateSpaceTooLarge를 내므로 계산 시간은 (전체 걸음 수) × max_states에 비례하는 범위 안에 있습니다.
+    """
+    if len(route) < 2:
+        return 0
+    for point in route:
+        _check_point(n, point)
+    blocked = set(obstacles)
+    if any(point in blocked for point in route):
+        return 0
+
+    segments = list(zip(route, route[1:]))
+    # 두 번째 구간부터의 직사각형에 들어 있는 간선에만 비트 번호를 붙임
+    edge_bit = {}
+    later_mask = [0] * (len(segments) + 1)   # later_mask[i]: 구간 i 이후(i 포함)가 지날 수 있는 간선
+    for i in range(len(segments) - 1, 0, -1):
+        mask = later_mask[i + 1]
+        for edge in _box_edges(*segments[i]):
+            bit = edge_bit.setdefault(edge, 1 << len(edge_bit))
+            mask |= bit
+        later_mask[i] = mask
+
+    states = {0: 1}   # 구간 시작점에서 {지난 간선 비트마스크: 경로 수}
+    for i, (start, end) in enumerate(segments):
+        keep = later_mask[i + 1]
+        reach = _reach_masks(start, end, edge_bit, keep)
+        sx, sy = _sign(end[0] - start[0]), _sign(end[1] - start[1])
+        frontier = {}
+        for used, count in states.items():
+            key = (start, used & reach[start])
+            frontier[key] = frontier.get(key, 0) + count
+        for _ in range(abs(end[0] - start[0]) + abs(end[1] - start[1])):
+            following = {}
+            for ((x, y), used), count in frontier.items():
+                for nxt in ((x + sx, y) if x != end[0] else None, (x, y + sy) if y != end[1] else None):
+                    if nxt is None or nxt in blocked:
+                        continue
+                    bit = edge_bit.get(((x, y), nxt) if (x, y) < nxt else (nxt, (x, y)), 0)
+                    if used & bit:
+                        continue
+                    # 이 구간의 남은 부분과 뒤 구간이 다시 지날 수 없는 간선은 잊어 상태를 합침
+                    key = (nxt, (used | bit) & reach[nxt])
+                    following[key] = following.get(key, 0) + count
+            if len(following) > max_states:
+                raise StateSpaceTooLarge(
+                    f"구간 {i + 1}에서 상태가 {len(following):,}개로 한도({max_states:,}개)를 넘었습니다. "
+                    "모눈을 줄이거나 되돌아가는 경유지를 줄여 보세요."
+                )
+            frontier = following
+        states = {}
+        for (_, used), count in frontier.items():
+            states[used] = states.get(used, 0) + count
+        if not states:
+            return 0
+    return sum(states.values())
+
+
+class PathEnumerator:
+    """
+    route의 점들을 차례로 지나는 최단 경로들을 순위 순서(각 걸음에서 가로 이동을 세로 이동보다 먼저)로 다룹니다.
+
+        paths = PathEnumerator(4, [(0, 0), (2, 1), (4, 4)], obstacles={(1, 1)})
+        paths.total          # 경로 수
+        paths.unrank(10)     # 11번째 경로의 이동 문자열, 예: "RRDRDDD"
+        paths.page(2, 24)    # 3번째 쪽(24개씩)의 (순위, 이동 문자열) 목록
+
+    상태 (구간 번호, 현재 점, 기억하는 지난 간선 비트마스크)에서 끝까지 남은 경로 수를 알면
+    각 걸음에서 어느 쪽으로 가야 k번째 경로가 되는지 바로 정할 수 있습니다.
+    간선을 다시 지나도 되면 남은 경로 수는 구간 끝점에서 훑은 경로 수 표(count_grid)로 바로 구하고,
+    다시 지날 수 없으면 count_edge_disjoint와 같은 상태의 남은 경로 수를 필요한 만큼만 계산해 기억합니다.
+    기억한 상태가 max_states개를 넘으면 StateSpaceTooLarge를 냅니다.
+    """
+
+    def __init__(self, n, route, obstacles=(), allow_reuse=True, max_states=MAX_ENUM_STATES):
+        for point in route:
+            _check_point(n, point)
+        self.n = n
+        self.route = [tuple(p) for p in route]
+        # 같은 점이 연달아 나오면 길이 0인 구간이므로 하나로 합침 (모두 같은 점이면 길이 0인 구간 하나만 남김)
+        points = [p for k, p in enumerate(self.route) if k == 0 or p != self.route[k - 1]]
+        if len(points) == 1 and len(self.route) > 1:
+            points.append(points[0])
+        self.obstacles = frozenset(map(tuple, obstacles))
+        self.allow_reuse = allow_reuse
+        self.max_states = max_states
+        self.segments = list(zip(points, points[1:]))
+        self._memo = {}
+
+        if allow_reuse:
+            # 경로 수는 방향과 상관없이 같으므로 구간 끝점에서 훑은 표가 곧 "여기서 끝점까지" 경로 수
+            self._tables = [count_grid(n, end, self.obstacles) for _, end in self.segments]
+            self._suffix = [1] * (len(self.segments) + 1)   # 뒤 구간들의 경로 수 곱
+            for i in range(len(self.segments) - 1, -1, -1):
+                start = self.segments[i][0]
+                self._suffix[i] = self._tables[i][start[1]][start[0]] * self._suffix[i + 1]
+        else:
+            # count_edge_disjoint와 같은 방식: 두 번째 구간부터의 간선에 비트를 붙이고 구간별 reach 마스크를 구함
+            self._edge_bit = {}
+            later_mask = [0] * (len(self.segments) + 1)
+            for i in range(len(self.segments) - 1, 0, -1):
+                mask = later_mask[i + 1]
+                for edge in _box_edges(*self.segments[i]):
+                    mask |= self._edge_bit.setdefault(edge, 1 << len(self._edge_bit))
+                later_mask[i] = mask
+            self._reach = [_reach_masks(start, end, self._edge_bit, later_mask[i + 1])
+                           for i, (start, end) in enumerate(self.segments)]
+
+        valid = len(self.segments) > 0 and not any(p in self.obstacles for p in self.route)
+        self._start = (0, self.route[0], 0) if valid else None
+        self.total = self._completions(self._start) if valid else 0
+
+    def _successors(self, state):
+        """state에서 한 걸음 간 (이동 문자, 다음 상태)들을 순위 순서로 내놓습니다."""
+        i, (x, y), used = state
+        end = self.segments[i][1]
+        sx, sy = _sign(end[0] - x), _sign(end[1] - y)
+        for dx, dy in ((sx, 0), (0, sy)):
+            if dx == dy == 0:
+                continue
+            nxt = (x + dx, y + dy)
+            if nxt in self.obstacles:
+                continue
+            if self.allow_reuse:
+                new_used = 0
+            else:
+                bit = self._edge_bit.get(((x, y), nxt) if (x, y) < nxt else (nxt, (x, y)), 0)
+                if used & bit:
+                    continue
+                new_used = (used | bit) & self._reach[i][nxt]
+            if nxt == end and i + 1 < len(self.segments):
+                if not self.allow_reuse:
+                    new_used &= self._reach[i + 1][nxt]
+                yield MOVES[(dx, dy)], (i + 1, nxt, new_used)
+            else:
+                yield MOVES[(dx, dy)], (i, nxt, new_used)
+
+    def _is_final(self, state):
+        i, point, _ = state
+        return i == len(self.segments) - 1 and point == self.segments[i][1]
+
+    def _completions(self, state):
+        """state에서 끝까지 남은 경로 수"""
+        if self.allow_reuse:
+            i, (x, y), _ = state
+            return self._tables[i][y][x] * self._suffix[i + 1]
+        memo = self._memo
+        # 경로가 길어도 재귀 한도에 걸리지 않도록 스택으로 깊이 우선 계산
+        stack = [state]
+        while stack:
+            current = stack[-1]
+            if current in memo:
+                stack.pop()
+                continue
+            if self._is_final(current):
+                memo[current] = 1
+                continue
+            nexts = [nxt for _, nxt in self._successors(current)]
+            pending = [nxt for nxt in nexts if nxt not in memo]
+            if pending:
+                stack.extend(pending)
+                continue
+            memo[current] = sum(memo[nxt] for nxt in nexts)
+            if len(memo) > self.max_states:
+                raise StateSpaceTooLarge(
+                    f"경로를 나열하는 데 필요한 상태가 한도({self.max_states:,}개)를 넘었습니다. "
+                    "모눈을 줄이거나 되돌아가는 경유지를 줄여 보세요."
+                )
+        return memo[state]
+
+    def unrank(self, k):
+        """k번째(0부터) 경로의 이동 문자열"""
+        if not 0 <= k < self.total:
+            raise IndexError(f"경로 번호는 0 이상 {self.total} 미만이어야 합니다: {k}")
+        state, moves = self._start, []
+        while not self._is_final(state):
+            for move, nxt in self._successors(state):
+                count = self._completions(nxt)
+                if k < count:
+                    break
+                k -= count
+            else:
+                raise IndexError(f"{len(moves)}번째 걸음에서 이어지는 경로가 없습니다.")
+            moves.append(move)
+            state = nxt
+        return "".join(moves)
+
+    @property
+    def state_count(self):
+        """기억하고 있는 상태 수 (간선을 다시 지나도 되면 경로 수 표의 칸 수)"""
+        if self.allow_reuse:
+            return sum(len(table) * len(table[0]) for table in self._tables)
+        return len(self._memo)
+
+    def __len__(self):
+        return min(self.total, sys.maxsize)
+
+    def __iter__(self):
+        return self.iter_paths()
+
+    def iter_paths(self, start=0):
+        """start번째 경로부터 순위 순서로 이동 문자열을 하나씩 내놓습니다(한 번에 경로 하나만 만듦)."""
+        for k in range(start, self.total):
+            yield self.unrank(k)
+
+    def page(self, number, per_page):
+        """number번째 쪽(0부터)에 들어가는 (순위, 이동 문자열) 목록"""
+        start = number * per_page
+        return [(k, self.unrank(k)) for k in range(start, min(start + per_page, self.total))]
+
+
+def walk(start, moves):
+    """start에서 이동 문자열대로 움직일 때 지나는 점들의 목록"""
+    steps = {move: step for step, move in MOVES.items()}
+    x, y = start
+    points = [(x, y)]
+    for move in moves:
+        dx, dy = steps[move]
+        x, y = x + dx, y + dy
+        points.append((x, y))
+    return points
+
+
+# --- 캐시된 API: 인자를 해시할 수 있는 형태로 바꿔 lru_cache에 넘김 ---
+def _normalize(route, obstacles):
+    return tuple(tuple(p) for p in route), frozenset(tuple(o) for o in obstacles)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _grid_counts(n, start, obstacles):
+    return tuple(tuple(row) for row in count_grid(n, start, obstacles))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _route_count(n, route, obstacles, allow_reuse):
+    try:
+        if allow_reuse:
+            return count_route(n, route, obstacles)
+        return count_edge_disjoint(n, route, obstacles)
+    except StateSpaceTooLarge as e:
+        return e   # 너무 큰 배치도 다시 시도하지 않도록 예외를 캐시해 둠
+
+
+class EnumeratorCache:
+    """
+    PathEnumerator를 기억한 상태 수 합계 예산 안에서 LRU 방식으로 보관합니다 (utils.figures.FigureCache와 같은 방식).
+    프로세스 전체의 세션이 함께 쓰므로, 상태를 많이 기억하는 나열기가 쌓여도 메모리가 예산을 넘지 않습니다.
+    여러 스레드에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, max_states=ENUM_CACHE_STATES, max_entries=ENUM_CACHE_ENTRIES):
+        self.max_states = max_states
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # 키 → (PathEnumerator 또는 StateSpaceTooLarge, 상태 수)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        size = 1 if isinstance(value, StateSpaceTooLarge) else max(value.state_count, 1)
+        if size > self.max_states:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_states or len(self._entries) > self.max_entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size(self):
+        """현재 보관 중인 나열기들이 기억하는 상태 수 합계"""
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+
+enumerator_cache = EnumeratorCache()
+
+
+def _path_enumerator(n, route, obstacles, allow_reuse):
+    key = (n, route, obstacles, allow_reuse)
+    result = enumerator_cache.get(key)
+    if result is None:
+        try:
+            result = PathEnumerator(n, route, obstacles, allow_reuse)
+        except StateSpaceTooLarge as e:
+            result = e   # 너무 큰 배치도 다시 시도하지 않도록 예외를 캐시해 둠
+        enumerator_cache.put(key, result)
+    return result
+
+
+def grid_counts(n, start, obstacles=()):
+    """count_grid의 캐시된 버전입니다. 바꿀 수 없는 튜플의 튜플(counts[y][x])을 반환합니다."""
+    return _grid_counts(n, tuple(start), frozenset(tuple(o) for o in obstacles))
+
+
+def route_count(n, route, obstacles=(), allow_reuse=True):
+    """
+    route를 차례로 지나는 최단 경로 수(캐시됨). allow_reuse가 거짓이면 같은 간선을 두 번 지나지 않는 경로만 셉니다.
+    상태 수가 한도를 넘으면 StateSpaceTooLarge를 냅니다.
+    """
+    result = _route_count(n, *_normalize(route, obstacles), bool(allow_reuse))
+    if isinstance(result, StateSpaceTooLarge):
+        raise StateSpaceTooLarge(*result.args)
+    return result
+
+
+def path_enumerator(n, route, obstacles=(), allow_reuse=True):
+    """
+    같은 배치의 PathEnumerator를 다시 쓰도록 캐시해 반환합니다. 남은 경로 수 기억(memo)도 함께 재사용되며,
+    캐시 전체가 기억하는 상태 수는 ENUM_CACHE_STATES를 넘지 않습니다(enumerator_cache).
+    상태 수가 한도를 넘으면 StateSpaceTooLarge를 냅니다.
+    """
+    result = _path_enumerator(n, *_normalize(route, obstacles), bool(allow_reuse))
+    if isinstance(result, StateSpaceTooLarge):
+        raise StateSpaceTooLarge(*result.args)
+    return result
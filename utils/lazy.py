@@ -0,0 +1,64 @@
+"""
+무거운 모듈을 실제로 사용할 때까지 import를 미루는 도구입니다.
+
+    sm = lazy_import("statsmodels.api")   # 여기서는 아무것도 불러오지 않음
+    sm.OLS(...)                           # 처음 속성에 접근할 때 statsmodels를 불러옴
+
+회귀분석, PDF 만들기처럼 버튼을 눌러야 실행되는 기능에서만 쓰는 모듈에 사용하면
+그 기능을 쓰지 않는 페이지 방문에서는 import 비용이 들지 않습니다.
+"""
+import importlib
+import sys
+import threading
+import time
+
+# 지연 import된 모듈별로 실제 import에 걸린 시간(초). 프로파일링 패널에서 사용합니다.
+LAZY_IMPORT_TIMES = {}
+
+_lock = threading.RLock()
+
+
+class LazyModule:
+    """처음 속성에 접근할 때 모듈을 불러오는 대리 객체입니다."""
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            with _lock:
+                module = self.__dict__['_module']
+                if module is None:
+                    name = self.__dict__['_name']
+                    start = time.perf_counter()
+                    module = importlib.import_module(name)
+                    LAZY_IMPORT_TIMES.setdefault(name, time.perf_counter() - start)
+                    self.__dict__['_module'] = module
+        return module
+
+    @property
+    def is_loaded(self):
+        return self.__dict__['_module'] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name):
+    """name 모듈을 지연 import합니다. 이미 불러온 모듈이면 그 모듈을 그대로 반환합니다."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
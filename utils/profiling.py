@@ -0,0 +1,193 @@
+"""
+페이지 실행 프로파일링 도구입니다 (런처에서 켜는 선택 기능).
+
+켜져 있는 세션에서 페이지가 다시 실행될 때마다 다음을 측정합니다.
+- 스크립트 실행 시간
+- st.pyplot / st.plotly_chart 안에서 보낸 시간과 호출 횟수
+- 요소(element) 종류별로 브라우저에 보낸 바이트 수
+- 세션 상태(st.session_state) 크기
+
+결과는 사이드바 패널에 보여 주고 logs/profile.jsonl에 한 줄씩 덧붙입니다.
+Streamlit 함수 감싸기는 처음 켤 때 한 번만 설치되며, 프로파일링 중이 아닌 세션에는 영향을 주지 않습니다.
+st.stop()은 호출된 뒤의 모든 st 호출을 막으므로, 프로파일링 중에는 페이지 실행만 끝내고
+패널을 그린 다음 원래 st.stop()을 호출합니다.
+"""
+import json
+import pickle
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+
+LOG_PATH = Path(__file__).resolve().parent.parent / "logs" / "profile.jsonl"
+CHART_FUNCTIONS = ("pyplot", "plotly_chart")
+HISTORY_LENGTH = 10   # 사이드바에 보여 줄 이 세션의 최근 실행 수
+
+_local = threading.local()   # 스크립트 실행 스레드마다 현재 프로파일
+_install_lock = threading.Lock()
+_installed = False
+_log_lock = threading.Lock()
+
+
+class RunProfile:
+    """페이지 한 번 실행의 측정값"""
+
+    def __init__(self, page):
+        self.page = page
+        self.script_seconds = 0.0
+        self.chart_seconds = 0.0
+        self.chart_calls = 0
+        self.element_counts = Counter()
+        self.element_bytes = Counter()
+        self.session_state_bytes = 0
+
+    @property
+    def total_bytes(self):
+        return sum(self.element_bytes.values())
+
+    def to_dict(self):
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "page": self.page,
+            "script_seconds": round(self.script_seconds, 4),
+            "chart_seconds": round(self.chart_seconds, 4),
+            "chart_calls": self.chart_calls,
+            "elements": sum(self.element_counts.values()),
+            "bytes": self.total_bytes,
+            "bytes_by_type": dict(self.element_bytes.most_common()),
+            "session_state_bytes": self.session_state_bytes,
+        }
+
+
+class _PageStopped(BaseException):
+    """프로파일링 중인 페이지가 st.stop()을 호출했음을 run_profiled에 알립니다."""
+
+
+def _active():
+    return getattr(_local, "profile", None)
+
+
+def _deferred_stop(func):
+    @wraps(func)
+    def wrapper():
+        if _active() is None:
+            return func()
+        raise _PageStopped
+    return wrapper
+
+
+def _timed_chart(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = _active()
+        if profile is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.chart_seconds += time.perf_counter() - start
+            profile.chart_calls += 1
+    return wrapper
+
+
+def _counted_enqueue(func):
+    @wraps(func)
+    def wrapper(self, delta_type, element_proto, *args, **kwargs):
+        profile = _active()
+        if profile is not None:
+            profile.element_counts[delta_type] += 1
+            profile.element_bytes[delta_type] += element_proto.ByteSize()
+        return func(self, delta_type, element_proto, *args, **kwargs)
+    return wrapper
+
+
+def install():
+    """Streamlit 차트 함수와 요소 전송 함수를 한 번만 감쌉니다."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        DeltaGenerator._enqueue = _counted_enqueue(DeltaGenerator._enqueue)
+        for name in CHART_FUNCTIONS:
+            setattr(DeltaGenerator, name, _timed_chart(getattr(DeltaGenerator, name)))
+            # st.pyplot 등은 import 시점에 묶인 메서드이므로 따로 감쌈
+            setattr(st, name, _timed_chart(getattr(st, name)))
+        st.stop = _deferred_stop(st.stop)
+        _installed = True
+
+
+def session_state_size():
+    """세션 상태 값들의 크기(바이트)를 pickle 크기로 어림합니다. pickle할 수 없는 값은 sys.getsizeof를 씁니다."""
+    total = 0
+    for value in st.session_state.to_dict().values():
+        try:
+            total += len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            total += sys.getsizeof(value)
+    return total
+
+
+def append_log(profile, log_path=LOG_PATH):
+    """측정값을 JSON 한 줄로 로그 파일에 덧붙입니다. 기록에 실패해도 페이지는 계속 동작합니다."""
+    try:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with _log_lock, log_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(profile.to_dict(), ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+
+
+def render_panel(profile):
+    """사이드바에 이번 실행의 측정값과 이 세션의 최근 실행 기록을 보여 줍니다."""
+    history = st.session_state.setdefault("_profile_history", [])
+    history.append(profile.to_dict())
+    del history[:-HISTORY_LENGTH]
+
+    with st.sidebar.expander("⏱ 실행 프로파일", expanded=True):
+        col1, col2 = st.columns(2)
+        col1.metric("스크립트 실행", f"{profile.script_seconds * 1000:.0f} ms")
+        col2.metric(f"차트 렌더링 ({profile.chart_calls}회)", f"{profile.chart_seconds * 1000:.0f} ms")
+        col1.metric(f"전송량 ({sum(profile.element_counts.values())}개 요소)", f"{profile.total_bytes / 1024:.1f} KB")
+        col2.metric("세션 상태", f"{profile.session_state_bytes / 1024:.1f} KB")
+        if profile.element_bytes:
+            st.caption("요소 종류별 전송량 (KB)")
+            st.dataframe(
+                {t: round(b / 1024, 1) for t, b in profile.element_bytes.most_common(8)},
+                width="stretch",
+            )
+        st.caption("이 세션의 최근 실행")
+        st.dataframe(
+            [{"페이지": h["page"], "실행(ms)": round(h["script_seconds"] * 1000),
+              "차트(ms)": round(h["chart_seconds"] * 1000), "KB": round(h["bytes"] / 1024, 1)}
+             for h in reversed(history)],
+            hide_index=True, width="stretch",
+        )
+        st.caption(f"로그: {LOG_PATH}")
+
+
+def run_profiled(page, log_path=LOG_PATH):
+    """st.navigation이 고른 페이지를 실행하면서 측정하고, 끝나면(st.stop 포함) 결과를 기록·표시합니다."""
+    install()
+    profile = RunProfile(page.title)
+    _local.profile = profile
+    stopped = False
+    start = time.perf_counter()
+    try:
+        page.run()
+    except _PageStopped:
+        stopped = True
+    finally:
+        profile.script_seconds = time.perf_counter() - start
+        _local.profile = None
+        profile.session_state_bytes = session_state_size()
+        append_log(profile, log_path)
+        render_panel(profile)
+    if stopped:
+        st.stop()
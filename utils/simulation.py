@@ -0,0 +1,117 @@
+"""
+몬테카를로 시뮬레이션 페이지들이 함께 쓰는 난수 시드 설정과 결과 캐시입니다.
+
+시드를 고정하면 같은 설정의 실행 결과를 그대로 재현할 수 있고,
+(페이지, 함수, 설정값, 시드) 단위로 결과를 캐시하므로 여러 학생이
+같은 설정으로 실행해도 계산은 한 번만 이루어집니다.
+캐시에 있는지 계산 전에 알 수 있어야 진행 상태 바를 실제로 계산할 때만 움직일 수 있으므로,
+st.cache_data 대신 개수와 보관 시간을 제한한 작은 LRU 캐시(ResultCache)를 씁니다.
+"""
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import streamlit as st
+
+DEFAULT_SEED = 42
+CACHE_ENTRIES = 32     # 보관할 시뮬레이션 결과 수 (뷔퐁의 바늘 결과 하나가 수 MB)
+CACHE_TTL = 3600       # 결과를 보관할 최대 시간(초)
+
+
+def make_rng(seed=None):
+    """seed로 초기화한 NumPy 난수 생성기를 만듭니다. seed가 None이면 실행할 때마다 결과가 달라집니다."""
+    return np.random.default_rng(seed)
+
+
+def seed_control(key, container=None, default_seed=DEFAULT_SEED):
+    """
+    시드 고정 옵션을 화면에 그리고, 시드를 고정했으면 시드 값을, 아니면 None을 반환합니다.
+    container를 생략하면 사이드바에 그립니다.
+    """
+    container = st.sidebar if container is None else container
+    fixed = container.checkbox(
+        "난수 시드 고정 (같은 결과 재현)",
+        value=True,
+        key=f"{key}_seed_fixed",
+        help="시드를 고정하면 같은 설정에서 언제나 같은 결과가 나오고, 같은 설정의 결과는 저장해 두었다가 바로 보여줍니다. "
+             "해제하면 실행할 때마다 새로운 무작위 결과가 나옵니다."
+    )
+    if not fixed:
+        return None
+    seed = container.number_input(
+        "시드 값",
+        min_value=0,
+        max_value=2**32 - 1,
+        value=default_seed,
+        step=1,
+        key=f"{key}_seed"
+    )
+    return int(seed)
+
+
+class ResultCache:
+    """
+    시뮬레이션 결과를 개수(max_entries)와 보관 시간(ttl초) 제한 안에서 LRU 방식으로 보관합니다.
+    꺼낼 때는 복사본을 돌려주므로 한 세션이 결과 배열을 바꿔도 다른 세션에 영향이 없습니다.
+    여러 스레드에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, max_entries=CACHE_ENTRIES, ttl=CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()   # 키 → (저장 시각, 결과)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """(찾았는지 여부, 결과)를 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            value = entry[1]
+        return True, copy.deepcopy(value)
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+result_cache = ResultCache()
+
+
+def cached_run(page, func, seed=None, progress_callback=None, **params):
+    """
+    func(rng=..., **params)를 실행하고 결과를 반환합니다.
+
+    seed가 있으면 결과를 캐시에서 찾아 재사용하고, 없으면 매번 새로 계산합니다.
+    시행 횟수도 params에 들어 있으므로 캐시 키에 포함됩니다.
+    progress_callback은 실제로 계산할 때(시드가 없거나 캐시에 없을 때)만 func에 전달합니다.
+    """
+    if seed is not None:
+        key = (page, func.__name__, seed, json.dumps(params, sort_keys=True, default=repr))
+        found, result = result_cache.get(key)
+        if found:
+            return result
+    if progress_callback is not None:
+        params = {**params, "progress_callback": progress_callback}
+    result = func(rng=make_rng(seed), **params)
+    if seed is not None:
+        result_cache.put(key, result)
+    return result
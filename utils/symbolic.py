@@ -0,0 +1,198 @@
+"""
+SymPy 기호 계산(정적분, 극한, 특이점)을 별도 프로세스에서 실행하는 작은 작업자 풀입니다.
+
+학생이 입력한 식 하나 때문에 기호 계산이 몇 분씩 걸려도 Streamlit 스크립트 스레드가
+멈추지 않도록, 작업마다 제한 시간을 두고 시간을 넘기면 그 작업자 프로세스를 종료한 뒤
+새로 만듭니다. 작업자 프로세스의 메모리 사용량도 제한합니다(리눅스/맥).
+정적분은 제한 시간을 넘기거나 작업자가 실패하면 scipy.integrate.quad 수치 적분으로 대신 계산하며,
+결과는 (식, 구간) 단위로 캐시합니다.
+"""
+import multiprocessing
+import queue
+import threading
+from functools import lru_cache
+
+import numpy as np
+import sympy
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+X = sympy.Symbol('x')
+
+MAX_WORKERS = 2
+MEMORY_LIMIT_MB = 2048
+INTEGRATE_TIMEOUT = 5.0
+LIMIT_TIMEOUT = 5.0
+
+
+# --- 작업자 프로세스에서 실행되는 작업 (인자와 결과는 srepr 문자열) ---
+def _task_integrate(expr_src, a_src, b_src):
+    expr, a, b = sympy.sympify(expr_src), sympy.sympify(a_src), sympy.sympify(b_src)
+    return sympy.srepr(sympy.integrate(expr, (X, a, b)).evalf())
+
+
+def _task_limit(expr_src, point_src, direction):
+    expr, point = sympy.sympify(expr_src), sympy.sympify(point_src)
+    return sympy.srepr(sympy.limit(expr, X, point, dir=direction))
+
+
+def _task_singularities(expr_src):
+    expr = sympy.sympify(expr_src)
+    return [sympy.srepr(p) for p in sympy.singularities(expr, X)]
+
+
+_TASKS = {
+    "integrate": _task_integrate,
+    "limit": _task_limit,
+    "singularities": _task_singularities,
+}
+
+
+def _worker_main(conn, memory_limit_mb):
+    """작업자 프로세스: 파이프로 (작업 이름, 인자)를 받아 (성공 여부, 결과 또는 오류)를 돌려줍니다."""
+    if resource is not None and memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        name, args = message
+        try:
+            conn.send((True, _TASKS[name](*args)))
+        except BaseException as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+class SymbolicWorkerPool:
+    """제한 시간을 넘긴 작업자만 골라 종료하고 다시 만드는 프로세스 풀입니다. 여러 스레드에서 함께 사용할 수 있습니다."""
+
+    def __init__(self, max_workers=MAX_WORKERS, memory_limit_mb=MEMORY_LIMIT_MB):
+        self.max_workers = max_workers
+        self.memory_limit_mb = memory_limit_mb
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = 0
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_worker_main, args=(child_conn, self.memory_limit_mb), daemon=True)
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _acquire(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._started < self.max_workers:
+                self._started += 1
+                try:
+                    return self._spawn()
+                except Exception:
+                    self._started -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("기호 계산 작업자가 모두 사용 중입니다.") from None
+
+    def _discard(self, worker):
+        process, conn = worker
+        process.kill()
+        process.join()
+        conn.close()
+        with self._lock:
+            self._started -= 1
+
+    def run(self, name, *args, timeout):
+        """작업을 실행하고 결과를 반환합니다. 제한 시간을 넘기면 TimeoutError를 발생시킵니다."""
+        worker = self._acquire(timeout)
+        process, conn = worker
+        try:
+            conn.send((name, args))
+            finished = conn.poll(timeout)
+            if finished:
+                ok, value = conn.recv()
+        except (EOFError, OSError):
+            # 메모리 제한 등으로 작업자가 죽은 경우
+            self._discard(worker)
+            raise RuntimeError("기호 계산 작업자가 비정상 종료되었습니다.") from None
+        # TimeoutError는 OSError의 하위 클래스이므로 위 try 밖에서 발생시켜 작업자를 한 번만 정리함
+        if not finished:
+            self._discard(worker)
+            raise TimeoutError(f"기호 계산이 {timeout:g}초 안에 끝나지 않았습니다.")
+        self._idle.put(worker)
+        if not ok:
+            raise RuntimeError(value)
+        return value
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """프로세스 전체에서 함께 쓰는 작업자 풀을 반환합니다. 처음 호출할 때 만듭니다."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SymbolicWorkerPool()
+        return _pool
+
+
+# --- 페이지에서 사용하는 함수 ---
+@lru_cache(maxsize=256)
+def _definite_integral(expr_src, a_src, b_src, timeout):
+    try:
+        value = sympy.sympify(get_pool().run("integrate", expr_src, a_src, b_src, timeout=timeout))
+    except (TimeoutError, RuntimeError):
+        value = None
+    if value is not None:
+        # 발산하는 적분(oo, zoo, nan)은 그대로 inf/nan으로 돌려줍니다.
+        return (float(value) if value.is_extended_real else float('nan')), "symbolic"
+    # 기호 적분이 너무 오래 걸리면 수치 적분으로 계산
+    from scipy.integrate import quad
+    f = sympy.lambdify(X, sympy.sympify(expr_src), 'numpy')
+    with np.errstate(all='ignore'):
+        value, _ = quad(lambda t: float(f(np.float64(t))), float(sympy.sympify(a_src)),
+                        float(sympy.sympify(b_src)), limit=200)
+    return float(value), "numeric"
+
+
+def definite_integral(expr, a, b, timeout=INTEGRATE_TIMEOUT):
+    """
+    expr를 x에 대해 a부터 b까지 적분한 값과 계산 방식("symbolic" 또는 "numeric")을 반환합니다.
+    결과는 (식, 구간) 단위로 캐시합니다.
+    """
+    return _definite_integral(sympy.srepr(sympy.sympify(expr)), sympy.srepr(sympy.sympify(a)),
+                              sympy.srepr(sympy.sympify(b)), timeout)
+
+
+@lru_cache(maxsize=256)
+def _one_sided_limit(expr_src, point_src, direction, timeout):
+    return sympy.sympify(get_pool().run("limit", expr_src, point_src, direction, timeout=timeout))
+
+
+def one_sided_limit(expr, point, direction, timeout=LIMIT_TIMEOUT):
+    """x → point 방향 극한을 작업자 프로세스에서 계산합니다. 시간을 넘기면 TimeoutError를 발생시킵니다."""
+    return _one_sided_limit(sympy.srepr(expr), sympy.srepr(sympy.sympify(point)), direction, timeout)
+
+
+@lru_cache(maxsize=256)
+def _singularities(expr_src, timeout):
+    return tuple(sympy.sympify(p) for p in get_pool().run("singularities", expr_src, timeout=timeout))
+
+
+def singularities(expr, timeout=LIMIT_TIMEOUT):
+    """expr의 특이점 목록을 작업자 프로세스에서 계산합니다. 시간을 넘기면 TimeoutError를 발생시킵니다."""
+    return list(_singularities(sympy.srepr(expr), timeout))